@@ -42,6 +42,22 @@ hiddenimports = [
     'src.keyboard_hook_manager',
     'src.hud_notification', 
     'src.resource_manager',
+    'src.history_store',
+    'src.ui_event_bridge',
+    'src.log_sink',
+    'src.startup_profiler',
+    'src.capture_engine',
+    'src.prompt_templates',
+    'src.headless',
+    'src.local_api',
+    'src.folder_watcher',
+    'src.config_service',
+    'src.animation_clock',
+    'src.text_layout',
+    'src.hud_renderer',
+    'src.gesture_recognizer',
+    'src.notification_scheduler',
+    'src.hook_dispatcher',
     
     # Fallback keyboard (pynput)
     'pynput',
@@ -58,6 +74,12 @@ hiddenimports = [
     'src.universal_converter',
     'src.cloudconvert_handler',
     'src.audio_handler',
+    'src.audio_recorder',
+    'src.audio_decoder',
+    'src.vad',
+    'src.parallel_transcriber',
+    'src.silence_trimmer',
+    'src.stt_engine',
     
     # System
     'ctypes',
@@ -65,6 +87,7 @@ hiddenimports = [
     'queue',
     'subprocess',
     'threading',
+    'sqlite3',
     'requests',
     'sounddevice',
     'soundfile',
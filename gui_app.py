@@ -5,29 +5,46 @@ Cyber Liquid Glass UI - Neon Cyberpunk + Glassmorphism Design
 
 import os
 import io
-import json
 import shutil
 import subprocess
 import threading
 import sys
 import ctypes
-import queue
-import time
+
+# Startup profiling (--profile-startup) must hook imports before the heavy ones below
+from src.startup_profiler import StartupProfiler
+_startup_profiler = StartupProfiler.from_argv(sys.argv)
+if _startup_profiler:
+    _startup_profiler.install_import_hook()
+
 import tkinter as tk
 import customtkinter as ctk
 from datetime import datetime
 from PIL import ImageGrab, Image, ImageTk
-import google.generativeai as genai
 from tkinter import scrolledtext, messagebox, filedialog, simpledialog
-import pystray
-from pystray import MenuItem as item
-from src.audio_handler import AudioHandler
-from src.cloudconvert_handler import CloudConvertHandler
-from src.universal_converter import UniversalConverter
-from src.keyboard_hook_manager import KeyboardHookManager
-from src.hud_notification import HUDNotification
-from src.resource_manager import screenshot_context, SafeFileWriter
+from src.keyboard_hook_manager import KeyboardHookManager, parse_chord, DEFAULT_ACTIONS
+from src.hud_notification import HUDOverlay
+from src.animation_clock import AnimationClock
+from src.notification_scheduler import NotificationScheduler
+from src.gesture_recognizer import GestureRecognizer, PynputMouseSource
+from src.hook_dispatcher import HookDispatcher
+from src.resource_manager import screenshot_context, get_user_data_dir
+from src.history_store import HistoryStore
+from src.capture_engine import CaptureEngine, parse_action
+from src.config_service import ConfigService
+from src.local_api import LocalAPIServer
+from src.prompt_templates import get_template
+from src.ui_event_bridge import UIEventBridge
+from src.log_sink import TextboxLogSink
+from src.stt_engine import LocalStubEngine, format_timestamp
+
+if _startup_profiler:
+    _startup_profiler.mark("imports_done")
 
+# NOTE: Heavy SDK imports are LAZY to keep cold start fast:
+# - google.generativeai: when capture starts (see CaptureEngine)
+# - pystray: when minimizing to tray
+# - AudioHandler (sounddevice/azure), CloudConvert (requests): on first use
 # NOTE: pynput import is LAZY - only when needed as fallback
 PYNPUT_AVAILABLE = False
 pynput_keyboard = None
@@ -55,17 +72,18 @@ def is_admin():
 
 
 def run_as_admin():
-    """Restart with administrator privileges."""
+    """Restart with administrator privileges (command-line flags are forwarded)."""
     try:
+        args = subprocess.list2cmdline(sys.argv[1:])
         if sys.argv[0].endswith('.py'):
             ctypes.windll.shell32.ShellExecuteW(
                 None, "runas", sys.executable,
-                f'"{os.path.abspath(sys.argv[0])}"', None, 1
+                f'"{os.path.abspath(sys.argv[0])}" {args}', None, 1
             )
         else:
             ctypes.windll.shell32.ShellExecuteW(
                 None, "runas", sys.executable,
-                " ".join(sys.argv), None, 1
+                args, None, 1
             )
         return True
     except Exception as e:
@@ -288,6 +306,153 @@ class NeonLabel(ctk.CTkLabel):
         super().__init__(parent, **kwargs)
 
 
+class HistoryWindow(ctk.CTkToplevel):
+    """
+    Paginated history browser with full-text search
+    Pages are fetched on demand (keyset paging), so it opens instantly
+    regardless of how many records are stored
+    """
+    
+    PAGE_SIZE = 100
+    
+    def __init__(self, parent, history, on_show_hud, query=""):
+        super().__init__(parent)
+        self.history = history
+        self.on_show_hud = on_show_hud
+        self.query = query
+        self._records = []
+        self._page_cursors = [None]  # before_id for each visited page
+        self._has_next = False
+        
+        self.title("SnapCapAI - History")
+        self.geometry("900x560")
+        self.configure(fg_color=THEME.BG_VOID)
+        
+        # Search row
+        search_row = ctk.CTkFrame(self, fg_color="transparent")
+        search_row.pack(fill="x", padx=16, pady=(16, 8))
+        
+        self.search_entry = NeonEntry(search_row, placeholder_text="Search past answers...",
+                                      accent_color=THEME.NEON_CYAN)
+        self.search_entry.pack(side="left", fill="x", expand=True, padx=(0, 8))
+        self.search_entry.bind("<Return>", lambda e: self.set_query(self.search_entry.get()))
+        if query:
+            self.search_entry.insert(0, query)
+        
+        NeonButton(search_row, text="Search", width=80, neon_color=THEME.NEON_CYAN,
+                   command=lambda: self.set_query(self.search_entry.get())).pack(side="right")
+        
+        # Body: list (left) + detail (right)
+        body = ctk.CTkFrame(self, fg_color="transparent")
+        body.pack(fill="both", expand=True, padx=16)
+        
+        # Plain tk.Listbox - a single widget per page instead of one widget per row
+        self.listbox = tk.Listbox(body, bg=THEME.BG_INPUT, fg=THEME.TEXT_PRIMARY,
+                                  selectbackground=THEME.NEON_CYAN, selectforeground=THEME.BG_VOID,
+                                  highlightthickness=0, borderwidth=0, activestyle="none",
+                                  font=("Consolas", 10), width=48)
+        self.listbox.pack(side="left", fill="y", padx=(0, 12))
+        self.listbox.bind("<<ListboxSelect>>", self._on_select)
+        self.listbox.bind("<Double-Button-1>", lambda e: self._show_selected_in_hud())
+        
+        self.detail_text = NeonTextbox(body, accent_color=THEME.NEON_GREEN)
+        self.detail_text.pack(side="left", fill="both", expand=True)
+        
+        # Paging row
+        nav_row = ctk.CTkFrame(self, fg_color="transparent")
+        nav_row.pack(fill="x", padx=16, pady=(8, 16))
+        
+        self.prev_btn = NeonButton(nav_row, text="< Prev", width=80, variant="outline",
+                                   command=self.prev_page)
+        self.prev_btn.pack(side="left")
+        
+        self.page_label = NeonLabel(nav_row, text="", variant="caption")
+        self.page_label.pack(side="left", padx=12)
+        
+        self.next_btn = NeonButton(nav_row, text="Next >", width=80, variant="outline",
+                                   command=self.next_page)
+        self.next_btn.pack(side="left")
+        
+        NeonButton(nav_row, text="Show in HUD", neon_color=THEME.NEON_GREEN,
+                   command=self._show_selected_in_hud).pack(side="right")
+        
+        self._load_page()
+    
+    def set_query(self, query):
+        """Start a new search (empty query = browse all)"""
+        self.query = query.strip()
+        self._page_cursors = [None]
+        self._load_page()
+    
+    def next_page(self):
+        """Load the next (older) page"""
+        if self._has_next and self._records:
+            self._page_cursors.append(self._records[-1]['id'])
+            self._load_page()
+    
+    def prev_page(self):
+        """Load the previous (newer) page"""
+        if len(self._page_cursors) > 1:
+            self._page_cursors.pop()
+            self._load_page()
+    
+    def _load_page(self):
+        """Fetch one page (+1 row to detect whether more pages exist)"""
+        before_id = self._page_cursors[-1]
+        limit = self.PAGE_SIZE + 1
+        
+        if self.query:
+            records = self.history.search(self.query, limit=limit, before_id=before_id)
+        else:
+            records = self.history.recent(limit=limit, before_id=before_id)
+        
+        self._has_next = len(records) > self.PAGE_SIZE
+        self._records = records[:self.PAGE_SIZE]
+        
+        self.listbox.delete(0, "end")
+        for record in self._records:
+            timestamp = record['timestamp'][:16].replace("T", " ")
+            first_line = record['result'].strip().split("\n", 1)[0]
+            self.listbox.insert("end", f"{timestamp}  {first_line[:60]}")
+        
+        self.detail_text.delete("1.0", "end")
+        
+        page = len(self._page_cursors)
+        label = f"Page {page}"
+        if self.query:
+            label += f"  •  \"{self.query}\""
+        self.page_label.configure(text=label)
+        self.prev_btn.configure(state="normal" if page > 1 else "disabled")
+        self.next_btn.configure(state="normal" if self._has_next else "disabled")
+    
+    def _selected_record(self):
+        """Get the currently selected record (or None)"""
+        selection = self.listbox.curselection()
+        if not selection:
+            return None
+        return self._records[selection[0]]
+    
+    def _on_select(self, event=None):
+        """Show full result of the selected record"""
+        record = self._selected_record()
+        if not record:
+            return
+        
+        header = f"[{record['timestamp'][:19].replace('T', ' ')}] {record['model']}"
+        header += f"  •  {record['num_images']} image(s)"
+        if record['latency_ms'] is not None:
+            header += f"  •  {record['latency_ms']} ms"
+        
+        self.detail_text.delete("1.0", "end")
+        self.detail_text.insert("1.0", f"{header}\n\n{record['result']}")
+    
+    def _show_selected_in_hud(self):
+        """Re-show the selected result in the HUD (no model call)"""
+        record = self._selected_record()
+        if record:
+            self.on_show_hud(record)
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # MAIN APPLICATION
 # ══════════════════════════════════════════════════════════════════════════════
@@ -297,8 +462,12 @@ class ScreenCaptureGUI(ctk.CTk):
     SnapCapAI - Cyber Liquid Glass Edition
     """
     
-    def __init__(self):
-        super().__init__()
+    def __init__(self, profiler=None):
+        if profiler:
+            with profiler.section("ctk_root_init"):
+                super().__init__()
+        else:
+            super().__init__()
         
         # ═══════════ CONFIG DEFAULTS ═══════════
         self.api_key = ""
@@ -311,8 +480,28 @@ class ScreenCaptureGUI(ctk.CTk):
         self.window_height = 700
         self.notification_theme = "dark"
         self.notification_duration = 3
+        self.hud_fps = 30
+        self.hud_renderer = "widgets"
+        self.hud_next_page_key = "shift+printscreen"
+        self.gesture_show_result = "double:left"
+        self.gesture_hide_result = "double:right"
+        self.hud_prev_page_key = "ctrl+printscreen"
+        self.hotkey_actions = dict(DEFAULT_ACTIONS)
+        self.audio_max_record_s = 7200
+        self.audio_record_format = "wav"
+        self.stt_engine = "azure"
+        self.audio_live_transcription = True
+        self.stt_concurrency = 1  # Azure F0 allows 1 concurrent request - raise for S0
+        self.stt_parallel_min_s = 300
+        self.audio_remove_silence = True
+        self.audio_keep_silence_s = 0.3
+        self.requests_per_minute = 15
+        self.local_api_enabled = False
+        self.local_api_port = 8765
+        self.local_api_token = ""
         
         # Load config
+        self.config_service = ConfigService()
         self.load_config()
         
         # ═══════════ WINDOW SETUP ═══════════
@@ -323,54 +512,68 @@ class ScreenCaptureGUI(ctk.CTk):
         
         # ═══════════ STATE VARIABLES ═══════════
         self.is_running = False
-        self.is_processing = False
         self.is_recording = False
         self.keyboard_hook = None
         self.pynput_listener = None
+        # Hook and pynput key events -> one dispatcher thread, in order
+        self.hook_dispatcher = HookDispatcher()
         self.stealth_mode = False
-        self.history = []
         self.selected_convert_file = None
         
         # Temp folder
         self.temp_folder = os.path.join(os.path.dirname(__file__), "temp")
         os.makedirs(self.temp_folder, exist_ok=True)
         
+        # Persistent analysis history (SQLite, background writer)
+        self.history = HistoryStore(os.path.join(get_user_data_dir(), "history.db"))
+        
         # Handlers
         self.audio_handler = None
         self.cloudconvert_handler = None
         self.universal_converter = None
         
-        # Thread-safe queues
-        self._notification_queue = queue.Queue()
-        self._screenshot_batch = []
-        self._batch_timer = None
-        self._batch_lock = threading.Lock()
-        self.BATCH_DELAY_MS = 5000
-        self.MAX_BATCH_SIZE = 10
-        self._screenshot_request_queue = queue.Queue()
-        
-        # Double-click detection
-        self._pending_results = queue.Queue()
-        self._click_count = 0
-        self._right_click_count = 0
-        self.DOUBLE_CLICK_THRESHOLD = 0.5
-        self._left_button_was_pressed = False
-        self._right_button_was_pressed = False
-        
-        # Notification history
-        self._notification_history = []
-        self._current_notification = None
-        self._current_notification_data = None
-        self.MAX_NOTIFICATION_HISTORY = 10
+        # Worker thread → UI dispatch (replaces polling loops)
+        self._events = UIEventBridge(self)
+        self._events.register("hotkey", self._run_hotkey_action)
+        self._events.register("notification", lambda data: self.notifications.submit(**data))
+        self._events.register("hud_page", self._turn_hud_page)
+        self._events.register("gesture", self._on_gesture)
+        self._events.register("audio_partial", self._show_audio_partial)
+        self._events.register("log_flush", lambda sink: sink.flush())
+        self.LOG_MAX_LINES = 2000
+        self._log_sinks = {}
+        
+        # Capture → analyze pipeline (batching, Gemini calls, history)
+        self.engine = CaptureEngine(
+            history=self.history,
+            batch_delay_ms=5000,
+            max_batch_size=10,
+            on_log=self.log_output,
+            on_result=self._on_engine_result,
+            on_error=self._on_engine_error,
+            requests_per_minute=self.requests_per_minute
+        )
+        
+        # Localhost API for scripts (runs while capture is active)
+        self.local_api = None
+        
+        # Mouse gestures (button events from the mouse hook / pynput, recognized on the
+        # hook dispatcher thread while capturing - no polling)
+        self.gestures = GestureRecognizer(double_click_s=0.5)
+        self._mouse_source = None
+        self._bind_gestures()
+        
+        # Notifications: priority/coalescing scheduler in front of the HUD (keeps last 10 for replay)
+        self._hud = None  # Persistent overlay, created on first notification
+        self.animation_clock = AnimationClock(self, fps=self.hud_fps)
+        self.notifications = NotificationScheduler(self, show=self._do_show_notification, history_size=10)
         
         # ═══════════ BUILD UI ═══════════
+        if profiler:
+            # Times every _create_* builder, including lazily built tabs
+            profiler.instrument_methods(self, "_create_")
         self._create_ui()
         
-        # Start polling loops
-        self._poll_notifications()
-        self._poll_screenshot_requests()
-        self._poll_double_click()
-        
         # Window close protocol
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
     
@@ -644,6 +847,18 @@ class ScreenCaptureGUI(ctk.CTk):
         )
         self.notif_duration_selector.pack(fill="x", pady=(4, 0))
         self.notif_duration_selector.set(f"{self.notification_duration}s")
+        
+        # Animation frame rate (Off = no fades / countdown animation)
+        NeonLabel(section, text="Animation", variant="caption").pack(anchor="w")
+        self.notif_fps_selector = NeonComboBox(
+            section, values=list(self.HUD_FPS_OPTIONS),
+            command=self.on_notification_fps_changed,
+            accent_color=THEME.NEON_ORANGE
+        )
+        self.notif_fps_selector.pack(fill="x", pady=(4, 0))
+        self.notif_fps_selector.set(
+            next((label for label, fps in self.HUD_FPS_OPTIONS.items() if fps == self.hud_fps), "30 fps")
+        )
     
     def _create_content_area(self, parent):
         """Create the main content area with tabs"""
@@ -658,20 +873,32 @@ class ScreenCaptureGUI(ctk.CTk):
                                        segmented_button_unselected_color=THEME.BG_PANEL,
                                        segmented_button_unselected_hover_color=THEME.BG_INPUT,
                                        text_color=THEME.TEXT_PRIMARY,
-                                       text_color_disabled=THEME.TEXT_DIM)
+                                       text_color_disabled=THEME.TEXT_DIM,
+                                       command=self._on_tab_changed)
         self.tabview.pack(fill="both", expand=True, padx=16, pady=16)
         
-        # Tab 1: Image Analysis
+        # Tab 1: Image Analysis (built now - default tab)
         self.image_tab = self.tabview.add("Image Analysis")
         self._create_image_tab(self.image_tab)
         
-        # Tab 2: Audio Transcription
+        # Tab 2 & 3: Audio / Convert - content built on first visit
         self.audio_tab = self.tabview.add("Audio")
-        self._create_audio_tab(self.audio_tab)
-        
-        # Tab 3: File Conversion
         self.convert_tab = self.tabview.add("Convert")
-        self._create_convert_tab(self.convert_tab)
+        self._lazy_tabs = {
+            "Audio": (self.audio_tab, self._create_audio_tab),
+            "Convert": (self.convert_tab, self._create_convert_tab),
+        }
+    
+    def _on_tab_changed(self):
+        """Build lazily-constructed tab content on first visit"""
+        self._ensure_tab_built(self.tabview.get())
+    
+    def _ensure_tab_built(self, name):
+        """Build a lazy tab's content if it hasn't been built yet"""
+        lazy = self._lazy_tabs.pop(name, None)
+        if lazy:
+            tab, builder = lazy
+            builder(tab)
     
     def _create_image_tab(self, parent):
         """Create image analysis tab content"""
@@ -684,9 +911,21 @@ class ScreenCaptureGUI(ctk.CTk):
         NeonButton(header, text="Clear", width=80, neon_color=THEME.NEON_RED,
                    variant="outline", command=self.clear_output).pack(side="right")
         
+        NeonButton(header, text="History", width=80, neon_color=THEME.NEON_CYAN,
+                   variant="outline", command=self.open_history_window).pack(side="right", padx=(0, 8))
+        
+        # Full-text search over past answers
+        self.history_search_entry = NeonEntry(header, placeholder_text="Search history...",
+                                              accent_color=THEME.NEON_CYAN, width=220)
+        self.history_search_entry.pack(side="right", padx=(0, 8))
+        self.history_search_entry.bind(
+            "<Return>", lambda e: self.open_history_window(self.history_search_entry.get())
+        )
+        
         # Output textbox
         self.output_text = NeonTextbox(parent, accent_color=THEME.NEON_GREEN)
         self.output_text.pack(fill="both", expand=True)
+        self._create_log_sink("image", self.output_text)
     
     def _create_audio_tab(self, parent):
         """Create audio transcription tab content"""
@@ -706,9 +945,16 @@ class ScreenCaptureGUI(ctk.CTk):
         NeonButton(controls, text="Realtime", neon_color=THEME.NEON_PURPLE,
                    variant="ghost", command=self.transcribe_realtime).pack(side="left")
         
+        # Partial text of the utterance being recognized
+        self.audio_partial_label = ctk.CTkLabel(parent, text="", anchor="w", justify="left",
+                                                font=ctk.CTkFont(size=12, slant="italic"),
+                                                text_color=THEME.TEXT_DIM)
+        self.audio_partial_label.pack(fill="x", pady=(0, 6))
+        
         # Output
         self.audio_output_text = NeonTextbox(parent, accent_color=THEME.NEON_PURPLE)
         self.audio_output_text.pack(fill="both", expand=True)
+        self._create_log_sink("audio", self.audio_output_text)
     
     def _create_convert_tab(self, parent):
         """Create file conversion tab content"""
@@ -754,6 +1000,7 @@ class ScreenCaptureGUI(ctk.CTk):
         # Output log
         self.convert_output_text = NeonTextbox(parent, accent_color=THEME.NEON_ORANGE)
         self.convert_output_text.pack(fill="both", expand=True, pady=(12, 0))
+        self._create_log_sink("convert", self.convert_output_text)
     
     def _create_action_bar(self):
         """Create the bottom action bar"""
@@ -801,6 +1048,13 @@ class ScreenCaptureGUI(ctk.CTk):
         """Create a subtle separator line"""
         ctk.CTkFrame(parent, fg_color=THEME.GLASS_BORDER, height=1).pack(fill="x", pady=12)
     
+    def _create_log_sink(self, name, textbox):
+        """Attach a buffered, thread-safe log sink to a textbox"""
+        sink = TextboxLogSink(textbox, wake=lambda s: self._events.post("log_flush", s),
+                              max_lines=self.LOG_MAX_LINES)
+        self._log_sinks[name] = sink
+        return sink
+    
     # ══════════════════════════════════════════════════════════════════════════
     # BUSINESS LOGIC (Preserved from original)
     # ══════════════════════════════════════════════════════════════════════════
@@ -848,7 +1102,7 @@ class ScreenCaptureGUI(ctk.CTk):
         
         if self.is_running and self.api_key:
             try:
-                self.model = genai.GenerativeModel(self.gemini_model)
+                self.engine.set_model(self.gemini_model)
                 self.log_output(f"Model switched to: {choice}\n")
             except Exception as e:
                 self.log_output(f"Error switching model: {e}\n")
@@ -857,72 +1111,9 @@ class ScreenCaptureGUI(ctk.CTk):
     
     def on_prompt_changed(self, choice):
         """Handle prompt template change"""
-        templates = {
-            "Answer Questions": """You are an AI assistant specialized in answering questions from screenshots.
-
-TASK: Analyze the screenshot and answer any questions shown.
-
-RULES:
-1. Multiple choice: Answer with letter (A/B/C/D) + content (NO explanation)
-2. Short answer: Direct, concise answer
-3. Multiple questions: Number each answer
-4. Multiple images: Analyze in order
-
-OUTPUT FORMAT:
-- NO repeating the question
-- Maximum brevity
-- Use bullet points when appropriate""",
-            
-            "Code Analysis": """You are a code analysis expert.
-
-Analyze the code in the screenshot and provide:
-1. Language detection
-2. Purpose/functionality
-3. Issues/bugs found
-4. Optimization suggestions
-5. Security concerns if any
-
-Be concise and technical.""",
-            
-            "Translate to Vietnamese": """Translate all text in the image to Vietnamese.
-
-Rules:
-- Maintain original formatting
-- Technical terms: keep English in brackets
-- Natural, fluent translation
-- No explanations needed""",
-            
-            "Math Solver": """You are a math problem solver.
-
-Solve any math problems shown in the image:
-1. Show step-by-step solution
-2. Box the final answer
-3. Explain key formulas used
-4. For graphs: describe the solution visually""",
-            
-            "Text Extraction": """Extract all text from the image (OCR).
-
-Output:
-- Preserve original structure
-- Maintain formatting (headers, lists, etc.)
-- Include any visible numbers/dates
-- Note any unclear/unreadable parts""",
-            
-            "General Analysis": """Analyze this screenshot intelligently.
-
-Auto-detect content type and provide appropriate response:
-- Questions → Answer them
-- Code → Analyze and suggest improvements  
-- Text → Summarize or extract
-- Charts → Explain data insights
-- UI → Provide UX feedback
-
-Be concise and actionable."""
-        }
-        
         if choice != "Custom":
             self.prompt_text.delete("1.0", "end")
-            self.prompt_text.insert("1.0", templates.get(choice, ""))
+            self.prompt_text.insert("1.0", get_template(choice))
     
     def on_notification_theme_changed(self, selection):
         """Handle notification theme change"""
@@ -930,6 +1121,15 @@ Be concise and actionable."""
         self.save_config()
         self.log_output(f"Notification theme: {self.notification_theme}\n")
     
+    HUD_FPS_OPTIONS = {"Off": 0, "15 fps": 15, "30 fps": 30, "60 fps": 60}
+    
+    def on_notification_fps_changed(self, selection):
+        """Handle HUD animation frame rate change"""
+        self.hud_fps = self.HUD_FPS_OPTIONS.get(selection, 30)
+        self.animation_clock.set_fps(self.hud_fps)
+        self.save_config()
+        self.log_output(f"HUD animation: {selection}\n")
+    
     def on_notification_duration_changed(self, selection):
         """Handle notification duration change"""
         try:
@@ -962,8 +1162,7 @@ Be concise and actionable."""
             return
         
         try:
-            genai.configure(api_key=self.api_key)
-            self.model = genai.GenerativeModel(self.gemini_model)
+            self.engine.configure(self.api_key, self.gemini_model, prompt="")
             self.log_output(f"Connected to {self.gemini_model}\n")
         except Exception as e:
             messagebox.showerror("Error", f"Gemini API error:\n{str(e)}")
@@ -974,14 +1173,29 @@ Be concise and actionable."""
             messagebox.showerror("Error", "Please enter a prompt!")
             return
         
+        self.engine.set_prompt(self.current_prompt)
+        self.engine.start()
         self.is_running = True
         
         # Try stealth mode first
         try:
-            self.keyboard_hook = KeyboardHookManager(callback=self.on_prtsc_pressed)
+            self.hook_dispatcher.start()
+            hotkey_actions = self._hotkey_action_table()
+            self.keyboard_hook = KeyboardHookManager(
+                callback=self.on_hotkey,
+                hotkeys=self._hud_page_hotkeys(),
+                mouse_callback=self.gestures.feed,
+                dispatcher=self.hook_dispatcher,
+                actions=hotkey_actions
+            )
             self.keyboard_hook.start()
             self.stealth_mode = True
             self.log_output("Stealth Mode: ACTIVE\n")
+            self.log_output(f"HUD pages: {self.hud_next_page_key} / {self.hud_prev_page_key}\n")
+            for chord, action in hotkey_actions.items():
+                self.log_output(f"  {chord}: {action}\n")
+            if not self.keyboard_hook.mouse_hook_active:
+                self._start_mouse_fallback()
         except RuntimeError as e:
             self.keyboard_hook = None
             self.stealth_mode = False
@@ -991,6 +1205,7 @@ Be concise and actionable."""
                 self.log_output("Fallback Mode: Standard keyboard listener\n")
                 self.pynput_listener = pynput_keyboard.Listener(on_press=self._on_key_press_fallback)
                 self.pynput_listener.start()
+                self._start_mouse_fallback()
             else:
                 self.is_running = False
                 self.log_output(f"Error: {str(e)}\n")
@@ -1007,9 +1222,31 @@ Be concise and actionable."""
         self.status_dot.configure(fg_color=THEME.STATUS_ONLINE)
         self.status_label.configure(text="ACTIVE", text_color=THEME.STATUS_ONLINE)
         
+        if self.local_api_enabled:
+            self._start_local_api()
+        
         self.log_output("Ready! Press PrtSc to capture.\n")
         self.log_output("=" * 50 + "\n\n")
     
+    def _start_local_api(self):
+        """Serve the engine on 127.0.0.1 for local scripts"""
+        self.local_api = LocalAPIServer(
+            self.engine,
+            port=self.local_api_port,
+            token=self.local_api_token
+        )
+        try:
+            self.local_api.start()
+            self.log_output(f"Local API: {self.local_api.url}\n")
+        except RuntimeError as e:
+            self.local_api = None
+            self.log_output(f"{e}\n")
+    
+    def _stop_local_api(self):
+        if self.local_api:
+            self.local_api.stop()
+            self.local_api = None
+    
     def stop_listening(self):
         """Stop capture mode"""
         self.is_running = False
@@ -1022,28 +1259,22 @@ Be concise and actionable."""
             self.pynput_listener.stop()
             self.pynput_listener = None
         
+        self.hook_dispatcher.stop()
         self.stealth_mode = False
         
-        # Cancel batch timer
-        if self._batch_timer:
-            self.after_cancel(self._batch_timer)
-            self._batch_timer = None
+        self._stop_local_api()
+        
+        # Stop mouse gestures
+        if self._mouse_source:
+            self._mouse_source.stop()
+            self._mouse_source = None
+        self.gestures.reset()
         
-        # Clear batch
-        with self._batch_lock:
-            for img in self._screenshot_batch:
-                try:
-                    img.close()
-                except:
-                    pass
-            self._screenshot_batch.clear()
+        # Drop the unsent batch
+        self.engine.stop()
         
         # Clear pending results
-        while not self._pending_results.empty():
-            try:
-                self._pending_results.get_nowait()
-            except:
-                break
+        self.notifications.clear('result')
         
         # Update UI
         self.start_button.configure(
@@ -1058,330 +1289,217 @@ Be concise and actionable."""
         self.log_output("\nCapture stopped.\n")
         self.log_output("=" * 50 + "\n\n")
     
-    def on_prtsc_pressed(self):
-        """Callback when PrtSc is pressed"""
-        self._screenshot_request_queue.put("capture")
+    def _hud_page_hotkeys(self):
+        """Next/previous HUD page chords for the keyboard hook (invalid chords skipped)"""
+        hotkeys = {}
+        for chord, step in ((self.hud_next_page_key, 1), (self.hud_prev_page_key, -1)):
+            try:
+                parse_chord(chord)
+            except ValueError as e:
+                self.log_output(f"HUD page hotkey ignored: {e}\n")
+                continue
+            hotkeys[chord] = lambda event, step=step: self._events.post("hud_page", step)
+        return hotkeys
+    
+    def _hotkey_action_table(self):
+        """Configured chord -> action table for the keyboard hook (invalid entries skipped)"""
+        actions = {}
+        for chord, action in self.hotkey_actions.items():
+            try:
+                parse_chord(chord)
+                parse_action(action)
+            except ValueError as e:
+                self.log_output(f"Hotkey ignored: {e}\n")
+                continue
+            actions[chord] = action
+        return actions
+    
+    def on_hotkey(self, event):
+        """Callback when a bound chord (e.g. PrtSc) is pressed (dispatcher thread)"""
+        self._events.post("hotkey", event)
+    
+    def _run_hotkey_action(self, event):
+        """Run a hotkey action on the Tk thread (capture, flush, cancel, resend...)"""
+        try:
+            self.engine.run_action(event.action, trigger_time=event.time)
+        except ValueError as e:
+            self.log_output(f"{e}\n")
     
     def _on_key_press_fallback(self, key):
         """Fallback key handler"""
         try:
             if key == pynput_keyboard.Key.print_screen:
-                self._screenshot_request_queue.put("capture")
+                self.hook_dispatcher.post(self.on_hotkey, "capture", source="pynput")
         except AttributeError:
             pass
     
-    def _poll_screenshot_requests(self):
-        """Poll screenshot request queue"""
-        try:
-            while True:
-                try:
-                    request = self._screenshot_request_queue.get_nowait()
-                    if request == "capture":
-                        self._do_capture_screenshot()
-                except queue.Empty:
-                    break
-        except Exception as e:
-            print(f"[Screenshot Poll] Error: {e}")
-        finally:
-            self.after(50, self._poll_screenshot_requests)
-    
-    def _do_capture_screenshot(self):
-        """Capture screenshot and manage timer"""
-        with self._batch_lock:
-            if len(self._screenshot_batch) >= self.MAX_BATCH_SIZE:
-                self.log_output(f"Max batch size ({self.MAX_BATCH_SIZE}) reached.\n")
-                return
-            
+    def _on_engine_result(self, data):
+        """Engine callback (worker thread) - queue result for double-click LEFT"""
+        if data['source'] != "capture":
+            return  # Local API results go back to the caller, not the HUD
+        
+        # Full result - the HUD pages it (next/previous page hotkeys)
+        self._events.post("notification", {
+            'title': f"Analysis Complete ({data['num_images']} images)",
+            'message': f"[{data['timestamp']}] {data['model']}\n\n{data['result']}",
+            'notification_type': 'success',
+            'hold': True
+        })
+    
+    def _on_engine_error(self, error):
+        """Engine callback (worker thread) - show error in HUD"""
+        self._show_hud_notification(
+            title="Analysis Error",
+            message=str(error),
+            notification_type="error"
+        )
+    
+    def _bind_gestures(self):
+        """Bind the configured mouse gestures (handled on the Tk thread)"""
+        for gesture, action in ((self.gesture_show_result, "show_result"),
+                                (self.gesture_hide_result, "hide_result")):
             try:
-                screenshot = ImageGrab.grab()
-                self._screenshot_batch.append(screenshot)
-                count = len(self._screenshot_batch)
-                self.log_output(f"Captured #{count}/{self.MAX_BATCH_SIZE} (5s timer...)\n")
-            except Exception as e:
-                self.log_output(f"Capture error: {e}\n")
-                return
-            
-            if self._batch_timer:
-                self.after_cancel(self._batch_timer)
-                self._batch_timer = None
-            
-            self._batch_timer = self.after(self.BATCH_DELAY_MS, self._process_batch)
+                self.gestures.bind(gesture, lambda action=action: self._events.post("gesture", action))
+            except ValueError as e:
+                print(f"[Gestures] {e}")
     
-    def _process_batch(self):
-        """Process batch after timeout"""
-        with self._batch_lock:
-            if not self._screenshot_batch:
-                return
-            
-            screenshots = self._screenshot_batch.copy()
-            self._screenshot_batch.clear()
-            self._batch_timer = None
-        
-        threading.Thread(target=self._process_screenshots_batch, args=(screenshots,), daemon=True).start()
-    
-    def _process_screenshots_batch(self, screenshots: list):
-        """Process screenshots with Gemini"""
-        if self.is_processing:
-            self.log_output("Still processing previous batch...\n")
-            with self._batch_lock:
-                self._screenshot_batch = screenshots + self._screenshot_batch
-            return
-        
-        self.is_processing = True
-        num_images = len(screenshots)
-        
-        try:
-            self.log_output(f"\nSending {num_images} image(s) to {self.gemini_model}...\n")
-            
-            content = [self.current_prompt]
-            for i, img in enumerate(screenshots):
-                content.append(img)
-                self.log_output(f"  Image {i+1}/{num_images} ready\n")
-            
-            response = self.model.generate_content(content)
-            result = response.text
-            
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            self.log_output(f"\n[{timestamp}] Result ({num_images} images):\n")
-            self.log_output("-" * 50 + "\n")
-            self.log_output(f"{result}\n")
-            self.log_output("-" * 50 + "\n\n")
-            
-            self.history.append({
-                "timestamp": datetime.now().isoformat(),
-                "model": self.gemini_model,
-                "prompt": self.current_prompt,
-                "result": result,
-                "num_images": num_images
-            })
-            
-            preview = result[:200] + "..." if len(result) > 200 else result
-            self._pending_results.put({
-                'title': f"Analysis Complete ({num_images} images)",
-                'message': f"[{timestamp}] {self.gemini_model}\n\n{preview}",
-                'notification_type': 'success'
-            })
-            
-        except Exception as e:
-            self.log_output(f"Error: {str(e)}\n")
-            self._show_hud_notification(
-                title="Analysis Error",
-                message=str(e),
-                notification_type="error"
-            )
-        finally:
-            self.is_processing = False
-            for img in screenshots:
-                try:
-                    img.close()
-                except:
-                    pass
-    
-    def _poll_notifications(self):
-        """Poll notification queue"""
+    def _start_mouse_fallback(self):
+        """pynput button events when the low-level mouse hook is unavailable"""
         try:
-            while True:
-                try:
-                    notif_data = self._notification_queue.get_nowait()
-                    self._do_show_notification(notif_data)
-                except queue.Empty:
-                    break
-        except Exception as e:
-            print(f"[HUD] Poll error: {e}")
-        finally:
-            self.after(100, self._poll_notifications)
+            self._mouse_source = PynputMouseSource()
+            self._mouse_source.start(self._on_mouse_button_fallback)
+        except RuntimeError as e:
+            self._mouse_source = None
+            self.log_output(f"{e}\n")
     
-    def _poll_double_click(self):
-        """Poll for double-click detection"""
-        try:
-            if not self.is_running:
-                self._click_count = 0
-                self._right_click_count = 0
-                self._left_button_was_pressed = False
-                self._right_button_was_pressed = False
-                return
-            
-            current_time = time.time()
-            
-            # Left mouse button
-            left_pressed = bool(ctypes.windll.user32.GetAsyncKeyState(0x01) & 0x8000)
-            
-            if self._left_button_was_pressed and not left_pressed:
-                self._click_count += 1
-                
-                if self._click_count == 1:
-                    self._first_click_time = current_time
-                elif self._click_count >= 2:
-                    time_since_first = current_time - getattr(self, '_first_click_time', 0)
-                    if time_since_first <= self.DOUBLE_CLICK_THRESHOLD:
-                        self._on_double_click_left_detected()
-                    self._click_count = 0
-            
-            if self._click_count == 1:
-                time_since_first = current_time - getattr(self, '_first_click_time', 0)
-                if time_since_first > self.DOUBLE_CLICK_THRESHOLD:
-                    self._click_count = 0
-            
-            self._left_button_was_pressed = left_pressed
-            
-            # Right mouse button
-            right_pressed = bool(ctypes.windll.user32.GetAsyncKeyState(0x02) & 0x8000)
-            
-            if self._right_button_was_pressed and not right_pressed:
-                self._right_click_count += 1
-                
-                if self._right_click_count == 1:
-                    self._first_right_click_time = current_time
-                elif self._right_click_count >= 2:
-                    time_since_first = current_time - getattr(self, '_first_right_click_time', 0)
-                    if time_since_first <= self.DOUBLE_CLICK_THRESHOLD:
-                        self._on_double_click_right_detected()
-                    self._right_click_count = 0
-            
-            if self._right_click_count == 1:
-                time_since_first = current_time - getattr(self, '_first_right_click_time', 0)
-                if time_since_first > self.DOUBLE_CLICK_THRESHOLD:
-                    self._right_click_count = 0
-            
-            self._right_button_was_pressed = right_pressed
-            
-        except Exception as e:
-            print(f"[DoubleClick] Poll error: {e}")
-        finally:
-            self.after(30, self._poll_double_click)
+    def _on_mouse_button_fallback(self, button_event):
+        """pynput listener thread - recognize on the dispatcher thread, like the mouse hook"""
+        self.hook_dispatcher.post(lambda event: self.gestures.feed(button_event), "mouse", source="pynput")
     
-    def _on_double_click_left_detected(self):
-        """Handle double-click left - show pending results"""
-        print("[DoubleClick LEFT] Detected!")
-        
-        try:
-            result = self._pending_results.get_nowait()
-            self._show_hud_notification(
-                title=result['title'],
-                message=result['message'],
-                notification_type=result['notification_type']
-            )
-            return
-        except queue.Empty:
-            pass
+    def _on_gesture(self, action):
+        if action == "show_result":
+            self._on_show_result_gesture()
+        elif action == "hide_result":
+            self._on_hide_result_gesture()
+    
+    def _on_show_result_gesture(self):
+        """Show the pending result, else replay history (double-click LEFT by default)"""
+        print(f"[Gesture] {self.gesture_show_result}")
         
-        if self._notification_history:
-            last_notif = self._notification_history[-1]
-            self._show_hud_notification(
-                title=last_notif['title'],
-                message=last_notif['message'],
-                notification_type=last_notif['notification_type']
-            )
+        if not self.notifications.release():
+            self.notifications.replay()
     
-    def _on_double_click_right_detected(self):
-        """Handle double-click right - hide notification"""
-        print("[DoubleClick RIGHT] Detected!")
+    def _on_hide_result_gesture(self):
+        """Hide the notification (double-click RIGHT by default)"""
+        print(f"[Gesture] {self.gesture_hide_result}")
         
-        if self._current_notification:
+        if self._hud and self._hud.is_visible:
             try:
-                if self._current_notification_data:
-                    self._add_to_notification_history(self._current_notification_data)
-                
-                try:
-                    self._current_notification.destroy()
-                except:
-                    pass
-                self._current_notification = None
-                self._current_notification_data = None
+                self._hud.hide()  # Scheduler notified by _on_hud_hidden
             except Exception as e:
-                print(f"[DoubleClick RIGHT] Error: {e}")
-    
-    def _add_to_notification_history(self, data):
-        """Add notification to history"""
-        self._notification_history.append({
-            'title': data.get('title', ''),
-            'message': data.get('message', ''),
-            'notification_type': data.get('notification_type', 'info'),
-            'timestamp': datetime.now().isoformat()
-        })
-        if len(self._notification_history) > self.MAX_NOTIFICATION_HISTORY:
-            self._notification_history.pop(0)
+                print(f"[Gesture] Hide error: {e}")
+    
+    def _get_hud(self):
+        """Get the persistent HUD overlay (created once)"""
+        if self._hud is None:
+            self._hud = HUDOverlay(
+                parent=self,
+                width=600,
+                position="bottom-right",
+                click_through=True,
+                color_theme=getattr(self, 'notification_theme', 'dark'),
+                on_hidden=self._on_hud_hidden,
+                clock=self.animation_clock,
+                renderer=self.hud_renderer
+            )
+        return self._hud
+    
+    def _on_hud_hidden(self):
+        """HUD auto-dismissed or hidden - let the scheduler show the next one"""
+        self.notifications.on_hidden()
     
     def _do_show_notification(self, data):
-        """Show notification"""
+        """Show notification chosen by the scheduler (content swapped into the persistent overlay)"""
         try:
-            if self._current_notification:
-                try:
-                    if self._current_notification_data and self._current_notification_data != data:
-                        self._add_to_notification_history(self._current_notification_data)
-                    self._current_notification.destroy()
-                except:
-                    pass
-                finally:
-                    self._current_notification = None
-                    self._current_notification_data = None
-            
-            theme = getattr(self, 'notification_theme', 'dark')
-            duration = getattr(self, 'notification_duration', 3) * 1000
-            
-            notif = HUDNotification(
-                parent=self,
+            hud = self._get_hud()
+            hud.show(
                 title=data['title'],
                 message=data['message'],
                 notification_type=data['notification_type'],
-                duration_ms=duration,
-                width=600,
-                position="bottom-right",
-                click_through=True,
+                duration_ms=getattr(self, 'notification_duration', 3) * 1000,
                 fade_in=False,
-                color_theme=theme
+                color_theme=getattr(self, 'notification_theme', 'dark')
             )
-            
-            self._current_notification = notif
-            self._current_notification_data = data
-            
-            def on_notification_closed():
-                if self._current_notification == notif and self._current_notification_data:
-                    self._add_to_notification_history(self._current_notification_data)
-                    self._current_notification = None
-                    self._current_notification_data = None
-            
-            self.after(duration + 500, on_notification_closed)
-            
+        
         except Exception as e:
             print(f"[HUD] Error: {e}")
     
+    def _turn_hud_page(self, step):
+        """Next (+1) / previous (-1) page of the visible HUD result (Tk thread)"""
+        if self._hud is None:
+            return
+        if step > 0:
+            self._hud.next_page()
+        else:
+            self._hud.prev_page()
+    
     def _show_hud_notification(self, title, message, notification_type="info"):
-        """Queue a HUD notification"""
-        self._notification_queue.put({
+        """Queue a HUD notification (safe from any thread)"""
+        self._events.post("notification", {
             'title': title,
             'message': message,
             'notification_type': notification_type
         })
     
     def log_output(self, message):
-        """Log to output textbox"""
+        """Log to output textbox (safe from any thread, buffered)"""
         try:
             if hasattr(self, 'tabview'):
                 current_tab = self.tabview.get()
-                if current_tab == "Audio" and hasattr(self, 'audio_output_text'):
-                    self.audio_output_text.insert("end", message)
-                    self.audio_output_text.see("end")
+                if current_tab == "Audio" and "audio" in self._log_sinks:
+                    self._log_sinks["audio"].write(message)
                     return
         except:
             pass
         
-        if hasattr(self, 'output_text'):
-            self.output_text.insert("end", message)
-            self.output_text.see("end")
+        if "image" in self._log_sinks:
+            self._log_sinks["image"].write(message)
     
     def log_convert_output(self, message):
-        """Log to convert output textbox"""
-        if hasattr(self, 'convert_output_text'):
-            self.convert_output_text.insert("end", message)
-            self.convert_output_text.see("end")
+        """Log to convert output textbox (safe from any thread, buffered)"""
+        if "convert" in self._log_sinks:
+            self._log_sinks["convert"].write(message)
     
     def clear_output(self):
         """Clear output textbox"""
-        self.output_text.delete("1.0", "end")
+        self._log_sinks["image"].clear()
+    
+    def open_history_window(self, query=""):
+        """Open (or refresh) the history browser"""
+        window = getattr(self, '_history_window', None)
+        if window is not None and window.winfo_exists():
+            window.set_query(query)
+            window.lift()
+            return
+        
+        self._history_window = HistoryWindow(self, self.history, self._show_history_record, query)
+    
+    def _show_history_record(self, record):
+        """Re-show a stored result in the HUD without calling the model"""
+        timestamp = record['timestamp'][:19].replace("T", " ")
+        # Explicit user request: scheduled as a result, not low-priority info
+        self.notifications.submit(
+            title=f"History #{record['id']} ({record['num_images']} images)",
+            message=f"[{timestamp}] {record['model']}\n\n{record['result']}",
+            notification_type="info",
+            kind="result"
+        )
     
     def minimize_to_tray(self):
         """Minimize to system tray"""
+        import pystray
+        from pystray import MenuItem as item
+        
         self.withdraw()
         image = Image.new('RGB', (64, 64), color=THEME.NEON_CYAN)
         menu = (item('Show', self.show_window), item('Exit', self.quit_app))
@@ -1399,27 +1517,25 @@ Be concise and actionable."""
         if icon:
             icon.stop()
         self.stop_listening()
+        self.engine.close()
+        self.history.close()
+        self.config_service.close()
+        self._events.close()
+        print(f"[Events] {self._events.stats()}")
+        print(f"[Animation] {self.animation_clock.stats()}")
+        print(f"[Notifications] {self.notifications.stats()}")
+        print(f"[Gestures] {self.gestures.stats()}")
+        print(f"[HookDispatcher] {self.hook_dispatcher.stats()}")
+        print(f"[Capture latency] {self.engine.trigger_latency_stats()}")
         self.destroy()
     
     def on_closing(self):
         """Handle window close"""
         if messagebox.askokcancel("Quit", "Exit SnapCapAI?"):
-            try:
-                current_width = self.winfo_width()
-                current_height = self.winfo_height()
-                
-                config = {}
-                if os.path.exists("config.json"):
-                    with open("config.json", 'r', encoding='utf-8') as f:
-                        config = json.load(f)
-                
-                config['window_width'] = current_width
-                config['window_height'] = current_height
-                
-                with open("config.json", 'w', encoding='utf-8') as f:
-                    json.dump(config, f, indent=2, ensure_ascii=False)
-            except Exception as e:
-                print(f"Error saving config: {e}")
+            self.config_service.update({
+                'window_width': self.winfo_width(),
+                'window_height': self.winfo_height()
+            })
             
             if self.is_recording and hasattr(self, 'audio_handler'):
                 self.audio_handler.stop_recording()
@@ -1427,29 +1543,42 @@ Be concise and actionable."""
             self.quit_app()
     
     def load_config(self):
-        """Load configuration"""
-        config_file = "config.json"
-        if os.path.exists(config_file):
-            try:
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                    self.api_key = config.get('api_key', '')
-                    self.azure_api_key = config.get('azure_api_key', '')
-                    self.azure_region = config.get('azure_region', 'southeastasia')
-                    self.cloudconvert_api_key = config.get('cloudconvert_api_key', '')
-                    self.gemini_model = config.get('gemini_model', 'gemini-2.5-flash')
-                    self.current_prompt = config.get('prompt', '')
-                    self.window_width = config.get('window_width', 1400)
-                    self.window_height = config.get('window_height', 900)
-                    self.notification_theme = config.get('notification_theme', 'dark')
-                    self.notification_duration = config.get('notification_duration', 3)
-                print(f"Loaded config from {config_file}")
-            except Exception as e:
-                print(f"Error loading config: {e}")
+        """Load configuration (per-user config.json, cached in memory)"""
+        config = self.config_service.load()
+        self.api_key = config.get('api_key', '')
+        self.azure_api_key = config.get('azure_api_key', '')
+        self.azure_region = config.get('azure_region', 'southeastasia')
+        self.cloudconvert_api_key = config.get('cloudconvert_api_key', '')
+        self.gemini_model = config.get('gemini_model', 'gemini-2.5-flash')
+        self.current_prompt = config.get('prompt', '')
+        self.window_width = config.get('window_width', 1400)
+        self.window_height = config.get('window_height', 900)
+        self.notification_theme = config.get('notification_theme', 'dark')
+        self.notification_duration = config.get('notification_duration', 3)
+        self.hud_fps = config.get('hud_fps', 30)
+        self.hud_renderer = config.get('hud_renderer', 'widgets')
+        self.hud_next_page_key = config.get('hud_next_page_key', 'shift+printscreen')
+        self.hud_prev_page_key = config.get('hud_prev_page_key', 'ctrl+printscreen')
+        self.hotkey_actions = config.get('hotkey_actions', dict(DEFAULT_ACTIONS))
+        self.audio_max_record_s = config.get('audio_max_record_s', 7200)
+        self.audio_record_format = config.get('audio_record_format', 'wav')
+        self.stt_engine = config.get('stt_engine', 'azure')
+        self.audio_live_transcription = config.get('audio_live_transcription', True)
+        self.stt_concurrency = config.get('stt_concurrency', 1)
+        self.stt_parallel_min_s = config.get('stt_parallel_min_s', 300)
+        self.audio_remove_silence = config.get('audio_remove_silence', True)
+        self.audio_keep_silence_s = config.get('audio_keep_silence_s', 0.3)
+        self.gesture_show_result = config.get('gesture_show_result', 'double:left')
+        self.gesture_hide_result = config.get('gesture_hide_result', 'double:right')
+        self.requests_per_minute = config.get('requests_per_minute', 15)
+        self.local_api_enabled = config.get('local_api_enabled', False)
+        self.local_api_port = config.get('local_api_port', 8765)
+        self.local_api_token = config.get('local_api_token', '')
+        print(f"Loaded config from {self.config_service.path}")
     
     def save_config(self):
-        """Save configuration"""
-        config = {
+        """Save configuration (debounced - only changed keys are written)"""
+        self.config_service.update({
             'api_key': self.api_key,
             'azure_api_key': self.azure_api_key,
             'azure_region': self.azure_region,
@@ -1459,14 +1588,27 @@ Be concise and actionable."""
             'window_width': getattr(self, 'window_width', 1400),
             'window_height': getattr(self, 'window_height', 900),
             'notification_theme': getattr(self, 'notification_theme', 'dark'),
-            'notification_duration': getattr(self, 'notification_duration', 3)
-        }
-        try:
-            with SafeFileWriter("config.json") as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
-            print("Saved config")
-        except Exception as e:
-            print(f"Error saving config: {e}")
+            'notification_duration': getattr(self, 'notification_duration', 3),
+            'hud_fps': getattr(self, 'hud_fps', 30),
+            'hud_renderer': self.hud_renderer,
+            'hud_next_page_key': self.hud_next_page_key,
+            'hud_prev_page_key': self.hud_prev_page_key,
+            'hotkey_actions': self.hotkey_actions,
+            'audio_max_record_s': self.audio_max_record_s,
+            'audio_record_format': self.audio_record_format,
+            'stt_engine': self.stt_engine,
+            'audio_live_transcription': self.audio_live_transcription,
+            'stt_concurrency': self.stt_concurrency,
+            'stt_parallel_min_s': self.stt_parallel_min_s,
+            'audio_remove_silence': self.audio_remove_silence,
+            'audio_keep_silence_s': self.audio_keep_silence_s,
+            'gesture_show_result': self.gesture_show_result,
+            'gesture_hide_result': self.gesture_hide_result,
+            'requests_per_minute': self.requests_per_minute,
+            'local_api_enabled': self.local_api_enabled,
+            'local_api_port': self.local_api_port,
+            'local_api_token': self.local_api_token
+        })
     
     # ══════════════════════════════════════════════════════════════════════════
     # AUDIO & CONVERSION METHODS
@@ -1482,7 +1624,22 @@ Be concise and actionable."""
                 self.log_output("Azure API Key required!\n")
                 return False
             
-            self.audio_handler = AudioHandler(self.azure_api_key, self.azure_region, self.temp_folder)
+            from src.audio_handler import AudioHandler
+            stt_engine = None
+            if self.stt_engine == "stub":
+                stt_engine = LocalStubEngine(delay_s=0.2)
+            self.audio_handler = AudioHandler(
+                self.azure_api_key, self.azure_region, self.temp_folder,
+                stt_engine=stt_engine,
+                stt_concurrency=self.stt_concurrency,
+                parallel_min_s=self.stt_parallel_min_s,
+                remove_silence=self.audio_remove_silence,
+                keep_silence_s=self.audio_keep_silence_s,
+                max_record_s=self.audio_max_record_s or None,
+                record_format=self.audio_record_format,
+                on_record_limit=lambda: self.log_output(
+                    f"Max recording length ({self.audio_max_record_s / 60:g} min) reached - press Stop\n")
+            )
             is_valid, msg = self.audio_handler.validate_azure_credentials()
             self.log_output(f"{msg}\n")
             return is_valid
@@ -1500,8 +1657,14 @@ Be concise and actionable."""
             return
         
         self.is_recording = True
-        success, msg = self.audio_handler.start_recording()
+        success, msg = self.audio_handler.start_recording(
+            live_transcription=self.audio_live_transcription,
+            on_partial=lambda text: self._events.post("audio_partial", text),
+            on_segment=self._on_audio_segment
+        )
         self.log_output(f"{msg}\n")
+        if not success:
+            self.is_recording = False
     
     def stop_recording(self):
         """Stop audio recording"""
@@ -1513,7 +1676,10 @@ Be concise and actionable."""
         success, msg, file_path = self.audio_handler.stop_recording()
         self.log_output(f"{msg}\n")
         
-        if success and file_path:
+        if self.audio_handler.live_session is not None:
+            # Recognized while recording - only the last utterance is left
+            threading.Thread(target=self._finish_live_transcription_thread, daemon=True).start()
+        elif success and file_path:
             threading.Thread(target=self._transcribe_file_thread, args=(file_path,), daemon=True).start()
     
     def upload_audio_file(self):
@@ -1523,7 +1689,7 @@ Be concise and actionable."""
         
         file_path = filedialog.askopenfilename(
             title="Select audio file",
-            filetypes=[("Audio files", "*.wav *.mp3 *.m4a *.flac"), ("All files", "*.*")]
+            filetypes=[("Audio files", "*.wav *.mp3 *.m4a *.flac *.ogg *.opus *.aac"), ("All files", "*.*")]
         )
         
         if not file_path:
@@ -1532,23 +1698,54 @@ Be concise and actionable."""
         self.log_output(f"Selected: {file_path}\n")
         threading.Thread(target=self._transcribe_file_thread, args=(file_path,), daemon=True).start()
     
+    def _show_audio_partial(self, text):
+        """Show the hypothesis of the utterance being recognized (Tk thread)"""
+        if hasattr(self, 'audio_partial_label'):
+            self.audio_partial_label.configure(text=text[-160:])
+    
+    def _on_audio_segment(self, segment):
+        """A finished utterance (recognizer thread) - stream it to the Audio tab"""
+        self.log_output(f"[{format_timestamp(segment.offset_s)}] {segment.text}\n")
+        self._events.post("audio_partial", "")
+    
     def _transcribe_file_thread(self, file_path):
-        """Transcribe audio file"""
+        """Transcribe audio file (segments stream in while recognizing)"""
         try:
             self.log_output("Transcribing...\n")
-            success, result = self.audio_handler.transcribe_audio_file(file_path)
-            
-            if success:
-                timestamp = datetime.now().strftime("%H:%M:%S")
-                self.log_output(f"\n[{timestamp}] Transcription:\n")
-                self.log_output("-" * 50 + "\n")
-                self.log_output(f"{result}\n")
-                self.log_output("-" * 50 + "\n\n")
-            else:
-                self.log_output(f"{result}\n")
+            success, result = self.audio_handler.transcribe_audio_file(
+                file_path,
+                on_partial=lambda text: self._events.post("audio_partial", text),
+                on_segment=self._on_audio_segment
+            )
+            self._events.post("audio_partial", "")
+            if self.audio_handler.last_trim is not None:
+                self.log_output(f"Silence: {self.audio_handler.last_trim.report()}\n")
+            self._log_transcription(success, result)
+        except Exception as e:
+            self.log_output(f"Error: {e}\n")
+    
+    def _finish_live_transcription_thread(self):
+        """Wait for the live recognizer to finish the last utterance"""
+        try:
+            success, result = self.audio_handler.finish_live_transcription()
+            self._events.post("audio_partial", "")
+            if self.audio_handler.last_trim is not None:
+                self.log_output(f"Silence: {self.audio_handler.last_trim.report()}\n")
+            self._log_transcription(success, result)
         except Exception as e:
             self.log_output(f"Error: {e}\n")
     
+    def _log_transcription(self, success, result):
+        """Print the full transcription (or the error) to the Audio tab"""
+        if success:
+            timestamp = datetime.now().strftime("%H:%M:%S")
+            self.log_output(f"\n[{timestamp}] Transcription:\n")
+            self.log_output("-" * 50 + "\n")
+            self.log_output(f"{result}\n")
+            self.log_output("-" * 50 + "\n\n")
+        else:
+            self.log_output(f"{result}\n")
+    
     def transcribe_realtime(self):
         """Real-time transcription"""
         if not self._init_audio_handler():
@@ -1568,6 +1765,7 @@ Be concise and actionable."""
                 self.log_convert_output("CloudConvert API Key required!\n")
                 return False
             
+            from src.cloudconvert_handler import CloudConvertHandler
             self.cloudconvert_handler = CloudConvertHandler(api_key)
             is_valid, msg = self.cloudconvert_handler.validate_credentials()
             self.log_convert_output(f"{msg}\n")
@@ -1579,6 +1777,7 @@ Be concise and actionable."""
     def update_format_options(self, selected_category=None):
         """Update format options based on category"""
         if not hasattr(self, 'universal_converter') or self.universal_converter is None:
+            from src.universal_converter import UniversalConverter
             self.universal_converter = UniversalConverter("")
         
         category = selected_category or self.category_selector.get()
@@ -1651,7 +1850,7 @@ Be concise and actionable."""
                 self.log_convert_output("-" * 50 + "\n\n")
             else:
                 self.log_convert_output(f"Error: {result}\n")
-                
+        
         except Exception as e:
             self.log_convert_output(f"Conversion error: {e}\n")
 
@@ -1675,7 +1874,13 @@ def main():
         print("Running with Administrator privileges")
         print("Stealth Mode available")
     
-    app = ScreenCaptureGUI()
+    app = ScreenCaptureGUI(profiler=_startup_profiler)
+    
+    if _startup_profiler:
+        # --profile-startup: write the JSON report once the window is idle
+        _startup_profiler.mark("window_created")
+        app.after_idle(_startup_profiler.finish)
+    
     app.mainloop()
 
 
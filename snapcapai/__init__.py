@@ -0,0 +1,4 @@
+"""
+SnapCapAI launcher package
+Enables `python -m snapcapai` (GUI) and `python -m snapcapai --headless`.
+"""
@@ -0,0 +1,24 @@
+"""
+SnapCapAI entry point
+
+    python -m snapcapai                 # GUI
+    python -m snapcapai --headless ...  # Capture engine only (no customtkinter)
+"""
+
+import sys
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    
+    if "--headless" in argv:
+        # Import only the engine side - no Tk / customtkinter overhead
+        from src.headless import main as headless_main
+        return headless_main([arg for arg in argv if arg != "--headless"])
+    
+    import gui_app
+    return gui_app.main()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,11 +8,33 @@ __author__ = "QuangNew"
 
 # Core modules for SnapCapAI application
 __all__ = [
+    "animation_clock",
+    "audio_decoder",
     "audio_handler",
+    "audio_recorder",
+    "capture_engine",
     "cloudconvert_handler",
+    "config_service",
+    "folder_watcher",
+    "gesture_recognizer",
+    "headless",
+    "history_store",
+    "hook_dispatcher",
     "hud_notification",
+    "hud_renderer",
     "keyboard_hook_manager",
+    "local_api",
+    "log_sink",
+    "notification_scheduler",
+    "parallel_transcriber",
+    "prompt_templates",
     "resource_manager",
+    "silence_trimmer",
+    "startup_profiler",
+    "stt_engine",
+    "text_layout",
     "universal_converter",
+    "vad",
+    "ui_event_bridge",
     "convert_ui_compact",
 ]
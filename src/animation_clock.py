@@ -0,0 +1,190 @@
+"""
+Animation Clock - One Frame Timer for All Overlay Effects
+==========================================================
+
+AnimationClock:
+- ONE ``after()`` chain drives every active animation
+- Configurable frame rate; ``fps=0`` disables animation (effects jump to
+  their final state immediately)
+- The chain stops as soon as nothing is animating (zero idle wakeups)
+- Counts frames rendered (ticks) and animation updates
+"""
+
+import time
+import itertools
+from typing import Callable, Dict, Optional
+
+
+class Animation:
+    """A running animation - progress 0.0 → 1.0 over ``duration_ms``."""
+    
+    __slots__ = ("id", "duration_s", "on_frame", "on_done", "start", "last_value")
+    
+    def __init__(self, anim_id: int, duration_ms: int, on_frame, on_done, start: float):
+        self.id = anim_id
+        self.duration_s = max(0.001, duration_ms / 1000.0)
+        self.on_frame = on_frame
+        self.on_done = on_done
+        self.start = start
+        self.last_value = None
+
+
+class AnimationClock:
+    """
+    Shared frame clock for Tk overlay animations.
+    
+    Usage:
+        clock = AnimationClock(root, fps=30)
+        anim_id = clock.animate(
+            200,
+            on_frame=lambda p: window.attributes('-alpha', 0.9 * p),
+            on_done=lambda: print("faded in")
+        )
+        clock.cancel(anim_id)
+    """
+    
+    def __init__(self, root, fps: int = 30):
+        """
+        Initialize animation clock.
+        
+        Args:
+            root: Tk widget whose ``after()`` drives the clock
+            fps: Frames per second (0 = no animation)
+        """
+        self._root = root
+        self._animations: Dict[int, Animation] = {}
+        self._ids = itertools.count(1)
+        self._job = None
+        self.fps = 0
+        self.set_fps(fps)
+        
+        # Stats
+        self.frames_rendered = 0
+        self.updates = 0
+        self.skipped_updates = 0
+    
+    def set_fps(self, fps: int):
+        """Change the frame rate (0 = no animation: finish running effects now)."""
+        self.fps = max(0, int(fps))
+        if self.fps == 0:
+            self.finish_all()
+    
+    @property
+    def enabled(self) -> bool:
+        return self.fps > 0
+    
+    @property
+    def is_running(self) -> bool:
+        return self._job is not None
+    
+    # ==================== ANIMATIONS ====================
+    
+    def animate(
+        self,
+        duration_ms: int,
+        on_frame: Callable[[float], Optional[object]],
+        on_done: Optional[Callable[[], None]] = None
+    ) -> int:
+        """
+        Start an animation.
+        
+        Args:
+            duration_ms: Animation length
+            on_frame: Called with progress (0.0 - 1.0) on each frame. May
+                      return a value; if it equals the previous frame's
+                      value the frame counts as skipped (no visual change)
+            on_done: Called once after the final frame
+        
+        Returns:
+            int: Animation id (for ``cancel``)
+        """
+        anim_id = next(self._ids)
+        
+        if not self.enabled:
+            # No animation: jump straight to the end state
+            self._call_frame(Animation(anim_id, duration_ms, on_frame, on_done, 0.0), 1.0)
+            if on_done:
+                on_done()
+            return anim_id
+        
+        self._animations[anim_id] = Animation(
+            anim_id, duration_ms, on_frame, on_done, time.perf_counter()
+        )
+        self._ensure_running()
+        return anim_id
+    
+    def cancel(self, anim_id: Optional[int]):
+        """Stop an animation without calling ``on_done``."""
+        if anim_id is not None:
+            self._animations.pop(anim_id, None)
+        if not self._animations:
+            self._stop()
+    
+    def finish_all(self):
+        """Jump every running animation to its end state."""
+        animations = list(self._animations.values())
+        self._animations.clear()
+        self._stop()
+        for animation in animations:
+            self._call_frame(animation, 1.0)
+            if animation.on_done:
+                animation.on_done()
+    
+    # ==================== FRAME LOOP ====================
+    
+    def _ensure_running(self):
+        if self._job is None:
+            self._job = self._root.after(self._frame_interval_ms(), self._tick)
+    
+    def _stop(self):
+        if self._job is not None:
+            try:
+                self._root.after_cancel(self._job)
+            except Exception:
+                pass
+            self._job = None
+    
+    def _frame_interval_ms(self) -> int:
+        return max(1, int(round(1000 / self.fps))) if self.fps else 1
+    
+    def _call_frame(self, animation: Animation, progress: float):
+        try:
+            value = animation.on_frame(progress)
+        except Exception as e:
+            print(f"[AnimationClock] Frame error: {e}")
+            return
+        
+        if value is not None and value == animation.last_value:
+            self.skipped_updates += 1
+        else:
+            animation.last_value = value
+            self.updates += 1
+    
+    def _tick(self):
+        """One frame: advance every animation, then reschedule if any remain."""
+        self._job = None
+        self.frames_rendered += 1
+        now = time.perf_counter()
+        
+        finished = []
+        for animation in list(self._animations.values()):
+            progress = min(1.0, (now - animation.start) / animation.duration_s)
+            self._call_frame(animation, progress)
+            if progress >= 1.0:
+                finished.append(animation)
+        
+        for animation in finished:
+            if self._animations.pop(animation.id, None) is not None and animation.on_done:
+                animation.on_done()
+        
+        if self._animations and self.enabled:
+            self._ensure_running()
+    
+    def stats(self) -> dict:
+        return {
+            'fps': self.fps,
+            'frames_rendered': self.frames_rendered,
+            'updates': self.updates,
+            'skipped_updates': self.skipped_updates,
+            'active': len(self._animations),
+        }
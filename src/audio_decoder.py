@@ -0,0 +1,311 @@
+"""
+Streaming Audio Decoder - Compressed Files Straight Into the Recognizer
+=======================================================================
+
+``recognize_decoded`` decodes any audio file locally (Azure's
+``AudioConfig(filename=...)`` only reads WAV/PCM) and pushes it into a
+``StreamSession`` (see ``STTEngine.recognize_stream``):
+- libsndfile (``soundfile``) decodes MP3/FLAC/OGG/Opus/AIFF/... block by
+  block; anything it can't open goes through an ``ffmpeg`` pipe if ffmpeg
+  is on PATH (M4A/AAC/WMA/video)
+- Each block is downmixed to mono and resampled to 16 kHz with vectorized
+  linear interpolation (``Resampler`` carries state across blocks, so there
+  are no seams), then converted to 16-bit PCM
+- Memory is one block (``block_s`` seconds), whatever the file length
+- A feeder thread does the decoding; recognition runs while it decodes
+- With ``keep_silence_s`` silence is cut on the way in (``SilenceGate``)
+
+Requires: pip install numpy soundfile (ffmpeg optional)
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import wave
+from typing import Callable, Iterator, Optional, Tuple
+
+from src.audio_recorder import _import_numpy, float_to_pcm16, pcm16_to_float
+
+
+TARGET_RATE = 16000
+DIRECT_RATES = (16000, 8000)  # WAV rates the recognizer takes as-is (others are resampled)
+
+
+def needs_decoding(path: str) -> bool:
+    """False for 16/8 kHz 16-bit mono PCM WAV (the recognizer reads it directly)."""
+    try:
+        with wave.open(path, "rb") as wav:
+            return not (wav.getsampwidth() == 2 and wav.getnchannels() == 1
+                        and wav.getframerate() in DIRECT_RATES)
+    except (wave.Error, EOFError):
+        return True
+
+
+class Resampler:
+    """
+    Streaming mono resampler (linear interpolation, ``np.interp``).
+    
+    ``process`` may be called with blocks of any size; output positions
+    continue across blocks, so the result equals resampling the whole
+    signal at once. Good enough for speech recognition - not for music.
+    """
+    
+    def __init__(self, src_rate: int, dst_rate: int = TARGET_RATE):
+        self.src_rate = src_rate
+        self.dst_rate = dst_rate
+        self.step = src_rate / dst_rate
+        self._tail = None   # Last input sample of the previous block
+        self._pos = 0.0     # Next output position, in input samples (0 = _tail)
+    
+    def process(self, mono):
+        """float32 mono samples in -> float32 samples at ``dst_rate`` out."""
+        np = _import_numpy()
+        if self.src_rate == self.dst_rate:
+            return mono
+        if self._tail is not None:
+            mono = np.concatenate(([self._tail], mono))
+        last = len(mono) - 1
+        if last < 1:
+            if len(mono):
+                self._tail = mono[-1]
+            return np.zeros(0, dtype="float32")
+        
+        count = max(int(np.ceil((last - self._pos) / self.step)), 0)
+        positions = self._pos + self.step * np.arange(count)
+        out = np.interp(positions, np.arange(len(mono)), mono).astype("float32")
+        self._pos += count * self.step - last
+        self._tail = mono[-1]
+        return out
+
+
+def _to_mono(block):
+    """(frames, channels) -> (frames,) average of the channels."""
+    if block.ndim == 1:
+        return block
+    if block.shape[1] == 1:
+        return block[:, 0]
+    return block.mean(axis=1, dtype="float32")
+
+
+def _soundfile_blocks(path: str, sample_rate: int, block_s: float) -> Iterator[bytes]:
+    try:
+        import soundfile as sf
+    except ImportError:
+        raise RuntimeError("Decoding audio requires soundfile: pip install soundfile")
+    
+    with sf.SoundFile(path) as source:
+        resampler = Resampler(source.samplerate, sample_rate)
+        blocksize = max(int(block_s * source.samplerate), 1)
+        for block in source.blocks(blocksize=blocksize, dtype="float32", always_2d=True):
+            pcm = float_to_pcm16(resampler.process(_to_mono(block)))
+            if pcm:
+                yield pcm
+
+
+def _ffmpeg_blocks(path: str, sample_rate: int, block_s: float) -> Iterator[bytes]:
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise RuntimeError(f"Can't decode {os.path.basename(path)}: install ffmpeg or convert it to WAV")
+    
+    # ffmpeg does the downmix + resample; we only read fixed-size chunks
+    process = subprocess.Popen(
+        [ffmpeg, "-nostdin", "-v", "error", "-i", path,
+         "-f", "s16le", "-acodec", "pcm_s16le", "-ac", "1", "-ar", str(sample_rate), "-"],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0)
+    )
+    chunk_bytes = max(int(block_s * sample_rate), 1) * 2
+    try:
+        while True:
+            chunk = process.stdout.read(chunk_bytes)
+            if not chunk:
+                break
+            yield chunk
+        if process.wait() != 0:
+            error = process.stderr.read().decode(errors="replace").strip()
+            raise RuntimeError(f"ffmpeg failed: {error.splitlines()[-1] if error else process.returncode}")
+    finally:
+        if process.poll() is None:
+            process.kill()
+        process.stdout.close()
+        process.stderr.close()
+
+
+def decode_pcm16(path: str, sample_rate: int = TARGET_RATE, block_s: float = 1.0) -> Iterator[bytes]:
+    """
+    Yield the file as 16-bit mono PCM at ``sample_rate``, ~``block_s`` at a time.
+    
+    Raises:
+        RuntimeError: Missing dependency, or a format neither libsndfile nor ffmpeg can read
+    """
+    blocks = _soundfile_blocks(path, sample_rate, block_s)
+    try:
+        first = next(blocks, None)  # Opens the file
+    except RuntimeError:  # LibsndfileError, or soundfile missing
+        # e.g. M4A - libsndfile doesn't read it
+        yield from _ffmpeg_blocks(path, sample_rate, block_s)
+        return
+    if first is not None:
+        yield first
+    yield from blocks
+
+
+def decode_to_wav(
+    path: str,
+    folder: Optional[str] = None,
+    on_samples: Optional[Callable] = None,
+    block_s: float = 1.0
+) -> Tuple[str, bool]:
+    """
+    Make a 16 kHz mono 16-bit WAV of ``path`` (constant memory).
+    
+    A file that already is one is used as-is. ``on_samples`` gets every
+    block as float32 samples in [-1, 1] on the way (e.g. ``EnergyVAD.feed``).
+    
+    Returns:
+        (wav_path, is_temporary) - delete the WAV when ``is_temporary``
+    """
+    try:
+        with wave.open(path, "rb") as wav:
+            if (wav.getsampwidth(), wav.getnchannels(), wav.getframerate()) == (2, 1, TARGET_RATE):
+                if on_samples is not None:
+                    block = int(block_s * TARGET_RATE)
+                    while True:
+                        pcm = wav.readframes(block)
+                        if not pcm:
+                            break
+                        on_samples(pcm16_to_float(pcm))
+                return path, False
+    except (wave.Error, EOFError):
+        pass
+    
+    handle, decoded = tempfile.mkstemp(suffix=".wav", prefix="decoded_", dir=folder)
+    os.close(handle)
+    try:
+        with wave.open(decoded, "wb") as out:
+            out.setnchannels(1)
+            out.setsampwidth(2)
+            out.setframerate(TARGET_RATE)
+            for pcm in decode_pcm16(path, TARGET_RATE, block_s):
+                out.writeframes(pcm)
+                if on_samples is not None:
+                    on_samples(pcm16_to_float(pcm))
+    except Exception:
+        os.remove(decoded)
+        raise
+    return decoded, True
+
+
+def recognize_decoded(
+    engine,
+    path: str,
+    language: str = "vi-VN",
+    on_partial: Optional[Callable[[str], None]] = None,
+    on_segment: Optional[Callable] = None,
+    block_s: float = 1.0,
+    keep_silence_s: Optional[float] = None
+):
+    """
+    Decode ``path`` on a feeder thread into ``engine.recognize_stream``.
+    
+    Returns the StreamSession at once; ``session.wait()`` gives the
+    Transcript. A decode error ends the session with ``error`` set
+    (segments recognized so far are kept).
+    
+    With ``keep_silence_s`` the decoded blocks go through a ``SilenceGate``
+    on their way in (pauses shortened to about that, nothing written to
+    disk): ``on_segment`` gets offsets of the original audio, and
+    ``session.gate.timestamps`` maps the transcript's segments the same way.
+    
+    Raises:
+        RuntimeError: Engine unavailable, or file not found
+    """
+    if not os.path.exists(path):
+        raise RuntimeError(f"File not found: {path}")
+    gate = None
+    mapped_segment = on_segment
+    if keep_silence_s is not None and on_segment:
+        mapped_segment = lambda segment: on_segment(gate.timestamps.map_segment(segment))
+    session = engine.recognize_stream(TARGET_RATE, language, on_partial=on_partial, on_segment=mapped_segment)
+    write = session.write
+    if keep_silence_s is not None:
+        from src.silence_trimmer import SilenceGate  # Imports this module
+        gate = SilenceGate(lambda block: session.write(float_to_pcm16(block)), TARGET_RATE,
+                           keep_silence_s=keep_silence_s)
+        write = lambda pcm: gate.write(pcm16_to_float(pcm))
+    session.gate = gate
+    
+    def feed():
+        try:
+            for pcm in decode_pcm16(path, TARGET_RATE, block_s):
+                if session.done:
+                    return  # Stopped by the caller
+                write(pcm)
+            if gate is not None:
+                gate.flush()
+        except Exception as e:
+            session.error = session.error or f"Decode failed: {e}"
+        session.end()
+    
+    threading.Thread(target=feed, daemon=True, name="AudioDecoder").start()
+    return session
+
+
+# ==================== BENCHMARK ====================
+if __name__ == "__main__":
+    import sys
+    import time
+    import tracemalloc
+    
+    import soundfile as sf
+    from src.stt_engine import LocalStubEngine
+    
+    np = _import_numpy()
+    minutes = float(sys.argv[1]) if len(sys.argv) > 1 else 10.0
+    source_rate = 44100
+    
+    # Seamless across blocks: streaming == whole-signal resampling
+    signal = np.sin(np.arange(source_rate) / 9.0).astype("float32")
+    whole = Resampler(source_rate).process(signal)
+    streaming = Resampler(source_rate)
+    pieces = np.concatenate([streaming.process(piece) for piece in np.array_split(signal, 37)])
+    
+    print("=" * 60)
+    print(f"  STREAMING DECODE ({minutes:g} min, {source_rate} Hz stereo -> 16 kHz mono)")
+    print("=" * 60)
+    print(f"  resampler: {len(whole)} samples whole vs {len(pieces)} in 37 blocks, "
+          f"max diff {np.abs(whole - pieces).max():.2e}")
+    
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "lecture.flac")
+        seconds = int(minutes * 60)
+        t = np.arange(source_rate * 10) / source_rate
+        tone = (0.3 * np.sin(2 * np.pi * 220 * t)).astype("float32")
+        with sf.SoundFile(path, "w", samplerate=source_rate, channels=2, format="FLAC") as out:
+            for _ in range(seconds // 10):
+                out.write(np.stack([tone, tone * 0.5], axis=1))
+        print(f"  input: {os.path.getsize(path) / 1e6:.1f} MB FLAC, needs decoding: {needs_decoding(path)}")
+        for rate, expected in ((16000, False), (8000, False), (44100, True), (48000, True)):
+            wav_path = os.path.join(folder, f"{rate}.wav")
+            sf.write(wav_path, tone[:rate], rate, subtype="PCM_16")
+            assert needs_decoding(wav_path) == expected, rate
+        print("  16-bit mono WAV needs decoding: 16/8 kHz no, 44.1/48 kHz yes")
+        
+        tracemalloc.start()
+        start = time.perf_counter()
+        session = recognize_decoded(LocalStubEngine(segment_s=10.0), path)
+        transcript = session.wait()
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"  streamed: {len(transcript.segments)} segments, {transcript.duration_s:.0f}s of audio "
+              f"in {elapsed:.2f}s ({transcript.duration_s / elapsed:.0f}x real time), "
+              f"peak Python memory {peak / 1e6:.1f} MB, error: {transcript.error}")
+        
+        tracemalloc.start()
+        audio, _ = sf.read(path, dtype="float32")
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"  sf.read whole file: peak Python memory {peak / 1e6:.1f} MB (before any resampling)")
@@ -5,17 +5,24 @@ Audio Handler Module - Xử lý ghi âm và chuyển đổi âm thanh sang text
 import os
 import io
 import json
-import sounddevice as sd
-import soundfile as sf
 import threading
 from datetime import datetime
 import azure.cognitiveservices.speech as speechsdk
 
+from src.audio_decoder import needs_decoding, recognize_decoded
+from src.audio_recorder import StreamingRecorder, float_to_pcm16
+from src.parallel_transcriber import ParallelTranscriber
+from src.silence_trimmer import MIN_KEPT_S, SilenceGate, trim_silence
+from src.stt_engine import AzureSTTEngine, Transcript, audio_duration_s
+
 
 class AudioHandler:
     """Lớp xử lý âm thanh: ghi âm, upload, chuyển đổi sang text"""
     
-    def __init__(self, azure_key: str, azure_region: str = "southeastasia", temp_folder: str = None):
+    def __init__(self, azure_key: str, azure_region: str = "southeastasia", temp_folder: str = None,
+                 max_record_s: float = None, record_format: str = "wav", on_record_limit=None,
+                 stt_engine=None, stt_concurrency: int = 1, parallel_min_s: float = 300,
+                 remove_silence: bool = True, keep_silence_s: float = 0.3):
         """
         Khởi tạo Audio Handler
         
@@ -23,12 +30,32 @@ class AudioHandler:
             azure_key: Azure Cognitive Services API Key
             azure_region: Vùng Azure (mặc định: southeastasia cho Việt Nam/Châu Á)
             temp_folder: Folder lưu file tạm (mặc định: ./temp)
+            max_record_s: Thời lượng ghi âm tối đa (giây, None = không giới hạn)
+            record_format: "wav" hoặc "flac" (nhỏ hơn ~4 lần)
+            on_record_limit: Gọi khi đạt thời lượng tối đa (thread ghi file)
+            stt_engine: Engine nhận dạng (mặc định: AzureSTTEngine; LocalStubEngine để test offline)
+            stt_concurrency: Số đoạn nhận dạng song song cho file dài (1 = tuần tự)
+            parallel_min_s: File dài từ mức này (giây) mới chia đoạn song song
+            remove_silence: Cắt bỏ/rút ngắn khoảng lặng trước khi nhận dạng (không bị tính phí)
+            keep_silence_s: Khoảng lặng dài hơn mức này được rút ngắn còn mức này
         """
         self.azure_key = azure_key
         self.azure_region = azure_region
         self.is_recording = False
-        self.audio_data = None
+        self.recorder = None
         self.sample_rate = 16000  # Tần số lấy mẫu
+        self.max_record_s = max_record_s
+        self.record_format = record_format
+        self.on_record_limit = on_record_limit
+        self.stt_engine = stt_engine or AzureSTTEngine(azure_key, azure_region)
+        self.stt_concurrency = stt_concurrency
+        self.parallel_min_s = parallel_min_s
+        self.remove_silence = remove_silence
+        self.keep_silence_s = keep_silence_s
+        self.last_trim = None  # TrimResult / SilenceGate gần nhất (report(): số giây tiết kiệm)
+        self.last_transcript = None
+        self.live_session = None  # Nhận dạng trực tiếp trong lúc ghi âm
+        self.live_gate = None     # SilenceGate của phiên trực tiếp (remove_silence)
         
         # Tạo folder temp nếu chưa có
         if temp_folder:
@@ -37,7 +64,7 @@ class AudioHandler:
             self.temp_folder = os.path.join(os.path.dirname(__file__), "temp")
         os.makedirs(self.temp_folder, exist_ok=True)
         self.temp_audio_file = None
-        
+    
     def validate_azure_credentials(self) -> tuple[bool, str]:
         """
         Kiểm tra credentials Azure
@@ -54,36 +81,71 @@ class AudioHandler:
         except Exception as e:
             return False, f"❌ Lỗi kiểm tra credentials: {str(e)}"
     
-    def start_recording(self) -> tuple[bool, str]:
+    def start_recording(self, live_transcription: bool = False, language: str = "vi-VN",
+                        on_partial=None, on_segment=None) -> tuple[bool, str]:
         """
         Bắt đầu ghi âm
         
+        Args:
+            live_transcription: Đồng thời đẩy âm thanh vào recognizer (push stream) -
+                                text sẵn sàng gần như ngay khi dừng ghi âm
+            language: Ngôn ngữ nhận dạng trực tiếp
+            on_partial: Gọi với text tạm thời (nhận dạng trực tiếp)
+            on_segment: Gọi với từng Segment (nhận dạng trực tiếp, offset theo bản ghi gốc)
+            
+            Khi remove_silence bật, khoảng lặng bị cắt/rút ngắn trước khi đẩy vào recognizer
+            (SilenceGate) - không trả phí cho im lặng
+        
         Returns:
             Tuple (success: bool, message: str)
         """
         try:
-            self.is_recording = True
-            self.audio_data = []
-            print("🎤 Đang ghi âm...")
+            sinks = []
+            self.live_session = None
+            self.live_gate = None
+            self.last_trim = None
+            if live_transcription:
+                try:
+                    gate = None
+                    mapped_segment = on_segment
+                    if self.remove_silence and on_segment:
+                        mapped_segment = lambda segment: on_segment(gate.timestamps.map_segment(segment))
+                    session = self.stt_engine.recognize_stream(
+                        self.sample_rate, language, on_partial=on_partial, on_segment=mapped_segment
+                    )
+                    push = lambda block: session.write(float_to_pcm16(block))
+                    if self.remove_silence:
+                        gate = SilenceGate(push, self.sample_rate, keep_silence_s=self.keep_silence_s)
+                        push = gate.write
+                    sinks.append(push)
+                    self.live_session = session
+                    self.live_gate = gate
+                except Exception as e:
+                    print(f"⚠️ Không thể nhận dạng trực tiếp, sẽ chuyển đổi file sau: {e}")
             
-            def audio_callback(indata, frames, time, status):
-                """Callback để nhận dữ liệu âm thanh"""
-                if status:
-                    print(f"⚠️ Audio callback status: {status}")
-                self.audio_data.append(indata.copy())
-            
-            # Tạo stream ghi âm
-            self.stream = sd.InputStream(
+            # Ghi thẳng vào file trong folder temp (ring buffer, bộ nhớ cố định)
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            self.temp_audio_file = os.path.join(self.temp_folder, f"recorded_{timestamp}.{self.record_format}")
+            self.recorder = StreamingRecorder(
+                self.temp_audio_file,
+                sample_rate=self.sample_rate,
                 channels=1,
-                samplerate=self.sample_rate,
-                callback=audio_callback,
-                blocksize=4096
+                blocksize=4096,
+                max_duration_s=self.max_record_s,
+                on_limit=self.on_record_limit,
+                sinks=sinks
             )
-            self.stream.start()
+            self.recorder.start()
+            self.is_recording = True
+            print("🎤 Đang ghi âm...")
             return True, "🎤 Đã bắt đầu ghi âm"
-            
+        
         except Exception as e:
             self.is_recording = False
+            if self.live_session is not None:
+                self.live_session.stop()
+                self.live_session = None
+                self.live_gate = None
             return False, f"❌ Lỗi ghi âm: {str(e)}"
     
     def stop_recording(self) -> tuple[bool, str, str]:
@@ -98,37 +160,82 @@ class AudioHandler:
                 return False, "❌ Không có quá trình ghi âm nào", ""
             
             self.is_recording = False
-            self.stream.stop()
-            self.stream.close()
+            # File đã được ghi trong lúc ghi âm - chỉ còn flush phần trong ring buffer
+            seconds = self.recorder.stop()
+            if self.live_session is not None:
+                if self.live_gate is not None:
+                    self.live_gate.flush()
+                self.live_session.end()  # Recognizer xử lý nốt câu cuối
+            if self.recorder.overruns:
+                print(f"⚠️ Mất {self.recorder.overruns / self.sample_rate:.1f}s âm thanh (ghi file chậm)")
             
-            # Lưu file âm thanh vào folder temp
-            if self.audio_data:
-                import numpy as np
-                audio_array = np.concatenate(self.audio_data, axis=0)
-                
-                # Tạo file trong folder temp
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                self.temp_audio_file = os.path.join(self.temp_folder, f"recorded_{timestamp}.wav")
-                
-                sf.write(self.temp_audio_file, audio_array, self.sample_rate)
+            if seconds > 0:
                 print(f"✅ Đã lưu file: {self.temp_audio_file}")
-                
-                return True, f"✅ Đã dừng ghi âm ({len(audio_array)/self.sample_rate:.1f}s)", self.temp_audio_file
+                suffix = " - đạt thời lượng tối đa" if self.recorder.limit_reached else ""
+                return True, f"✅ Đã dừng ghi âm ({seconds:.1f}s{suffix})", self.temp_audio_file
             else:
                 return False, "❌ Không có dữ liệu âm thanh", ""
-                
+        
         except Exception as e:
             self.is_recording = False
             return False, f"❌ Lỗi dừng ghi âm: {str(e)}", ""
     
-    def transcribe_audio_file(self, file_path: str, language: str = "vi-VN") -> tuple[bool, str]:
+    def finish_live_transcription(self, timeout: float = 120) -> tuple[bool, str]:
         """
-        Chuyển đổi file âm thanh sang text sử dụng Azure
+        Lấy kết quả nhận dạng trực tiếp (gọi sau stop_recording)
+        
+        Returns:
+            Tuple (success: bool, transcribed_text: str)
+        """
+        session, self.live_session = self.live_session, None
+        gate, self.live_gate = self.live_gate, None
+        if session is None:
+            return False, "❌ Không có phiên nhận dạng trực tiếp"
+        transcript = session.wait(timeout)
+        if gate is not None:
+            # Offset trong audio đã cắt -> thời gian của bản ghi gốc
+            transcript = self._map_transcript(transcript, gate.timestamps)
+            self.last_trim = gate
+            print(f"✂️ Ghi âm trực tiếp: {gate.report()}")
+        return self._transcript_result(transcript)
+    
+    @staticmethod
+    def _duration_s(file_path: str) -> float:
+        """Thời lượng file (0 nếu không đọc được header, ví dụ M4A)"""
+        try:
+            return audio_duration_s(file_path)
+        except Exception:
+            return 0.0
+    
+    def _transcript_result(self, transcript) -> tuple[bool, str]:
+        """Transcript -> (success, text)"""
+        self.last_transcript = transcript
+        if transcript.error:
+            if transcript.segments:
+                # Giữ phần đã nhận dạng được
+                return True, f"{transcript.text}\n\n⚠️ Dừng giữa chừng: {transcript.error}"
+            return False, f"❌ Lỗi: {transcript.error}"
+        if not transcript.segments:
+            return False, "❌ Không tìm thấy lời nói trong file âm thanh"
+        
+        text = transcript.text
+        print(f"✅ Chuyển đổi thành công: {len(transcript.segments)} đoạn, {len(text)} ký tự")
+        return True, text
+    
+    def transcribe_audio_file(self, file_path: str, language: str = "vi-VN",
+                              on_partial=None, on_segment=None) -> tuple[bool, str]:
+        """
+        Chuyển đổi file âm thanh sang text (nhận dạng liên tục - toàn bộ file,
+        không chỉ câu đầu tiên như recognize_once). MP3/M4A/FLAC/... được giải mã
+        tại máy theo từng khối và đẩy vào recognizer - không cần CloudConvert.
+        Khoảng lặng được cắt trong lúc giải mã (remove_silence); offset vẫn theo file gốc
         
         Args:
             file_path: Đường dẫn file âm thanh
             language: Ngôn ngữ (mặc định: vi-VN cho Tiếng Việt)
-            
+            on_partial: Gọi với text tạm thời của câu đang nhận dạng
+            on_segment: Gọi với từng Segment (text, offset_s, duration_s) khi xong
+        
         Returns:
             Tuple (success: bool, transcribed_text: str)
         """
@@ -143,41 +250,97 @@ class AudioHandler:
                 return False, f"❌ File không tồn tại: {file_path}"
             
             print(f"🔄 Đang chuyển đổi: {file_path}")
-            
-            # Cấu hình Azure Speech
-            speech_config = speechsdk.SpeechConfig(
-                subscription=self.azure_key,
-                region=self.azure_region
-            )
-            speech_config.speech_recognition_language = language
-            
-            # Tạo recognizer từ file
-            audio_config = speechsdk.audio.AudioConfig(filename=file_path)
-            recognizer = speechsdk.SpeechRecognizer(
-                speech_config=speech_config,
-                audio_config=audio_config
+            self.last_trim = None
+            if self.stt_concurrency > 1 and self._duration_s(file_path) >= self.parallel_min_s:
+                return self._transcript_result(self._recognize_parallel(file_path, language, on_segment))
+            return self._transcript_result(
+                self._recognize(file_path, language, on_partial, on_segment, self.remove_silence)
             )
-            
-            # Thực hiện nhận dạng
-            result = recognizer.recognize_once()
-            
-            # Xử lý kết quả
-            if result.reason == speechsdk.ResultReason.RecognizedSpeech:
-                text = result.text
-                print(f"✅ Chuyển đổi thành công: {len(text)} ký tự")
-                return True, text
-            elif result.reason == speechsdk.ResultReason.NoMatch:
-                return False, "❌ Không tìm thấy lời nói trong file âm thanh"
-            elif result.reason == speechsdk.ResultReason.Canceled:
-                cancellation = result.cancellation_details
-                error_msg = f"❌ Lỗi: {cancellation.reason}"
-                if cancellation.reason == speechsdk.CancellationReason.Error:
-                    error_msg += f"\n{cancellation.error_details}"
-                return False, error_msg
-                
+        
         except Exception as e:
             return False, f"❌ Lỗi chuyển đổi âm thanh: {str(e)}"
     
+    @staticmethod
+    def _map_transcript(transcript, timestamps) -> Transcript:
+        """Offset trong audio đã cắt -> thời gian của file gốc"""
+        return Transcript([timestamps.map_segment(segment) for segment in transcript.segments],
+                          transcript.error)
+    
+    def _trim(self, file_path: str):
+        """Cắt bỏ im lặng ra file tạm (None = tắt hoặc không cắt được)"""
+        if not self.remove_silence:
+            return None
+        try:
+            trim = trim_silence(file_path, self.temp_folder, keep_silence_s=self.keep_silence_s)
+        except Exception as e:
+            print(f"⚠️ Không thể cắt khoảng lặng, gửi nguyên file: {e}")
+            return None
+        print(f"✂️ {os.path.basename(file_path)}: {trim.report()}")
+        if trim.trimmed_s < MIN_KEPT_S:
+            # Gần như không còn gì: VAD có thể đánh giá sai (nói liên tục, nhạc nền) - gửi nguyên file
+            print("⚠️ Gần như toàn bộ file bị coi là im lặng, gửi nguyên file")
+            if trim.temporary:
+                self._remove_temp(trim.path)
+            return None
+        self.last_trim = trim
+        return trim
+    
+    def _recognize_parallel(self, file_path: str, language: str, on_segment) -> Transcript:
+        """
+        File dài: chia tại chỗ ngắt (VAD), nhận dạng song song, ghép lại theo thứ tự.
+        Các đoạn cần file để đọc, nên khoảng lặng được cắt ra file tạm trước (trim_silence)
+        """
+        trim = self._trim(file_path)
+        path = trim.path if trim else file_path
+        mapped_segment = on_segment
+        if trim and on_segment:
+            mapped_segment = lambda segment: on_segment(trim.timestamps.map_segment(segment))
+        try:
+            transcriber = ParallelTranscriber(
+                self.stt_engine, concurrency=self.stt_concurrency, temp_folder=self.temp_folder
+            )
+            transcript = transcriber.transcribe(path, language, on_segment=mapped_segment)
+            print(f"⚡ {len(transcriber.chunks)} đoạn, {self.stt_concurrency} luồng: {transcriber.timings}")
+        finally:
+            if trim and trim.temporary:
+                self._remove_temp(trim.path)
+        return self._map_transcript(transcript, trim.timestamps) if trim else transcript
+    
+    def _recognize(self, file_path: str, language: str, on_partial, on_segment,
+                   remove_silence: bool) -> Transcript:
+        """
+        Nhận dạng tuần tự: giải mã từng khối -> (SilenceGate) -> push stream, nhận dạng
+        trong lúc giải mã, không file tạm; WAV 16-bit mono không cắt im lặng được đọc trực tiếp
+        """
+        if not remove_silence and not needs_decoding(file_path):
+            return self.stt_engine.recognize_file(
+                file_path, language, on_partial=on_partial, on_segment=on_segment
+            ).wait()
+        
+        session = recognize_decoded(
+            self.stt_engine, file_path, language, on_partial=on_partial, on_segment=on_segment,
+            keep_silence_s=self.keep_silence_s if remove_silence else None
+        )
+        transcript = session.wait()
+        gate = session.gate
+        if gate is None:
+            return transcript
+        
+        print(f"✂️ {os.path.basename(file_path)}: {gate.report()}")
+        if gate.timestamps.duration_s < MIN_KEPT_S <= gate.original_s and not (transcript.segments or transcript.error):
+            # Gần như không còn gì: VAD có thể đánh giá sai (nói liên tục, nhạc nền) - gửi nguyên file
+            print("⚠️ Gần như toàn bộ file bị coi là im lặng, gửi nguyên file")
+            return self._recognize(file_path, language, on_partial, on_segment, remove_silence=False)
+        self.last_trim = gate
+        return self._map_transcript(transcript, gate.timestamps)
+    
+    @staticmethod
+    def _remove_temp(path: str):
+        try:
+            os.remove(path)
+        except OSError as e:
+            print(f"⚠️ Không thể xóa file tạm: {e}")
+    
     def transcribe_audio_realtime(self, language: str = "vi-VN", callback=None) -> tuple[bool, str]:
         """
         Chuyển đổi âm thanh realtime sử dụng microphone
@@ -185,7 +348,7 @@ class AudioHandler:
         Args:
             language: Ngôn ngữ (mặc định: vi-VN)
             callback: Hàm callback để xử lý kết quả
-            
+        
         Returns:
             Tuple (success: bool, transcribed_text: str)
         """
@@ -234,7 +397,7 @@ class AudioHandler:
                 if callback:
                     callback(error_msg)
                 return False, error_msg
-                
+        
         except Exception as e:
             error_msg = f"❌ Lỗi nhận dạng realtime: {str(e)}"
             if callback:
@@ -0,0 +1,402 @@
+"""
+Streaming Audio Recorder - Constant Memory, Straight to Disk
+============================================================
+
+StreamingRecorder:
+- The sounddevice callback copies each block into a PREALLOCATED NumPy
+  ring buffer (no allocation on the audio thread)
+- A writer thread drains the ring into an open ``soundfile.SoundFile``
+  (WAV or FLAC, chosen by extension)
+- Memory is the ring (``buffer_s`` seconds), whatever the recording length;
+  ``stop()`` only flushes what is still in the ring
+- ``max_duration_s`` stops recording at a hard limit
+- ``sinks`` get every block on the writer thread too (e.g. a live
+  recognizer push stream - see ``float_to_pcm16``)
+
+Requires: pip install numpy sounddevice soundfile
+"""
+
+import os
+import threading
+from typing import Callable, Optional
+
+
+def _import_numpy():
+    try:
+        import numpy as np
+    except ImportError:
+        raise RuntimeError("Audio recording requires numpy: pip install numpy")
+    return np
+
+
+def float_to_pcm16(block) -> bytes:
+    """float32 samples in [-1, 1] -> little-endian 16-bit PCM bytes."""
+    np = _import_numpy()
+    return (np.clip(block, -1.0, 1.0) * 32767.0).astype("<i2").tobytes()
+
+
+def pcm16_to_float(pcm: bytes):
+    """Little-endian 16-bit PCM bytes -> float32 samples in [-1, 1]."""
+    np = _import_numpy()
+    return np.frombuffer(pcm, dtype="<i2").astype("float32") / 32768.0
+
+
+class RingBuffer:
+    """
+    Fixed-size single-producer / single-consumer sample ring.
+    
+    ``write`` runs on the audio thread, ``read_into`` on the writer thread.
+    Positions only grow (each side updates its own counter), so no lock is
+    needed. When the reader falls behind by more than the capacity, new
+    frames are dropped and counted as ``overruns``.
+    """
+    
+    def __init__(self, capacity_frames: int, channels: int = 1, dtype: str = "float32"):
+        np = _import_numpy()
+        self.capacity = capacity_frames
+        self._data = np.zeros((capacity_frames, channels), dtype=dtype)
+        self._write_pos = 0
+        self._read_pos = 0
+        self.overruns = 0
+    
+    @property
+    def available(self) -> int:
+        return self._write_pos - self._read_pos
+    
+    def write(self, block) -> int:
+        """Copy a (frames, channels) block in. Returns frames written."""
+        frames = min(len(block), self.capacity - self.available)
+        if frames < len(block):
+            self.overruns += len(block) - frames
+        if frames <= 0:
+            return 0
+        
+        start = self._write_pos % self.capacity
+        first = min(frames, self.capacity - start)
+        self._data[start:start + first] = block[:first]
+        if first < frames:
+            self._data[:frames - first] = block[first:frames]
+        self._write_pos += frames
+        return frames
+    
+    def read_into(self, consumer: Callable, max_frames: Optional[int] = None) -> int:
+        """
+        Hand the available frames to ``consumer`` as (at most two) views of
+        the ring - no copy. Returns frames consumed.
+        """
+        frames = self.available
+        if max_frames is not None:
+            frames = min(frames, max_frames)
+        if frames <= 0:
+            return 0
+        
+        start = self._read_pos % self.capacity
+        first = min(frames, self.capacity - start)
+        consumer(self._data[start:start + first])
+        if first < frames:
+            consumer(self._data[:frames - first])
+        self._read_pos += frames
+        return frames
+
+
+class StreamingRecorder:
+    """
+    Records the default input device into a WAV/FLAC file while recording.
+    
+    Usage:
+        recorder = StreamingRecorder("meeting.flac", max_duration_s=3600)
+        recorder.start()
+        ...
+        seconds = recorder.stop()
+    """
+    
+    def __init__(
+        self,
+        path: str,
+        sample_rate: int = 16000,
+        channels: int = 1,
+        blocksize: int = 4096,
+        buffer_s: float = 10.0,
+        max_duration_s: Optional[float] = None,
+        on_limit: Optional[Callable[[], None]] = None,
+        stream_factory: Optional[Callable] = None,
+        sinks: Optional[list] = None
+    ):
+        """
+        Args:
+            path: Output file (.flac = FLAC, anything else = 16-bit WAV;
+                  None = no file, sinks only)
+            sample_rate: Samples per second
+            channels: Input channels
+            blocksize: Frames per audio callback
+            buffer_s: Ring size - how far the writer may fall behind
+            max_duration_s: Stop recording after this many seconds (None = no limit)
+            on_limit: Called (writer thread) when ``max_duration_s`` is reached
+            stream_factory: Builds the input stream (default: sounddevice.InputStream);
+                            called with samplerate, channels, blocksize, callback
+            sinks: Called (writer thread) with each float32 (frames, channels)
+                   block view - copy it if you keep it. A failing sink is removed
+        """
+        self.path = path
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.blocksize = blocksize
+        self.max_frames = int(max_duration_s * sample_rate) if max_duration_s else None
+        self.on_limit = on_limit
+        self._stream_factory = stream_factory
+        self.sinks = list(sinks or [])
+        
+        self._ring = RingBuffer(max(int(buffer_s * sample_rate), blocksize * 2), channels)
+        self._file = None
+        self._stream = None
+        self._writer = None
+        self._wake = threading.Event()
+        self._stopping = False
+        self._limit_reached = False
+        
+        self.frames_received = 0
+        self.frames_written = 0
+    
+    @property
+    def duration_s(self) -> float:
+        return self.frames_written / self.sample_rate
+    
+    @property
+    def limit_reached(self) -> bool:
+        return self._limit_reached
+    
+    @property
+    def overruns(self) -> int:
+        return self._ring.overruns
+    
+    def _open_file(self):
+        if self.path is None:
+            return None
+        try:
+            import soundfile as sf
+        except ImportError:
+            raise RuntimeError("Audio recording requires soundfile: pip install soundfile")
+        
+        if os.path.splitext(self.path)[1].lower() == ".flac":
+            format_, subtype = "FLAC", "PCM_16"
+        else:
+            format_, subtype = "WAV", "PCM_16"
+        return sf.SoundFile(self.path, mode="w", samplerate=self.sample_rate,
+                            channels=self.channels, format=format_, subtype=subtype)
+    
+    def _open_stream(self):
+        if self._stream_factory is not None:
+            factory = self._stream_factory
+        else:
+            try:
+                import sounddevice as sd
+            except ImportError:
+                raise RuntimeError("Audio recording requires sounddevice: pip install sounddevice")
+            factory = sd.InputStream
+        return factory(samplerate=self.sample_rate, channels=self.channels,
+                       blocksize=self.blocksize, dtype="float32", callback=self._callback)
+    
+    # ==================== LIFECYCLE ====================
+    
+    def start(self):
+        """
+        Open the file and start recording.
+        
+        Raises:
+            RuntimeError: Missing dependency
+        """
+        self._file = self._open_file()
+        self._stopping = False
+        self._writer = threading.Thread(target=self._write_loop, daemon=True, name="AudioWriter")
+        self._writer.start()
+        try:
+            self._stream = self._open_stream()
+            self._stream.start()
+        except Exception:
+            self._finish_writer()
+            raise
+    
+    def stop(self) -> float:
+        """Stop recording and close the file. Returns the recorded seconds."""
+        stream, self._stream = self._stream, None
+        try:
+            if stream is not None:
+                try:
+                    stream.stop()
+                finally:
+                    stream.close()
+        finally:
+            # Even if the device fails: end the writer thread, release the file
+            self._finish_writer()
+        return self.duration_s
+    
+    def _finish_writer(self):
+        self._stopping = True
+        self._wake.set()
+        if self._writer is not None:
+            self._writer.join()
+            self._writer = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+    
+    # ==================== AUDIO THREAD ====================
+    
+    def _callback(self, indata, frames, time, status):
+        """sounddevice callback - copy into the ring, nothing else."""
+        if status:
+            print(f"⚠️ Audio callback status: {status}")
+        if self._limit_reached:
+            return
+        
+        if self.max_frames is not None and self.frames_received + frames >= self.max_frames:
+            indata = indata[:self.max_frames - self.frames_received]
+            self._limit_reached = True
+        self._ring.write(indata)
+        self.frames_received += len(indata)  # Overrun frames count too - the limit is wall-clock time
+        self._wake.set()
+    
+    # ==================== WRITER THREAD ====================
+    
+    def _consume(self, block):
+        if self._file is not None:
+            self._file.write(block)
+        for sink in list(self.sinks):
+            try:
+                sink(block)
+            except Exception as e:
+                print(f"⚠️ Audio sink failed, detached: {e}")
+                self.sinks.remove(sink)
+    
+    def _write_loop(self):
+        limit_reported = False
+        while True:
+            self._wake.wait(0.5)
+            self._wake.clear()
+            self.frames_written += self._ring.read_into(self._consume)
+            
+            if self._limit_reached and not limit_reported and not self._ring.available:
+                limit_reported = True
+                if self.on_limit:
+                    self.on_limit()
+            if self._stopping and not self._ring.available:
+                return
+
+
+# ==================== BENCHMARK ====================
+if __name__ == "__main__":
+    import sys
+    import time
+    import tempfile
+    import tracemalloc
+    
+    np = _import_numpy()
+    
+    class FakeStream:
+        """Pushes generated blocks as fast as the writer keeps up (no device)."""
+        
+        def __init__(self, samplerate, channels, blocksize, dtype, callback):
+            self.blocksize = blocksize
+            self.callback = callback
+            self.block = (np.sin(np.arange(blocksize) / 8.0) * 0.3).astype(dtype).reshape(-1, 1)
+            self.blocks = 0
+        
+        def start(self):
+            for _ in range(self.blocks_to_send):
+                self.callback(self.block, self.blocksize, None, None)
+                self.blocks += 1
+                if self.blocks % 4 == 0:
+                    time.sleep(0.001)  # ~1000x real time - the writer has to keep up
+        
+        def stop(self):
+            pass
+        
+        def close(self):
+            pass
+    
+    minutes = float(sys.argv[1]) if len(sys.argv) > 1 else 60.0
+    sample_rate = 16000
+    blocks = int(minutes * 60 * sample_rate / 4096)
+    
+    def factory(**kwargs):
+        stream = FakeStream(**kwargs)
+        stream.blocks_to_send = blocks
+        return stream
+    
+    print("=" * 60)
+    print(f"  STREAMING RECORDER ({minutes:g} min of 16 kHz mono, simulated)")
+    print("=" * 60)
+    with tempfile.TemporaryDirectory() as folder:
+        for ext in (".wav", ".flac"):
+            path = os.path.join(folder, "recording" + ext)
+            tracemalloc.start()
+            recorder = StreamingRecorder(path, sample_rate=sample_rate, stream_factory=factory)
+            start = time.perf_counter()
+            recorder.start()
+            fed = time.perf_counter()
+            seconds = recorder.stop()
+            done = time.perf_counter()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"  {ext[1:]:4}: {seconds:7.1f}s recorded, stop() {(done - fed) * 1000:6.1f} ms, "
+                  f"total {done - start:5.2f}s, peak Python memory {peak / 1e6:5.1f} MB, "
+                  f"file {os.path.getsize(path) / 1e6:6.1f} MB, overruns {recorder.overruns}")
+        
+        # Old approach: list of copies + concatenate at stop
+        tracemalloc.start()
+        block = np.zeros((4096, 1), dtype="float32")
+        chunks = [block.copy() for _ in range(blocks)]
+        start = time.perf_counter()
+        audio = np.concatenate(chunks, axis=0)
+        concat_s = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"  list + concatenate: concatenate alone {concat_s * 1000:.1f} ms, "
+              f"peak Python memory {peak / 1e6:.1f} MB")
+        
+        limited = StreamingRecorder(os.path.join(folder, "limited.wav"), max_duration_s=5,
+                                    stream_factory=factory)
+        limited.start()
+        print(f"  max_duration_s=5: {limited.stop():.2f}s written, limit reached: {limited.limit_reached}")
+        assert limited.limit_reached and abs(limited.duration_s - 5) < 1e-9
+        
+        # A writer slower than the audio: overrun frames still count toward the limit
+        slow = StreamingRecorder(os.path.join(folder, "slow.wav"), buffer_s=0.5, max_duration_s=5,
+                                 stream_factory=factory, sinks=[lambda block: time.sleep(0.01)])
+        slow.start()
+        slow.stop()
+        print(f"  max_duration_s=5, writer too slow: {slow.frames_received / sample_rate:.2f}s received, "
+              f"{slow.duration_s:.2f}s written, {slow.overruns / sample_rate:.2f}s lost")
+        assert slow.overruns and slow.frames_received == slow.max_frames
+        
+        class FailingStream(FakeStream):
+            def stop(self):
+                raise RuntimeError("device unplugged")
+        
+        def failing_factory(**kwargs):
+            stream = FailingStream(**kwargs)
+            stream.blocks_to_send = 8
+            return stream
+        
+        failing = StreamingRecorder(os.path.join(folder, "failing.wav"), stream_factory=failing_factory)
+        failing.start()
+        try:
+            failing.stop()
+        except RuntimeError as e:
+            print(f"  stream.stop() raised ({e}): writer stopped {failing._writer is None}, "
+                  f"file closed {failing._file is None}")
+        assert failing._writer is None and failing._file is None
+        
+        # Live recognition: the recognizer is fed while recording
+        from src.stt_engine import LocalStubEngine
+        session = LocalStubEngine(segment_s=10.0).recognize_stream(sample_rate)
+        live = StreamingRecorder(os.path.join(folder, "live.wav"), stream_factory=factory,
+                                 sinks=[lambda block: session.write(float_to_pcm16(block))])
+        live.start()
+        segments_before_stop = len(session.segments)
+        start = time.perf_counter()
+        live.stop()
+        session.end()
+        transcript = session.wait()
+        print(f"  live: {segments_before_stop} segments recognized before stop, transcript "
+              f"({len(transcript.segments)} segments) ready {(time.perf_counter() - start) * 1000:.1f} ms after stop")
@@ -0,0 +1,743 @@
+"""
+Capture Engine - GUI-Independent Capture → Analyze Pipeline
+============================================================
+
+Owns everything between "a screenshot exists" and "a result is available":
+- Screenshot batching (debounce timer + max batch size, one batch per
+  source + prompt)
+- Result cache (same model + prompt + images = no Gemini call)
+- Rate limiting (token bucket, requests per minute)
+- Gemini calls (one worker thread by default, ``workers`` for parallel
+  requests; optionally streamed)
+- Persisting results to HistoryStore
+- Hotkey actions (``run_action``): capture, capture the active window,
+  flush, cancel in-flight batches, resend the last batch with another
+  template
+
+The engine has no Tk dependency. Front-ends (the customtkinter GUI, the
+headless runner) feed it images and receive logs/results via callbacks.
+Callbacks run on engine threads - front-ends must marshal to their own
+UI thread if needed.
+
+Usage:
+    engine = CaptureEngine(history=store, on_result=print)
+    engine.configure(api_key, "gemini-2.5-flash", prompt)
+    engine.start()
+    engine.capture()         # or engine.add_image(pil_image)
+    
+    # Programmatic callers (local API) get a Future per image:
+    future = engine.submit(image, prompt=template_prompt, source="api")
+    result = future.result(timeout=120)
+    ...
+    engine.close()
+"""
+
+import time
+import hashlib
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from datetime import datetime
+from typing import Callable, Optional, Tuple
+
+from src.history_store import hash_image
+from src.prompt_templates import get_template
+
+
+# NOTE: google.generativeai import is LAZY (pulls in grpc/protobuf)
+genai = None
+
+
+def _import_genai():
+    """Lazy import google.generativeai."""
+    global genai
+    if genai is None:
+        import google.generativeai as _genai
+        genai = _genai
+    return genai
+
+
+def get_token_usage(response) -> dict:
+    """Extract token usage from a Gemini response (if available)."""
+    usage = getattr(response, 'usage_metadata', None)
+    if usage is None:
+        return {}
+    return {
+        'prompt_tokens': getattr(usage, 'prompt_token_count', None),
+        'output_tokens': getattr(usage, 'candidates_token_count', None),
+        'total_tokens': getattr(usage, 'total_token_count', None)
+    }
+
+
+# Actions hotkeys can trigger ("resend:<template name>")
+ACTIONS = ("capture", "capture_window", "flush", "cancel", "resend")
+
+
+def parse_action(action: str) -> Tuple[str, Optional[str]]:
+    """
+    Split an action like "resend:Math Solver" into (name, argument).
+    
+    Raises:
+        ValueError: Unknown action or template
+    """
+    name, _, argument = action.partition(':')
+    name = name.strip().lower()
+    if name not in ACTIONS:
+        raise ValueError(f"Unknown action '{action}' (use one of: {', '.join(ACTIONS)})")
+    if name == "resend":
+        if not get_template(argument.strip()):
+            raise ValueError(f"Action '{action}' needs a template name (resend:<template>)")
+        return name, argument.strip()
+    return name, None
+
+
+def foreground_window_bbox() -> Optional[tuple]:
+    """Screen rectangle (left, top, right, bottom) of the active window, None if unknown."""
+    try:
+        import ctypes
+        import ctypes.wintypes as wintypes
+        user32 = ctypes.windll.user32
+    except (ImportError, AttributeError):
+        return None
+    
+    hwnd = user32.GetForegroundWindow()
+    rect = wintypes.RECT()
+    if not hwnd or not user32.GetWindowRect(hwnd, ctypes.byref(rect)):
+        return None
+    if rect.right <= rect.left or rect.bottom <= rect.top:
+        return None  # Minimized
+    return rect.left, rect.top, rect.right, rect.bottom
+
+
+class RateLimiter:
+    """
+    Token bucket limiting Gemini requests per minute.
+    
+    ``reserve()`` takes a token and returns how long the caller has to wait
+    before using it (0 = go now). Reservations queue up in order, so a burst
+    of batches is spread out instead of hitting the quota.
+    """
+    
+    def __init__(self, requests_per_minute: float = 0, burst: int = 1):
+        """
+        Args:
+            requests_per_minute: Sustained rate (0 = unlimited)
+            burst: Requests allowed back-to-back before throttling
+        """
+        self._lock = threading.Lock()
+        self.burst = max(1, burst)
+        self.set_rate(requests_per_minute)
+    
+    def set_rate(self, requests_per_minute: float):
+        """Change the rate (resets the bucket to full)."""
+        with self._lock:
+            self.requests_per_minute = max(0.0, float(requests_per_minute or 0))
+            self._tokens = float(self.burst)
+            self._updated = time.monotonic()
+    
+    def reserve(self) -> float:
+        """Take one token. Returns seconds to wait before sending."""
+        with self._lock:
+            if self.requests_per_minute <= 0:
+                return 0.0
+            
+            rate_per_s = self.requests_per_minute / 60.0
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * rate_per_s)
+            self._updated = now
+            self._tokens -= 1.0
+            
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / rate_per_s
+
+
+class ResultCache:
+    """
+    Small in-memory LRU cache of analysis results.
+    
+    Keyed by model + prompt + image content hashes, so re-sending the same
+    screen (PrtSc twice, or a script retrying) reuses the earlier answer.
+    """
+    
+    def __init__(self, max_entries: int = 128, ttl_s: float = 3600):
+        """
+        Args:
+            max_entries: Entries kept (least recently used evicted; 0 = disabled)
+            ttl_s: Entry lifetime in seconds
+        """
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (stored_at, result, usage)
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def make_key(model: str, prompt: str, image_hashes: list) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (model, prompt, *image_hashes):
+            digest.update(part.encode('utf-8'))
+            digest.update(b"\0")
+        return digest.hexdigest()
+    
+    def get(self, key: str) -> Optional[tuple]:
+        """Return (result, usage) or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[0] > self.ttl_s:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1], entry[2]
+    
+    def put(self, key: str, result: str, usage: dict):
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), result, usage)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class _PendingBatch:
+    """Images waiting to be sent together (same source and prompt)."""
+    
+    __slots__ = ("source", "prompt", "images", "waiters", "deadline", "flush", "cancelled")
+    
+    def __init__(self, source: str, prompt: Optional[str]):
+        self.source = source
+        self.prompt = prompt      # None = engine prompt at send time
+        self.images = []
+        self.waiters = []         # (Future, on_chunk) per submitted image
+        self.deadline = 0.0
+        self.flush = False
+        self.cancelled = False    # Set by cancel() while the batch is in flight
+
+
+class CaptureEngine:
+    """
+    Batching capture/analysis pipeline.
+    
+    Images are collected into a batch (at most ``max_batch_size``). The batch
+    is sent to Gemini once no new image arrived for ``batch_delay_ms``
+    (debounce) or when it is flushed explicitly. Batches are processed one
+    at a time, in order, on a single worker thread (or ``workers`` batches
+    in parallel for bulk ingestion).
+    
+    Images with a different source or prompt (e.g. local API requests with
+    a template) go into their own batch, so they never change what a
+    PrtSc batch is asked.
+    """
+    
+    def __init__(
+        self,
+        history=None,
+        batch_delay_ms: int = 5000,
+        max_batch_size: int = 10,
+        on_log: Optional[Callable[[str], None]] = None,
+        on_result: Optional[Callable[[dict], None]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+        model=None,
+        requests_per_minute: float = 0,
+        cache_size: int = 128,
+        workers: int = 1
+    ):
+        """
+        Initialize capture engine.
+        
+        Args:
+            history: HistoryStore for persisting results (optional)
+            batch_delay_ms: Debounce delay before a batch is sent
+            max_batch_size: Maximum images per batch (extra captures are rejected)
+            on_log: Called with progress messages
+            on_result: Called with a result dict after each successful batch
+            on_error: Called with the exception when a batch fails
+            model: Pre-built model object with ``generate_content`` (for
+                   benchmarking / offline use; skips ``configure``)
+            requests_per_minute: Gemini rate limit (0 = unlimited)
+            cache_size: Cached results kept (0 = no cache)
+            workers: Batches processed in parallel (1 = strictly in order)
+        """
+        self.history = history
+        self.batch_delay_ms = batch_delay_ms
+        self.max_batch_size = max_batch_size
+        self.on_log = on_log
+        self.on_result = on_result
+        self.on_error = on_error
+        
+        self.model_name = "gemini-2.5-flash"
+        self.prompt = ""
+        self._model = model
+        
+        self.rate_limiter = RateLimiter(requests_per_minute, burst=3)
+        self.cache = ResultCache(max_entries=cache_size)
+        
+        self._cond = threading.Condition()
+        self._batches = OrderedDict()  # (source, prompt) -> _PendingBatch
+        self._closed = False
+        self.workers = max(1, workers)
+        self._workers = []
+        self._active = 0
+        self._in_flight = set()     # Batches being analyzed
+        self._last_capture = []     # Images of the last capture batch (for resend)
+        
+        # Hook-to-grab latency of triggered captures (seconds)
+        self._trigger_latencies = deque(maxlen=256)
+    
+    # ==================== CONFIGURATION ====================
+    
+    def configure(self, api_key: str, model_name: str, prompt: str):
+        """
+        Configure Gemini credentials, model and prompt.
+        
+        Raises:
+            Exception: If the SDK can't be configured (bad key format, import error)
+        """
+        _import_genai()
+        genai.configure(api_key=api_key)
+        self._model = genai.GenerativeModel(model_name)
+        self.model_name = model_name
+        self.prompt = prompt
+    
+    def set_model(self, model_name: str):
+        """Hot-switch the Gemini model (takes effect on the next batch)."""
+        self._model = _import_genai().GenerativeModel(model_name)
+        self.model_name = model_name
+    
+    def set_prompt(self, prompt: str):
+        """Change the prompt (takes effect on the next batch)."""
+        self.prompt = prompt
+    
+    def _log(self, message: str):
+        if self.on_log:
+            self.on_log(message)
+    
+    # ==================== LIFECYCLE ====================
+    
+    @property
+    def is_processing(self) -> bool:
+        """True while any batch is being analyzed."""
+        return self._active > 0
+    
+    def start(self):
+        """Start the worker threads (idempotent)."""
+        with self._cond:
+            self._closed = False
+            self._workers = [worker for worker in self._workers if worker.is_alive()]
+            for i in range(len(self._workers), self.workers):
+                worker = threading.Thread(
+                    target=self._worker_loop,
+                    daemon=True,
+                    name=f"CaptureEngineWorker-{i}"
+                )
+                worker.start()
+                self._workers.append(worker)
+    
+    def stop(self, source: Optional[str] = None):
+        """
+        Drop pending (unsent) batches. The worker keeps running.
+        
+        Args:
+            source: Only drop batches from this source (None = all)
+        """
+        with self._cond:
+            dropped = [
+                key for key, batch in self._batches.items()
+                if source is None or batch.source == source
+            ]
+            batches = [self._batches.pop(key) for key in dropped]
+        
+        for batch in batches:
+            for future, _ in batch.waiters:
+                future.cancel()
+            self._close_images(batch.images)
+    
+    def close(self, timeout: float = 2.0):
+        """Drop pending batches and stop the worker thread."""
+        self.stop()
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        for worker in self._workers:
+            worker.join(timeout=timeout)
+        self._workers = []
+        with self._cond:
+            last, self._last_capture = self._last_capture, []
+        self._close_images(last)
+    
+    # ==================== INPUT ====================
+    
+    def capture(self, bbox=None, trigger_time: Optional[float] = None) -> Optional[int]:
+        """
+        Grab the screen (or ``bbox`` region) and add it to the batch.
+        
+        Args:
+            bbox: Screen region (None = all screens)
+            trigger_time: ``time.perf_counter()`` stamp of the key press
+                          (HookEvent.time) - recorded as hook-to-grab latency
+        
+        Returns:
+            int: Images in the current batch, or None if rejected/failed
+        """
+        with self._cond:
+            batch = self._batches.get(("capture", None))
+            if batch and len(batch.images) >= self.max_batch_size:
+                self._log(f"Max batch size ({self.max_batch_size}) reached.\n")
+                return None
+        
+        try:
+            from PIL import ImageGrab
+            if trigger_time is not None:
+                self._trigger_latencies.append(time.perf_counter() - trigger_time)
+            screenshot = ImageGrab.grab(bbox=bbox)
+        except Exception as e:
+            self._log(f"Capture error: {e}\n")
+            return None
+        
+        return self.add_image(screenshot)
+    
+    def capture_window(self, trigger_time: Optional[float] = None) -> Optional[int]:
+        """Capture only the active window (full screen if it can't be found)."""
+        bbox = foreground_window_bbox()
+        if bbox is None:
+            self._log("Active window not found - capturing the full screen.\n")
+        return self.capture(bbox=bbox, trigger_time=trigger_time)
+    
+    def trigger_latency_stats(self) -> dict:
+        """Hook-to-grab latency of recent triggered captures (ms)."""
+        latencies = sorted(self._trigger_latencies)
+        if not latencies:
+            return {'count': 0}
+        return {
+            'count': len(latencies),
+            'p50_ms': round(latencies[len(latencies) // 2] * 1000, 2),
+            'max_ms': round(latencies[-1] * 1000, 2),
+        }
+    
+    def add_image(self, image) -> Optional[int]:
+        """
+        Add an image to the current capture batch and restart the debounce timer.
+        
+        The engine takes ownership of the image and closes it after use.
+        
+        Returns:
+            int: Images in the current batch, or None if the batch is full
+        """
+        count = self._enqueue(image, ("capture", None), None, None, None, False)
+        if count is None:
+            self._log(f"Max batch size ({self.max_batch_size}) reached.\n")
+            image.close()
+            return None
+        
+        delay_s = self.batch_delay_ms / 1000.0
+        self._log(f"Captured #{count}/{self.max_batch_size} ({delay_s:g}s timer...)\n")
+        return count
+    
+    def submit(
+        self,
+        image,
+        prompt: Optional[str] = None,
+        source: str = "api",
+        on_chunk: Optional[Callable[[str], None]] = None,
+        flush: bool = False,
+        batch: bool = True
+    ) -> Future:
+        """
+        Queue an image for analysis and get a Future for its batch result.
+        
+        The image goes through the same batching, cache and rate limit as
+        PrtSc captures. The engine takes ownership of the image.
+        
+        Args:
+            image: PIL image
+            prompt: Prompt for this image (None = engine prompt)
+            source: Batch group; images from different sources are never mixed
+            on_chunk: Called with partial text while the response streams
+            flush: Send the batch now instead of waiting for the debounce
+            batch: False = analyze this image on its own (sent immediately,
+                   never merged with other images)
+        
+        Returns:
+            Future: Resolves to the result dict (see ``on_result``), raises
+                    the analysis error, or is cancelled if the batch is dropped
+        """
+        future = Future()
+        
+        key = (source, prompt) if batch else (source, prompt, id(future))
+        if self._enqueue(image, key, prompt, future, on_chunk, flush or not batch) is None:
+            image.close()
+            future.set_exception(RuntimeError(f"Max batch size ({self.max_batch_size}) reached"))
+        return future
+    
+    def _enqueue(self, image, key, prompt, future, on_chunk, flush) -> Optional[int]:
+        """Add an image to the batch ``key``. Returns the batch size, None if full."""
+        with self._cond:
+            batch = self._batches.get(key)
+            if batch is None:
+                batch = self._batches[key] = _PendingBatch(key[0], prompt)
+            elif len(batch.images) >= self.max_batch_size:
+                return None
+            
+            batch.images.append(image)
+            if future is not None:
+                batch.waiters.append((future, on_chunk))
+            batch.deadline = time.monotonic() + self.batch_delay_ms / 1000.0
+            batch.flush = batch.flush or flush
+            self._cond.notify_all()
+            return len(batch.images)
+    
+    def flush(self):
+        """Send pending batches now instead of waiting for the debounce."""
+        with self._cond:
+            if self._batches:
+                for batch in self._batches.values():
+                    batch.flush = True
+                self._cond.notify_all()
+    
+    def pending_count(self) -> int:
+        """Number of images waiting in pending batches."""
+        with self._cond:
+            return sum(len(batch.images) for batch in self._batches.values())
+    
+    # ==================== ACTIONS ====================
+    
+    def cancel(self, source: str = "capture") -> int:
+        """
+        Drop pending batches of ``source`` and discard the results of its
+        batches being analyzed (no result callback, no history entry).
+        
+        Returns:
+            int: Batches cancelled (pending + in flight)
+        """
+        with self._cond:
+            pending = sum(1 for batch in self._batches.values() if batch.source == source)
+            in_flight = [batch for batch in self._in_flight if batch.source == source]
+            for batch in in_flight:
+                batch.cancelled = True
+        self.stop(source)
+        
+        count = pending + len(in_flight)
+        self._log(f"Cancelled {count} batch(es).\n" if count else "Nothing to cancel.\n")
+        return count
+    
+    def resend(self, prompt: str) -> Optional[int]:
+        """
+        Send the images of the last capture batch again with another prompt
+        (sent immediately, no debounce).
+        
+        Returns:
+            int: Images resent, or None if there is no previous batch
+        """
+        with self._cond:
+            images = [img.copy() for img in self._last_capture]
+        if not images:
+            self._log("Nothing to resend yet.\n")
+            return None
+        
+        for image in images:
+            if self._enqueue(image, ("capture", prompt), prompt, None, None, True) is None:
+                image.close()
+        self._log(f"Resending {len(images)} image(s)...\n")
+        return len(images)
+    
+    def run_action(self, action: str, trigger_time: Optional[float] = None):
+        """
+        Run a hotkey action (see ``ACTIONS``), e.g. "flush" or "resend:Math Solver".
+        
+        Raises:
+            ValueError: Unknown action or template
+        """
+        name, argument = parse_action(action)
+        if name == "capture":
+            return self.capture(trigger_time=trigger_time)
+        if name == "capture_window":
+            return self.capture_window(trigger_time=trigger_time)
+        if name == "flush":
+            self._log("Sending batch now.\n")
+            return self.flush()
+        if name == "cancel":
+            return self.cancel()
+        return self.resend(get_template(argument))
+    
+    # ==================== PROCESSING ====================
+    
+    def _next_due(self):
+        """Return (key, seconds until due) of the batch due first (lock held)."""
+        now = time.monotonic()
+        due_key, due_in = None, None
+        for key, batch in self._batches.items():
+            remaining = 0.0 if batch.flush else batch.deadline - now
+            if due_in is None or remaining < due_in:
+                due_key, due_in = key, remaining
+        return due_key, due_in
+    
+    def _worker_loop(self):
+        """Wait for a due batch, then process it (one batch at a time)."""
+        while True:
+            with self._cond:
+                while not self._closed:
+                    key, remaining = self._next_due()
+                    if key is None:
+                        self._cond.wait()
+                    elif remaining <= 0:
+                        break
+                    else:
+                        self._cond.wait(remaining)
+                
+                if self._closed:
+                    return
+                
+                batch = self._batches.pop(key)
+            
+            self._process_batch(batch)
+    
+    def _wait_for_rate_limit(self) -> bool:
+        """Block until the rate limiter allows a request. False if closed meanwhile."""
+        delay = self.rate_limiter.reserve()
+        if delay <= 0:
+            return True
+        
+        self._log(f"Rate limit: waiting {delay:.1f}s...\n")
+        with self._cond:
+            return not self._cond.wait_for(lambda: self._closed, timeout=delay)
+    
+    def _generate(self, content: list, batch: _PendingBatch) -> tuple:
+        """Call Gemini (streaming if any waiter wants chunks). Returns (text, usage)."""
+        chunk_callbacks = [on_chunk for _, on_chunk in batch.waiters if on_chunk]
+        if not chunk_callbacks:
+            response = self._model.generate_content(content)
+            return response.text, get_token_usage(response)
+        
+        response = self._model.generate_content(content, stream=True)
+        parts = []
+        for chunk in response:
+            if batch.cancelled:
+                break  # Stop reading the stream; the result is discarded
+            text = getattr(chunk, 'text', '') or ''
+            if not text:
+                continue
+            parts.append(text)
+            for on_chunk in chunk_callbacks:
+                try:
+                    on_chunk(text)
+                except Exception:
+                    pass
+        return "".join(parts), get_token_usage(response)
+    
+    def _process_batch(self, batch: _PendingBatch):
+        """Send one batch to Gemini (or the cache) and publish the result."""
+        with self._cond:
+            self._active += 1
+            self._in_flight.add(batch)
+        screenshots = batch.images
+        num_images = len(screenshots)
+        model_name = self.model_name
+        prompt = self.prompt if batch.prompt is None else batch.prompt
+        
+        try:
+            if self._model is None:
+                raise RuntimeError("Engine not configured (call configure() first)")
+            
+            content = [prompt]
+            image_hashes = []
+            for i, img in enumerate(screenshots):
+                content.append(img)
+                image_hashes.append(hash_image(img))
+                self._log(f"  Image {i+1}/{num_images} ready\n")
+            
+            cache_key = ResultCache.make_key(model_name, prompt, image_hashes)
+            cached = self.cache.get(cache_key)
+            
+            if cached is not None:
+                result, usage = cached
+                latency_ms = 0
+                self._log(f"\n{num_images} image(s) unchanged - using cached result\n")
+                for _, on_chunk in batch.waiters:
+                    if on_chunk:
+                        on_chunk(result)
+            else:
+                if not self._wait_for_rate_limit() or batch.cancelled:
+                    for future, _ in batch.waiters:
+                        future.cancel()
+                    return
+                
+                self._log(f"\nSending {num_images} image(s) to {model_name}...\n")
+                
+                request_start = time.perf_counter()
+                result, usage = self._generate(content, batch)
+                latency_ms = int((time.perf_counter() - request_start) * 1000)
+                if not batch.cancelled:
+                    self.cache.put(cache_key, result, usage)
+            
+            if batch.cancelled:
+                self._log(f"\nCancelled: result for {num_images} image(s) discarded.\n")
+                for future, _ in batch.waiters:
+                    future.cancel()
+                return
+            
+            timestamp = datetime.now().strftime("%H:%M:%S")
+            self._log(f"\n[{timestamp}] Result ({num_images} images):\n")
+            self._log("-" * 50 + "\n")
+            self._log(f"{result}\n")
+            self._log("-" * 50 + "\n\n")
+            
+            if self.history is not None and cached is None:
+                self.history.add(
+                    model=model_name,
+                    prompt=prompt,
+                    image_hashes=image_hashes,
+                    result=result,
+                    usage=usage,
+                    latency_ms=latency_ms
+                )
+            
+            data = {
+                'timestamp': timestamp,
+                'source': batch.source,
+                'model': model_name,
+                'num_images': num_images,
+                'image_hashes': image_hashes,
+                'result': result,
+                'usage': usage,
+                'latency_ms': latency_ms,
+                'cached': cached is not None,
+            }
+            for future, _ in batch.waiters:
+                if not future.done():
+                    future.set_result(data)
+            
+            if self.on_result:
+                self.on_result(data)
+        
+        except Exception as e:
+            self._log(f"Error: {str(e)}\n")
+            for future, _ in batch.waiters:
+                if not future.done():
+                    future.set_exception(e)
+            if self.on_error:
+                self.on_error(e)
+        finally:
+            with self._cond:
+                self._active -= 1
+                self._in_flight.discard(batch)
+                if batch.source == "capture" and screenshots:
+                    # Keep the last capture batch for resend()
+                    screenshots, self._last_capture = self._last_capture, screenshots
+            self._close_images(screenshots)
+    
+    @staticmethod
+    def _close_images(images: list):
+        for img in images:
+            try:
+                img.close()
+            except Exception:
+                pass
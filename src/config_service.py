@@ -0,0 +1,242 @@
+"""
+Config Service - Cached, Debounced, Atomic config.json
+======================================================
+
+Single owner of the user configuration:
+- Loaded once, served from memory (``get``)
+- ``set``/``update`` only mark keys dirty; the disk write is debounced, so
+  rapid UI changes (theme, duration, model) collapse into one write
+- Writes go through SafeFileWriter (temp file + atomic rename)
+- Before writing, the file is re-read and only the dirty keys are merged
+  in, so two writers (GUI + headless, or two windows) don't clobber each
+  other's settings. Re-read + replace run under an OS lock on
+  ``config.json.lock`` (``msvcrt.locking`` / ``fcntl.flock``), so the
+  processes take turns
+- Per-user location (%APPDATA%\\SnapCapAI\\config.json); a legacy
+  ``config.json`` next to the app / in the working directory is migrated
+  on first start
+"""
+
+import os
+import sys
+import json
+import shutil
+import threading
+from typing import Any, Optional
+
+from src.resource_manager import SafeFileWriter, get_user_data_dir
+
+
+CONFIG_FILENAME = "config.json"
+
+
+def get_config_path() -> str:
+    """Per-user config file path."""
+    return os.path.join(get_user_data_dir(), CONFIG_FILENAME)
+
+
+def _legacy_config_paths() -> list:
+    """Locations older versions read config.json from (CWD, app directory, bundle)."""
+    if getattr(sys, 'frozen', False):
+        app_dir = os.path.dirname(sys.executable)
+    else:
+        app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    
+    candidates = [os.path.abspath(CONFIG_FILENAME), os.path.join(app_dir, CONFIG_FILENAME)]
+    if getattr(sys, '_MEIPASS', None):
+        # config.json bundled into the EXE by SnapCapAI.spec
+        candidates.append(os.path.join(sys._MEIPASS, CONFIG_FILENAME))
+    
+    paths = []
+    for path in candidates:
+        if path not in paths:
+            paths.append(path)
+    return paths
+
+
+class _ProcessLock:
+    """Exclusive OS lock on a lock file, shared by every process (blocking)."""
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._handle = None
+    
+    def __enter__(self):
+        handle = open(self.path, 'a+b')
+        try:
+            if os.name == 'nt':
+                import msvcrt
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)  # Retries for ~10 s, then OSError
+            else:
+                import fcntl
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        except Exception:
+            handle.close()
+            raise
+        self._handle = handle
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        handle, self._handle = self._handle, None
+        try:
+            if os.name == 'nt':
+                import msvcrt
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+        finally:
+            handle.close()
+        return False
+
+
+class ConfigService:
+    """
+    In-memory config with debounced, merged, atomic persistence.
+    
+    Usage:
+        config = ConfigService()
+        theme = config.get('notification_theme', 'dark')
+        config.set('notification_theme', 'white')   # written ~1s later
+        ...
+        config.close()                                # flush on exit
+    """
+    
+    def __init__(self, path: Optional[str] = None, debounce_ms: int = 1000):
+        """
+        Initialize config service.
+        
+        Args:
+            path: Config file (default: per-user config.json, with legacy migration)
+            debounce_ms: Delay after the last change before writing to disk
+        """
+        self._migrate = path is None
+        self.path = os.path.abspath(path) if path else get_config_path()
+        self.debounce_ms = debounce_ms
+        
+        self._lock = threading.RLock()
+        self._data = None
+        self._dirty = set()
+        self._timer = None
+        
+        # Stats
+        self.writes = 0
+    
+    # ==================== LOAD ====================
+    
+    def _migrate_legacy(self):
+        """Copy a legacy config.json to the per-user location (once)."""
+        if os.path.exists(self.path):
+            return
+        for legacy in _legacy_config_paths():
+            if os.path.isfile(legacy) and legacy != self.path:
+                try:
+                    shutil.copy2(legacy, self.path)
+                    print(f"Migrated config from {legacy} to {self.path}")
+                except OSError as e:
+                    print(f"Error migrating config: {e}")
+                return
+    
+    def _read_file(self) -> dict:
+        """Read the config file (missing/invalid file = empty config)."""
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except Exception as e:
+            print(f"Error loading config: {e}")
+            return {}
+    
+    def load(self) -> dict:
+        """Load from disk on first use. Returns a copy of the config."""
+        with self._lock:
+            if self._data is None:
+                if self._migrate:
+                    self._migrate_legacy()
+                self._data = self._read_file()
+            return dict(self._data)
+    
+    # ==================== ACCESS ====================
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a value from memory."""
+        with self._lock:
+            if self._data is None:
+                self.load()
+            return self._data.get(key, default)
+    
+    def set(self, key: str, value: Any):
+        """Set a value (written to disk after the debounce delay)."""
+        self.update({key: value})
+    
+    def update(self, values: dict):
+        """Set several values at once. Unchanged values don't trigger a write."""
+        with self._lock:
+            if self._data is None:
+                self.load()
+            
+            changed = False
+            for key, value in values.items():
+                if key in self._data and self._data[key] == value:
+                    continue
+                self._data[key] = value
+                self._dirty.add(key)
+                changed = True
+            
+            if changed:
+                self._schedule_write()
+    
+    # ==================== PERSISTENCE ====================
+    
+    def _schedule_write(self):
+        """(Re)start the debounce timer (lock held)."""
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(self.debounce_ms / 1000.0, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+    
+    def flush(self) -> bool:
+        """
+        Write dirty keys now (merged into the current file contents).
+        
+        Returns:
+            bool: True if nothing was pending or the write succeeded
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            
+            if not self._dirty:
+                return True
+            
+            try:
+                # Another process must not replace the file between our read and write
+                with _ProcessLock(self.path + ".lock"):
+                    # Re-read so keys written by someone else since our load survive
+                    merged = self._read_file()
+                    for key in self._dirty:
+                        merged[key] = self._data[key]
+                    
+                    with SafeFileWriter(self.path) as f:
+                        json.dump(merged, f, indent=2, ensure_ascii=False)
+            except Exception as e:
+                print(f"Error saving config: {e}")
+                return False
+            
+            # Pick up the other writer's keys too
+            for key, value in merged.items():
+                if key not in self._dirty:
+                    self._data[key] = value
+            self._dirty.clear()
+            self.writes += 1
+            return True
+    
+    def close(self):
+        """Flush pending changes (call on exit)."""
+        self.flush()
@@ -0,0 +1,299 @@
+"""
+Watch-Folder Ingestion
+======================
+
+Analyzes screenshots that other tools drop into a folder:
+
+    python -m snapcapai --headless --watch D:\\Screenshots --concurrency 4
+
+- Filesystem notifications via ``watchdog`` (no directory polling)
+- Files already in the folder are swept once at start
+- Each image goes through CaptureEngine (cache, rate limit, history) as
+  its own analysis, so every file gets its own answer
+- Results are written next to the image as sidecars:
+  ``shot.png`` -> ``shot.png.txt`` (answer) / ``shot.png.json`` (answer + metadata)
+- Files are skipped by content hash, across restarts (HistoryStore
+  ``ingested_files``); renaming or re-saving an identical file does not
+  trigger a new analysis
+
+Requires: pip install watchdog
+"""
+
+import os
+import json
+import time
+import queue
+import threading
+from datetime import datetime
+from typing import Callable, Optional
+
+from src.history_store import hash_file
+from src.resource_manager import SafeFileWriter
+
+
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".bmp", ".gif", ".webp", ".tif", ".tiff"}
+SIDECAR_FORMATS = ("txt", "json", "both")
+
+# Sentinel used to stop the ingest workers
+_STOP = object()
+
+
+def is_image_file(path: str) -> bool:
+    """True for supported image extensions (sidecars and temp files are ignored)."""
+    name = os.path.basename(path)
+    if name.startswith("."):
+        return False
+    return os.path.splitext(name)[1].lower() in IMAGE_EXTENSIONS
+
+
+class FolderWatcher:
+    """
+    Watches a directory and feeds new images into a CaptureEngine.
+    
+    ``concurrency`` ingest workers read, hash and decode files and wait for
+    their analysis, so up to ``concurrency`` files are in flight at once
+    (give the engine at least as many ``workers`` for parallel requests).
+    
+    Usage:
+        watcher = FolderWatcher(engine, history, "D:/Screenshots", concurrency=4)
+        watcher.start()
+        ...
+        watcher.stop()
+    """
+    
+    SETTLE_INTERVAL_S = 0.3   # File size must stay unchanged this long
+    SETTLE_TIMEOUT_S = 30.0   # Give up on files that keep growing
+    RESULT_TIMEOUT_S = 600
+    
+    def __init__(
+        self,
+        engine,
+        history,
+        folder: str,
+        concurrency: int = 2,
+        prompt: Optional[str] = None,
+        sidecar: str = "both",
+        recursive: bool = False,
+        on_log: Optional[Callable[[str], None]] = None
+    ):
+        """
+        Initialize folder watcher.
+        
+        Args:
+            engine: CaptureEngine (must be configured and started)
+            history: HistoryStore for the processed-file index (None = session only)
+            folder: Directory to watch
+            concurrency: Files processed in parallel
+            prompt: Prompt for every file (None = engine prompt)
+            sidecar: "txt", "json" or "both"
+            recursive: Also watch subdirectories
+            on_log: Called with progress messages
+        """
+        if sidecar not in SIDECAR_FORMATS:
+            raise ValueError(f"sidecar must be one of {SIDECAR_FORMATS}")
+        
+        self.engine = engine
+        self.history = history
+        self.folder = os.path.abspath(folder)
+        self.concurrency = max(1, concurrency)
+        self.prompt = prompt
+        self.sidecar = sidecar
+        self.recursive = recursive
+        self.on_log = on_log
+        
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._queued_paths = set()    # Paths waiting in the queue (dedupe bursts of events)
+        self._inflight_hashes = set()  # Same content arriving under two names
+        self._done_hashes = set()      # Finished this session (history write is async)
+        self._observer = None
+        self._workers = []
+        
+        # Stats
+        self.processed = 0
+        self.skipped = 0
+        self.failed = 0
+    
+    def _log(self, message: str):
+        if self.on_log:
+            self.on_log(message)
+    
+    # ==================== LIFECYCLE ====================
+    
+    def start(self):
+        """
+        Sweep existing files and start watching.
+        
+        Raises:
+            RuntimeError: If watchdog is not installed or the folder is missing
+        """
+        try:
+            from watchdog.observers import Observer
+            from watchdog.events import FileSystemEventHandler
+        except ImportError:
+            raise RuntimeError("Watch mode requires watchdog: pip install watchdog")
+        
+        if not os.path.isdir(self.folder):
+            raise RuntimeError(f"Watch folder not found: {self.folder}")
+        
+        watcher = self
+        
+        class _Handler(FileSystemEventHandler):
+            def on_created(self, event):
+                if not event.is_directory:
+                    watcher.enqueue(event.src_path)
+            
+            def on_moved(self, event):
+                # Atomic-rename writers (temp file -> shot.png) show up as moves
+                if not event.is_directory:
+                    watcher.enqueue(event.dest_path)
+            
+            def on_modified(self, event):
+                if not event.is_directory:
+                    watcher.enqueue(event.src_path)
+        
+        for i in range(self.concurrency):
+            worker = threading.Thread(
+                target=self._worker_loop,
+                daemon=True,
+                name=f"FolderIngestWorker-{i}"
+            )
+            worker.start()
+            self._workers.append(worker)
+        
+        self._observer = Observer()
+        self._observer.schedule(_Handler(), self.folder, recursive=self.recursive)
+        self._observer.start()
+        
+        self._sweep()
+        self._log(f"Watching {self.folder} ({self.concurrency} concurrent)\n")
+    
+    def stop(self, timeout: float = 2.0):
+        """Stop watching. Files currently being analyzed are abandoned."""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=timeout)
+            self._observer = None
+        
+        for _ in self._workers:
+            self._queue.put(_STOP)
+        for worker in self._workers:
+            worker.join(timeout=timeout)
+        self._workers = []
+    
+    def _sweep(self):
+        """Queue images that were already in the folder."""
+        if self.recursive:
+            for root, _, files in os.walk(self.folder):
+                for name in sorted(files):
+                    self.enqueue(os.path.join(root, name))
+        else:
+            for entry in sorted(os.scandir(self.folder), key=lambda e: e.name):
+                if entry.is_file():
+                    self.enqueue(entry.path)
+    
+    # ==================== INGESTION ====================
+    
+    def enqueue(self, path: str):
+        """Queue a file for ingestion (ignored if not an image or already queued)."""
+        if not is_image_file(path):
+            return
+        with self._lock:
+            if path in self._queued_paths:
+                return
+            self._queued_paths.add(path)
+        self._queue.put(path)
+    
+    def _worker_loop(self):
+        while True:
+            path = self._queue.get()
+            if path is _STOP:
+                return
+            
+            with self._lock:
+                self._queued_paths.discard(path)
+            
+            try:
+                self._ingest(path)
+            except Exception as e:
+                self.failed += 1
+                self._log(f"[Watch] {os.path.basename(path)}: {e}\n")
+    
+    def _wait_until_stable(self, path: str) -> bool:
+        """Wait until the writer is done (size unchanged). False if vanished / never settled."""
+        deadline = time.monotonic() + self.SETTLE_TIMEOUT_S
+        last_size = -1
+        while time.monotonic() < deadline:
+            try:
+                size = os.path.getsize(path)
+            except OSError:
+                return False
+            if size == last_size and size > 0:
+                return True
+            last_size = size
+            time.sleep(self.SETTLE_INTERVAL_S)
+        
+        self._log(f"[Watch] {os.path.basename(path)}: still being written, skipped\n")
+        return False
+    
+    def _ingest(self, path: str):
+        """Hash, skip-check, analyze and write sidecars for one file."""
+        if not self._wait_until_stable(path):
+            return
+        
+        content_hash = hash_file(path)
+        with self._lock:
+            if content_hash in self._inflight_hashes or content_hash in self._done_hashes:
+                return
+            self._inflight_hashes.add(content_hash)
+        
+        try:
+            if self.history is not None and self.history.is_ingested(content_hash):
+                self.skipped += 1
+                return
+            
+            from PIL import Image
+            image = Image.open(path)
+            image.load()
+            
+            self._log(f"[Watch] Analyzing {os.path.basename(path)}\n")
+            future = self.engine.submit(image, prompt=self.prompt, source="watch", batch=False)
+            data = future.result(timeout=self.RESULT_TIMEOUT_S)
+            
+            self._write_sidecars(path, content_hash, data)
+            if self.history is not None:
+                self.history.mark_ingested(content_hash, path)
+            with self._lock:
+                self._done_hashes.add(content_hash)
+            self.processed += 1
+        finally:
+            with self._lock:
+                self._inflight_hashes.discard(content_hash)
+    
+    def _write_sidecars(self, path: str, content_hash: str, data: dict):
+        """Write ``<image>.txt`` / ``<image>.json`` next to the image."""
+        if self.sidecar in ("txt", "both"):
+            with SafeFileWriter(path + ".txt") as f:
+                f.write(data['result'])
+        
+        if self.sidecar in ("json", "both"):
+            record = {
+                'file': os.path.basename(path),
+                'content_hash': content_hash,
+                'analyzed_at': datetime.now().isoformat(),
+                'model': data['model'],
+                'result': data['result'],
+                'usage': data['usage'],
+                'latency_ms': data['latency_ms'],
+                'cached': data['cached'],
+            }
+            with SafeFileWriter(path + ".json") as f:
+                json.dump(record, f, indent=2, ensure_ascii=False)
+    
+    def stats(self) -> dict:
+        return {
+            'processed': self.processed,
+            'skipped': self.skipped,
+            'failed': self.failed,
+            'queued': self._queue.qsize(),
+        }
@@ -0,0 +1,287 @@
+"""
+Headless Runner - Capture/Analyze Without the GUI
+==================================================
+
+Runs CaptureEngine without customtkinter / a Tk root:
+
+    python -m snapcapai --headless                      # PrtSc via keyboard hook
+    python -m snapcapai --headless --trigger stdin      # Enter = capture
+    python -m snapcapai --headless --trigger interval --interval 10
+    python -m snapcapai --headless --output results.jsonl
+    python -m snapcapai --headless --trigger api --api-port 8765
+    python -m snapcapai --headless --watch D:\\Screenshots --concurrency 4
+
+Triggers:
+- hook:     Low-level keyboard hook (PrtSc, Windows, Admin)
+- stdin:    Empty line = capture screen, image path = analyze file,
+            "flush" = send batch now, "quit" = exit
+- interval: Capture every N seconds
+- api:      No capture trigger, only serve the local HTTP API
+- watch:    Analyze images appearing in --watch DIR (default when --watch is given)
+
+--api-port starts the local HTTP API (src/local_api.py) next to any trigger.
+
+Results are printed to stdout (progress logs go to stderr) and optionally
+appended to a JSONL file.
+Settings not given on the command line are read from the GUI's config.json.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+from datetime import datetime
+from typing import Optional
+
+from src.capture_engine import CaptureEngine
+from src.config_service import ConfigService
+from src.history_store import HistoryStore
+from src.folder_watcher import FolderWatcher, SIDECAR_FORMATS
+from src.local_api import LocalAPIServer, DEFAULT_PORT
+from src.prompt_templates import PROMPT_TEMPLATES, DEFAULT_TEMPLATE, get_template
+from src.resource_manager import get_user_data_dir
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the headless command-line parser."""
+    parser = argparse.ArgumentParser(
+        prog="snapcapai --headless",
+        description="SnapCapAI capture → analyze pipeline without the GUI"
+    )
+    parser.add_argument("--config", help="Config file (default: per-user config.json, shared with the GUI)")
+    parser.add_argument("--api-key", help="Gemini API key (default: config / GEMINI_API_KEY)")
+    parser.add_argument("--model", help="Gemini model (default: config)")
+    parser.add_argument("--template", choices=sorted(PROMPT_TEMPLATES), help="Built-in prompt template")
+    parser.add_argument("--prompt", help="Custom prompt text (overrides --template)")
+    parser.add_argument("--trigger", choices=["hook", "stdin", "interval", "api", "watch"], default=None,
+                        help="What triggers a capture (default: hook, or watch with --watch)")
+    parser.add_argument("--interval", type=float, default=10.0,
+                        help="Seconds between captures for --trigger interval")
+    parser.add_argument("--batch-delay-ms", type=int, default=5000, help="Batch debounce delay")
+    parser.add_argument("--max-batch", type=int, default=10, help="Maximum images per batch")
+    parser.add_argument("--watch", metavar="DIR", help="Analyze images saved into this folder")
+    parser.add_argument("--concurrency", type=int, default=2,
+                        help="Files analyzed in parallel in watch mode (default: 2)")
+    parser.add_argument("--sidecar", choices=SIDECAR_FORMATS, default="both",
+                        help="Sidecar files written next to watched images (default: both)")
+    parser.add_argument("--recursive", action="store_true", help="Also watch subfolders")
+    parser.add_argument("--api-port", type=int, default=None,
+                        help=f"Serve the local HTTP API on 127.0.0.1:PORT (default for --trigger api: {DEFAULT_PORT})")
+    parser.add_argument("--api-token", help="Require this Bearer token on local API requests")
+    parser.add_argument("--rpm", type=float, default=None,
+                        help="Gemini requests per minute (0 = unlimited, default: config or 15)")
+    parser.add_argument("--output", help="Append results as JSON lines to this file")
+    parser.add_argument("--exit-after", type=int, default=0,
+                        help="Exit after N results (0 = run until stopped)")
+    parser.add_argument("--no-history", action="store_true", help="Don't write to the history database")
+    parser.add_argument("--quiet", action="store_true", help="Only print results, no progress logs")
+    return parser
+
+
+class HeadlessRunner:
+    """Wires a CaptureEngine to a trigger and result sinks."""
+    
+    def __init__(self, args: argparse.Namespace, requests_per_minute: float = 15):
+        self.args = args
+        self._output_lock = threading.Lock()
+        self._results = 0
+        self._done = threading.Event()
+        self._hook = None
+        self._api = None
+        self._watcher = None
+        
+        self.history = None
+        if not args.no_history:
+            self.history = HistoryStore(os.path.join(get_user_data_dir(), "history.db"))
+        
+        self.engine = CaptureEngine(
+            history=self.history,
+            batch_delay_ms=args.batch_delay_ms,
+            max_batch_size=args.max_batch,
+            on_log=None if args.quiet else self._log,
+            on_result=self._on_result,
+            on_error=self._on_error,
+            requests_per_minute=requests_per_minute,
+            workers=args.concurrency if args.watch else 1
+        )
+    
+    # ==================== CALLBACKS ====================
+    
+    def _log(self, message: str):
+        sys.stderr.write(message)
+        sys.stderr.flush()
+    
+    def _on_result(self, data: dict):
+        """Print result to stdout and append it to the JSONL output file."""
+        print(f"[{data['timestamp']}] {data['model']} ({data['num_images']} images, "
+              f"{data['latency_ms']} ms)\n{data['result']}\n", flush=True)
+        
+        if self.args.output:
+            record = dict(data, created_at=datetime.now().isoformat())
+            with self._output_lock:
+                with open(self.args.output, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        
+        self._results += 1
+        if self.args.exit_after and self._results >= self.args.exit_after:
+            self._done.set()
+    
+    def _on_error(self, error: Exception):
+        print(f"Analysis error: {error}", file=sys.stderr, flush=True)
+    
+    # ==================== TRIGGERS ====================
+    
+    def _run_hook(self):
+        """PrtSc via the low-level keyboard hook (blocks until done)."""
+        from src.keyboard_hook_manager import KeyboardHookManager
+        
+        self._hook = KeyboardHookManager(callback=lambda event: self.engine.run_action(event.action, event.time))
+        self._hook.start()
+        print("Stealth Mode: ACTIVE - press PrtSc to capture (Ctrl+C to exit)", file=sys.stderr)
+        self._done.wait()
+    
+    def _run_interval(self):
+        """Capture every --interval seconds."""
+        print(f"Capturing every {self.args.interval:g}s (Ctrl+C to exit)", file=sys.stderr)
+        while not self._done.wait(self.args.interval):
+            self.engine.capture()
+    
+    def _run_api(self):
+        """Serve API requests only (blocks until done)."""
+        print("Serving local API only (Ctrl+C to exit)", file=sys.stderr)
+        self._done.wait()
+    
+    def _run_watch(self, prompt: str):
+        """Ingest images from --watch DIR (blocks until done)."""
+        if not self.args.watch:
+            raise RuntimeError("--trigger watch needs --watch DIR")
+        
+        self._watcher = FolderWatcher(
+            self.engine,
+            self.history,
+            self.args.watch,
+            concurrency=self.args.concurrency,
+            prompt=prompt,
+            sidecar=self.args.sidecar,
+            recursive=self.args.recursive,
+            on_log=None if self.args.quiet else self._log
+        )
+        self._watcher.start()
+        print(f"Watching {self._watcher.folder} (Ctrl+C to exit)", file=sys.stderr)
+        self._done.wait()
+    
+    def _start_api(self):
+        port = self.args.api_port
+        if port is None:
+            port = DEFAULT_PORT
+        self._api = LocalAPIServer(
+            self.engine,
+            port=port,
+            token=self.args.api_token,
+            on_log=None if self.args.quiet else self._log
+        )
+        self._api.start()
+        print(f"Local API: {self._api.url}", file=sys.stderr)
+    
+    def _run_stdin(self):
+        """Read commands / image paths from stdin."""
+        from PIL import Image
+        
+        print("Enter = capture, <path> = analyze image, 'flush' = send now, 'quit' = exit",
+              file=sys.stderr)
+        for line in sys.stdin:
+            if self._done.is_set():
+                break
+            
+            command = line.strip()
+            if command in ("q", "quit", "exit"):
+                break
+            elif command in ("f", "flush"):
+                self.engine.flush()
+            elif not command:
+                self.engine.capture()
+            else:
+                try:
+                    image = Image.open(command)
+                    image.load()
+                    self.engine.add_image(image)
+                except Exception as e:
+                    print(f"Cannot open image {command}: {e}", file=sys.stderr)
+        
+        # End of input: send what's left and wait for it
+        self.engine.flush()
+        while self.engine.pending_count() or self.engine.is_processing:
+            time.sleep(0.05)
+    
+    # ==================== MAIN ====================
+    
+    def run(self, api_key: str, model_name: str, prompt: str) -> int:
+        self.engine.configure(api_key, model_name, prompt)
+        self.engine.start()
+        
+        trigger = self.args.trigger or ("watch" if self.args.watch else "hook")
+        
+        try:
+            if self.args.api_port is not None or trigger == "api":
+                self._start_api()
+            
+            if trigger == "hook":
+                self._run_hook()
+            elif trigger == "interval":
+                self._run_interval()
+            elif trigger == "api":
+                self._run_api()
+            elif trigger == "watch":
+                self._run_watch(prompt)
+            else:
+                self._run_stdin()
+        except KeyboardInterrupt:
+            pass
+        except RuntimeError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        finally:
+            if self._watcher:
+                self._watcher.stop()
+                print(f"[Watch] {self._watcher.stats()}", file=sys.stderr)
+            if self._api:
+                self._api.stop()
+            if self._hook:
+                self._hook.stop()
+                print(f"[Hook] {self._hook.dispatcher.stats()}, "
+                      f"hook-to-grab {self.engine.trigger_latency_stats()}", file=sys.stderr)
+            self.engine.close()
+            if self.history:
+                self.history.close()
+        
+        return 0
+
+
+def main(argv: Optional[list] = None) -> int:
+    """Headless entry point."""
+    args = build_parser().parse_args(argv)
+    config = ConfigService(args.config).load()
+    
+    api_key = args.api_key or os.environ.get("GEMINI_API_KEY") or config.get('api_key', '')
+    if not api_key:
+        print("Error: Gemini API key required (--api-key, GEMINI_API_KEY or config.json)", file=sys.stderr)
+        return 2
+    
+    model_name = args.model or config.get('gemini_model', 'gemini-2.5-flash')
+    
+    if args.prompt:
+        prompt = args.prompt
+    elif args.template:
+        prompt = get_template(args.template)
+    else:
+        prompt = config.get('prompt', '') or get_template(DEFAULT_TEMPLATE)
+    
+    requests_per_minute = args.rpm if args.rpm is not None else config.get('requests_per_minute', 15)
+    
+    return HeadlessRunner(args, requests_per_minute).run(api_key, model_name, prompt)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
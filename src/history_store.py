@@ -0,0 +1,463 @@
+"""
+Persistent Analysis History
+Local SQLite store for Gemini analysis results.
+
+Replaces the in-memory ``history`` list so that:
+- Memory stays flat no matter how long the session runs
+- Past answers survive application restarts
+- Writes never block the capture/analysis threads (background writer)
+
+Storage layout:
+- WAL journal mode (readers never block the writer)
+- Result bodies are zlib-compressed
+- Prompt and images are stored as hashes only (no pixel data on disk)
+- Contentless FTS5 index over result and extracted text (full-text search)
+- ``ingested_files``: content hashes of files already analyzed by the
+  watch-folder mode (skip them across restarts)
+"""
+
+import os
+import re
+import time
+import zlib
+import queue
+import sqlite3
+import hashlib
+import threading
+from datetime import datetime
+from typing import Optional
+
+
+SCHEMA_VERSION = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS analyses (
+    id             INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp      TEXT    NOT NULL,
+    model          TEXT    NOT NULL,
+    prompt_hash    TEXT    NOT NULL,
+    image_hashes   TEXT    NOT NULL,
+    num_images     INTEGER NOT NULL,
+    prompt_tokens  INTEGER,
+    output_tokens  INTEGER,
+    total_tokens   INTEGER,
+    latency_ms     INTEGER,
+    result         BLOB    NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_analyses_timestamp ON analyses(timestamp);
+"""
+
+# Contentless: the index stores tokens only, bodies stay compressed in `analyses`.
+# rowid of the FTS row == analyses.id
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS analyses_fts USING fts5(
+    result,
+    extracted_text,
+    content='',
+    tokenize='unicode61 remove_diacritics 2'
+);
+"""
+
+_INGEST_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ingested_files (
+    content_hash   TEXT    PRIMARY KEY,
+    path           TEXT    NOT NULL,
+    ingested_at    TEXT    NOT NULL
+);
+"""
+
+# Sentinel used to stop the writer thread
+_STOP = object()
+
+
+def hash_text(text: str) -> str:
+    """Return a short stable hash for a prompt string."""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def hash_image(image) -> str:
+    """
+    Return a content hash for a PIL image.
+    
+    The hash covers mode, size and raw pixel data, so identical
+    screenshots produce identical hashes.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{image.mode}:{image.size[0]}x{image.size[1]}".encode('ascii'))
+    h.update(image.tobytes())
+    return h.hexdigest()
+
+
+def hash_file(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """Return a content hash of a file's bytes (name/mtime independent)."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def build_fts_query(text: str) -> str:
+    """
+    Convert free-form user input into a safe FTS5 MATCH expression.
+    
+    Every word becomes a quoted prefix term, all terms must match:
+        'gradient desc' -> '"gradient"* "desc"*'
+    """
+    terms = re.findall(r"\w+", text, flags=re.UNICODE)
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def compress_text(text: str) -> bytes:
+    """Compress a result body for storage."""
+    return zlib.compress(text.encode('utf-8'), 6)
+
+
+def decompress_text(blob: bytes) -> str:
+    """Decompress a stored result body."""
+    return zlib.decompress(blob).decode('utf-8')
+
+
+class HistoryStore:
+    """
+    SQLite-backed analysis history with a background writer thread.
+    
+    ``add()`` only enqueues the record and returns immediately. The writer
+    thread drains the queue and commits records in batches.
+    
+    Example:
+        store = HistoryStore("history.db")
+        store.add(model="gemini-2.5-flash", prompt=prompt,
+                  image_hashes=[...], result=text, latency_ms=1200)
+        recent = store.recent(limit=20)
+        store.close()
+    """
+    
+    WRITE_BATCH_SIZE = 64
+    
+    def __init__(self, db_path: str):
+        """
+        Initialize history store.
+        
+        Args:
+            db_path: Path to SQLite database file (created if missing)
+        """
+        self.db_path = db_path
+        db_dir = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(db_dir, exist_ok=True)
+        
+        self._queue = queue.Queue()
+        self._read_lock = threading.Lock()
+        self._read_conn = None
+        self._closed = False
+        self.fts_enabled = False
+        
+        # Create schema synchronously so readers work immediately
+        conn = self._connect()
+        try:
+            self._migrate(conn)
+        finally:
+            conn.close()
+        
+        self._writer = threading.Thread(
+            target=self._writer_loop,
+            daemon=True,
+            name="HistoryWriterThread"
+        )
+        self._writer.start()
+    
+    # ==================== CONNECTION / SCHEMA ====================
+    
+    def _connect(self, shared: bool = False) -> sqlite3.Connection:
+        """Open a connection configured for WAL mode (``shared``: usable from any thread)."""
+        conn = sqlite3.connect(self.db_path, timeout=10.0, check_same_thread=not shared)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+    
+    def _migrate(self, conn: sqlite3.Connection):
+        """Create or upgrade the database schema."""
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version < 1:
+            conn.executescript(_SCHEMA)
+            conn.execute("PRAGMA user_version = 1")
+            conn.commit()
+            version = 1
+        
+        if version < 2:
+            try:
+                conn.executescript(_FTS_SCHEMA)
+                self._backfill_fts(conn)
+                conn.execute("PRAGMA user_version = 2")
+                conn.commit()
+                version = 2
+            except sqlite3.OperationalError as e:
+                # SQLite build without FTS5 - history still works, search doesn't
+                conn.rollback()
+                print(f"[History] Full-text search unavailable: {e}")
+        
+        conn.executescript(_INGEST_SCHEMA)
+        if version == 2:
+            # Only bump past 2 once FTS exists, so a build without FTS5 retries it
+            conn.execute("PRAGMA user_version = 3")
+            version = 3
+        conn.commit()
+        
+        self.fts_enabled = version >= 2
+    
+    def _backfill_fts(self, conn: sqlite3.Connection):
+        """Index records written before the FTS table existed."""
+        rows = conn.execute("SELECT id, result FROM analyses")
+        conn.executemany(
+            "INSERT INTO analyses_fts (rowid, result, extracted_text) VALUES (?, ?, '')",
+            ((row_id, decompress_text(blob)) for row_id, blob in rows)
+        )
+    
+    def _reader(self) -> sqlite3.Connection:
+        """Get the shared read connection (caller must hold _read_lock)."""
+        if self._read_conn is None:
+            # Shared across threads (GUI, API, watch workers) - serialized by _read_lock
+            self._read_conn = self._connect(shared=True)
+            self._read_conn.row_factory = sqlite3.Row
+        return self._read_conn
+    
+    # ==================== WRITE PATH ====================
+    
+    def add(
+        self,
+        model: str,
+        prompt: str,
+        image_hashes: list,
+        result: str,
+        usage: Optional[dict] = None,
+        latency_ms: Optional[int] = None,
+        timestamp: Optional[str] = None,
+        extracted_text: str = ""
+    ):
+        """
+        Queue an analysis record for persistence (non-blocking).
+        
+        Args:
+            model: Gemini model name
+            prompt: Prompt text (stored as hash only)
+            image_hashes: Content hashes of the analyzed images
+            result: Model response text (stored compressed)
+            usage: Token usage dict (prompt_tokens, output_tokens, total_tokens)
+            latency_ms: Request latency in milliseconds
+            timestamp: ISO timestamp (default: now)
+            extracted_text: Extra searchable text (e.g. OCR output), index only
+        """
+        if self._closed:
+            return
+        
+        usage = usage or {}
+        row = (
+            timestamp or datetime.now().isoformat(),
+            model,
+            hash_text(prompt),
+            ",".join(image_hashes),
+            len(image_hashes),
+            usage.get('prompt_tokens'),
+            usage.get('output_tokens'),
+            usage.get('total_tokens'),
+            latency_ms,
+            compress_text(result),
+        )
+        self._queue.put(("analysis", row, result, extracted_text))
+    
+    def mark_ingested(self, content_hash: str, path: str):
+        """Queue a 'file already analyzed' marker (non-blocking)."""
+        if self._closed:
+            return
+        self._queue.put(("ingested", content_hash, path, datetime.now().isoformat()))
+    
+    def _writer_loop(self):
+        """Drain the queue and commit records in batches."""
+        conn = self._connect()
+        try:
+            while True:
+                item = self._queue.get()
+                if item is _STOP:
+                    break
+                
+                batch = [item]
+                stop = False
+                while len(batch) < self.WRITE_BATCH_SIZE:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is _STOP:
+                        stop = True
+                        break
+                    batch.append(item)
+                
+                try:
+                    self._write_batch(conn, batch)
+                except Exception as e:
+                    print(f"[History] Write error: {e}")
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+                
+                if stop:
+                    break
+        finally:
+            conn.close()
+    
+    def _write_batch(self, conn: sqlite3.Connection, batch: list):
+        """Insert a batch of rows (and their FTS entries) in one transaction."""
+        with conn:
+            for item in batch:
+                if item[0] == "ingested":
+                    conn.execute(
+                        "INSERT OR REPLACE INTO ingested_files (content_hash, path, ingested_at) "
+                        "VALUES (?, ?, ?)",
+                        item[1:]
+                    )
+                    continue
+                
+                _, row, result, extracted_text = item
+                cursor = conn.execute(
+                    "INSERT INTO analyses (timestamp, model, prompt_hash, image_hashes, "
+                    "num_images, prompt_tokens, output_tokens, total_tokens, latency_ms, result) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    row
+                )
+                if self.fts_enabled:
+                    conn.execute(
+                        "INSERT INTO analyses_fts (rowid, result, extracted_text) VALUES (?, ?, ?)",
+                        (cursor.lastrowid, result, extracted_text)
+                    )
+    
+    # ==================== READ PATH ====================
+    
+    def _row_to_dict(self, row: sqlite3.Row, include_result: bool = True) -> dict:
+        """Convert a database row to a plain dict."""
+        record = {
+            'id': row['id'],
+            'timestamp': row['timestamp'],
+            'model': row['model'],
+            'prompt_hash': row['prompt_hash'],
+            'image_hashes': row['image_hashes'].split(",") if row['image_hashes'] else [],
+            'num_images': row['num_images'],
+            'prompt_tokens': row['prompt_tokens'],
+            'output_tokens': row['output_tokens'],
+            'total_tokens': row['total_tokens'],
+            'latency_ms': row['latency_ms'],
+        }
+        if include_result:
+            record['result'] = decompress_text(row['result'])
+        return record
+    
+    def recent(self, limit: int = 20, before_id: Optional[int] = None) -> list:
+        """
+        Get most recent records, newest first.
+        
+        Args:
+            limit: Maximum number of records
+            before_id: Only return records with id < before_id (keyset paging)
+        
+        Returns:
+            list: Record dicts including decompressed result
+        """
+        with self._read_lock:
+            conn = self._reader()
+            if before_id is None:
+                rows = conn.execute(
+                    "SELECT * FROM analyses ORDER BY id DESC LIMIT ?", (limit,)
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT * FROM analyses WHERE id < ? ORDER BY id DESC LIMIT ?",
+                    (before_id, limit)
+                ).fetchall()
+            return [self._row_to_dict(row) for row in rows]
+    
+    def search(self, text: str, limit: int = 20, before_id: Optional[int] = None) -> list:
+        """
+        Full-text search over past results, newest first.
+        
+        Args:
+            text: Free-form search text (every word must match, prefix match)
+            limit: Maximum number of records
+            before_id: Only return records with id < before_id (keyset paging)
+        
+        Returns:
+            list: Matching record dicts including decompressed result
+        """
+        match = build_fts_query(text)
+        if not match or not self.fts_enabled:
+            return []
+        
+        with self._read_lock:
+            conn = self._reader()
+            # rowid-ordered scan of the FTS index, joined to the base table
+            query = (
+                "SELECT a.* FROM analyses_fts f JOIN analyses a ON a.id = f.rowid "
+                "WHERE analyses_fts MATCH ?"
+            )
+            params = [match]
+            if before_id is not None:
+                query += " AND f.rowid < ?"
+                params.append(before_id)
+            query += " ORDER BY f.rowid DESC LIMIT ?"
+            params.append(limit)
+            
+            rows = conn.execute(query, params).fetchall()
+            return [self._row_to_dict(row) for row in rows]
+    
+    def get(self, record_id: int) -> Optional[dict]:
+        """Get a single record by id."""
+        with self._read_lock:
+            row = self._reader().execute(
+                "SELECT * FROM analyses WHERE id = ?", (record_id,)
+            ).fetchone()
+            return self._row_to_dict(row) if row else None
+    
+    def is_ingested(self, content_hash: str) -> bool:
+        """True if a file with this content hash was already analyzed."""
+        with self._read_lock:
+            return self._reader().execute(
+                "SELECT 1 FROM ingested_files WHERE content_hash = ?", (content_hash,)
+            ).fetchone() is not None
+    
+    def count(self) -> int:
+        """Get total number of stored records."""
+        with self._read_lock:
+            return self._reader().execute("SELECT COUNT(*) FROM analyses").fetchone()[0]
+    
+    # ==================== LIFECYCLE ====================
+    
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Wait until all queued records are written.
+        
+        Returns:
+            bool: True if the queue drained before timeout
+        """
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return not self._queue.unfinished_tasks
+    
+    def close(self, timeout: float = 5.0):
+        """Flush pending writes and close all connections."""
+        if self._closed:
+            return
+        self._closed = True
+        
+        self._queue.put(_STOP)
+        self._writer.join(timeout=timeout)
+        
+        with self._read_lock:
+            if self._read_conn is not None:
+                self._read_conn.close()
+                self._read_conn = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
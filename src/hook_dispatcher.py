@@ -0,0 +1,184 @@
+"""
+Hook Dispatcher - One Long-Lived Thread for Hook Callbacks
+==========================================================
+
+Every hook source (low-level hook, pynput fallback) posts a
+``HookEvent`` to ONE bounded queue drained by ONE dispatcher thread:
+- Callbacks run in post order, one at a time
+- Posting never blocks the hook thread: if the queue is full the event is
+  dropped and counted (Windows removes hooks that stall)
+- Each event carries the ``time.perf_counter()`` stamp taken in the hook,
+  so later stages can measure hook-to-capture latency
+"""
+
+import queue
+import threading
+import time
+from collections import deque
+from typing import Callable, NamedTuple, Optional
+
+
+class HookEvent(NamedTuple):
+    """An input event handed from a hook to its callback."""
+    action: str      # e.g. "capture", "hotkey"
+    time: float      # time.perf_counter() when the hook saw the key
+    source: str      # "hook" or "pynput"
+
+
+_STOP = object()
+
+
+class HookDispatcher:
+    """
+    Runs hook callbacks on a single dispatcher thread.
+    
+    Usage:
+        dispatcher = HookDispatcher()
+        dispatcher.start()
+        dispatcher.post(on_prtsc, "capture")   # from the hook thread
+        ...
+        dispatcher.stop()
+    """
+    
+    def __init__(self, maxsize: int = 64, latency_samples: int = 256):
+        """
+        Args:
+            maxsize: Events that may wait; more are dropped (never blocks)
+            latency_samples: Recent hook-to-callback delays kept for stats
+        """
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._thread = None
+        self._lock = threading.Lock()
+        self._delays = deque(maxlen=latency_samples)
+        
+        # Stats
+        self.posted = 0
+        self.dispatched = 0
+        self.dropped = 0
+    
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+    
+    def start(self):
+        """Start the dispatcher thread (idempotent)."""
+        with self._lock:
+            if self.running:
+                return
+            self._thread = threading.Thread(target=self._run, daemon=True, name="HookDispatcher")
+            self._thread.start()
+    
+    def stop(self, timeout: float = 2.0):
+        """Run the callbacks already queued, then stop the thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._queue.put(_STOP)  # Blocking put: the stop marker must get in
+        thread.join(timeout=timeout)
+    
+    def post(
+        self,
+        callback: Callable[[HookEvent], None],
+        action: str,
+        source: str = "hook",
+        hook_time: Optional[float] = None
+    ) -> bool:
+        """
+        Queue ``callback(event)`` (any thread, never blocks).
+        
+        Args:
+            callback: Called on the dispatcher thread with the HookEvent
+            action: Event name passed along in the HookEvent
+            source: Which hook produced it
+            hook_time: perf_counter() stamp of the input (default: now)
+        
+        Returns:
+            bool: False if the queue was full and the event was dropped
+        """
+        event = HookEvent(action, time.perf_counter() if hook_time is None else hook_time, source)
+        try:
+            self._queue.put_nowait((callback, event))
+        except queue.Full:
+            self.dropped += 1
+            return False
+        self.posted += 1
+        return True
+    
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            callback, event = item
+            self._delays.append(time.perf_counter() - event.time)
+            try:
+                callback(event)
+            except Exception as e:
+                print(f"[HookDispatcher] {event.action} callback error: {e}")
+            self.dispatched += 1
+    
+    def stats(self) -> dict:
+        delays = sorted(self._delays)
+        return {
+            'posted': self.posted,
+            'dispatched': self.dispatched,
+            'dropped': self.dropped,
+            'delay_p50_ms': round(delays[len(delays) // 2] * 1000, 3) if delays else None,
+            'delay_max_ms': round(delays[-1] * 1000, 3) if delays else None,
+        }
+
+
+# ==================== BENCHMARK ====================
+if __name__ == "__main__":
+    bursts, burst_size = 200, 10
+    
+    def run_threads(callback):
+        """Old path: one thread per event."""
+        threads = []
+        for i in range(burst_size):
+            thread = threading.Thread(target=callback, args=(i,), daemon=True)
+            thread.start()
+            threads.append(thread)
+        for thread in threads:
+            thread.join()
+    
+    seen = []
+    start = time.perf_counter()
+    for _ in range(bursts):
+        run_threads(seen.append)
+    thread_s = time.perf_counter() - start
+    thread_in_order = seen == list(range(burst_size)) * bursts
+    
+    dispatcher = HookDispatcher(maxsize=burst_size * bursts)
+    dispatcher.start()
+    order = []
+    start = time.perf_counter()
+    for i in range(bursts * burst_size):
+        dispatcher.post(lambda event, i=i: order.append(i), "capture")
+    dispatcher.stop()
+    dispatcher_s = time.perf_counter() - start
+    
+    events = bursts * burst_size
+    print("=" * 60)
+    print("  HOOK DISPATCH BENCHMARK")
+    print("=" * 60)
+    print(f"  thread per event: {thread_s / events * 1e6:7.1f} us/event, in order: {thread_in_order}")
+    print(f"  dispatcher:       {dispatcher_s / events * 1e6:7.1f} us/event, "
+          f"in order: {order == list(range(events))}")
+    print(f"  {dispatcher.stats()}")
+    assert order == list(range(events))
+    assert dispatcher.dispatched == dispatcher.posted == events and dispatcher.dropped == 0
+    
+    # A stalled callback never blocks posting: overflow is dropped and counted
+    release = threading.Event()
+    stalled = HookDispatcher(maxsize=4)
+    stalled.start()
+    stalled.post(lambda event: release.wait(), "capture")
+    time.sleep(0.05)  # The dispatcher thread is now stuck in the first callback
+    accepted = [stalled.post(lambda event: None, "capture") for _ in range(10)]
+    release.set()
+    stalled.stop()
+    print(f"  stalled callback, 10 more posts into maxsize=4: {accepted.count(False)} dropped, "
+          f"{stalled.dispatched} dispatched")
+    assert accepted == [True] * 4 + [False] * 6 and stalled.dropped == 6 and stalled.dispatched == 5
@@ -2,7 +2,7 @@
 HUD Notification Overlay - Anti-Detection Result Display
 =========================================================
 
-A stealth notification overlay designed for displaying AI results over 
+A stealth notification overlay designed for displaying AI results over
 full-screen applications without triggering focus detection.
 
 Critical Anti-Detection Features:
@@ -16,36 +16,67 @@ Critical Anti-Detection Features:
 Window Behavior:
 - Appears instantly or with fade-in
 - NEVER steals focus (browser.onblur will NOT trigger)
-- Auto-destroys after exactly 3 seconds
+- Auto-hides after the notification duration
 - 85% opacity dark HUD aesthetic
 - Click-through: mouse events pass to underlying window
+
+Persistent overlay:
+- ONE window, created once: the extended styles are applied once and the
+  widgets are built once; each notification only swaps text and colors
+- Hidden with withdraw() instead of destroyed
+- Fade and countdown run on a shared AnimationClock (one frame timer,
+  configurable fps, 0 = no animation)
+- Work area (SystemParametersInfo) is cached and refreshed only when
+  Windows reports a display / work-area change (WM_DISPLAYCHANGE,
+  WM_SETTINGCHANGE), so bursts of results don't re-query it
+
+Paged results:
+- The full result is shown (no truncation), pre-split into pages ONCE per
+  result using cached text measurements for the HUD font and width
+  (src.text_layout)
+- ``next_page()`` / ``prev_page()`` swap the label text in place (bound to
+  hotkeys by the app) - no window rebuild, no re-layout
+
+Bitmap renderer (``renderer="bitmap"``, Windows):
+- No widget tree: the notification is drawn into one RGBA image by
+  src.hud_renderer and pushed with UpdateLayeredWindow (per-pixel alpha)
+- Fades change the blend constant only; countdown frames re-send only the
+  2px countdown strip
+- Falls back to the widget renderer if Pillow or the layered window
+  setup is unavailable
 """
 
 import tkinter as tk
+import tkinter.font as tkfont
 import ctypes
 from ctypes import wintypes
-from typing import Optional, Literal
+from typing import Callable, Optional, Literal
 from datetime import datetime
 
+from src.animation_clock import AnimationClock
+from src.text_layout import TextMeasurer, layout_pages
+from src.hud_renderer import HUDRenderer, LayeredWindowPresenter
 
-class HUDNotification(tk.Toplevel):
+
+class HUDOverlay(tk.Toplevel):
     """
-    Stealth HUD Notification Overlay.
+    Persistent Stealth HUD Notification Overlay.
     
     Displays AI analysis results in a game-HUD style overlay that:
     - Stays above full-screen browsers
     - NEVER steals focus (critical for anti-detection)
     - Allows click-through to underlying windows
-    - Auto-dismisses after duration
+    - Auto-hides after duration (the window is reused for the next one)
     
     Usage:
-        notif = HUDNotification(
-            parent=root,
+        hud = HUDOverlay(parent=root, position="bottom-right")
+        hud.show(
             title="✅ Analysis Complete",
             message="The answer is: 42",
             duration_ms=3000,
             notification_type="success"
         )
+        hud.hide()
     """
     
     # ==================== WINDOWS API CONSTANTS ====================
@@ -64,6 +95,13 @@ class HUDNotification(tk.Toplevel):
     SWP_SHOWWINDOW = 0x0040
     HWND_TOPMOST = -1
     
+    # Display change notifications (window procedure subclass)
+    GWLP_WNDPROC = -4
+    WM_DISPLAYCHANGE = 0x007E
+    WM_SETTINGCHANGE = 0x001A
+    SPI_GETWORKAREA = 0x0030
+    SPI_SETWORKAREA = 0x002F
+    
     # ==================== HUD COLOR THEMES ====================
     # Two preset themes: White (light) and Dark (black)
     COLOR_THEMES = {
@@ -121,76 +159,101 @@ class HUDNotification(tk.Toplevel):
         'warning': '⚠',
     }
     
+    MESSAGE_FONT = ('Segoe UI', 13, 'bold')
+    MESSAGE_PADDING = 50  # Horizontal padding around the message text
+    MAX_PAGE_LINES = 12   # Lines per page (less on small work areas)
+    ALPHA = 0.90          # Visible opacity
+    FADE_IN_MS = 180
+    FADE_OUT_MS = 250
+    
     def __init__(
         self,
         parent: tk.Tk,
-        title: str,
-        message: str,
-        duration_ms: int = 3000,
-        notification_type: Literal["success", "error", "info", "warning"] = "success",
         width: int = 500,
         position: Literal["center", "top-center", "bottom-right"] = "top-center",
         click_through: bool = True,
-        fade_in: bool = False,
-        color_theme: Literal["white", "dark"] = "white"
+        color_theme: Literal["white", "dark"] = "white",
+        on_hidden: Optional[Callable[[], None]] = None,
+        clock: Optional[AnimationClock] = None,
+        renderer: Literal["widgets", "bitmap"] = "widgets"
     ):
         """
-        Initialize HUD notification overlay.
+        Initialize HUD overlay (hidden until ``show()``).
         
         Args:
             parent: Parent Tk window (can be hidden)
-            title: Notification title (displayed in accent color)
-            message: Main message content (displayed in high-contrast)
-            duration_ms: Auto-close after this many milliseconds (default: 3000 = 3s)
-            notification_type: Visual style - "success", "error", "info", "warning"
             width: Notification width in pixels
             position: Screen position - "center", "top-center", "bottom-right"
             click_through: If True, mouse clicks pass through to window below
-            fade_in: If True, fade in animation; otherwise instant appear
             color_theme: Color scheme - "white" (light) or "dark" (black)
+            on_hidden: Called (Tk thread) when a notification is hidden
+            clock: Shared AnimationClock for fades/countdown (default: own 30 fps clock)
+            renderer: "widgets" (Tk labels) or "bitmap" (pre-rendered layered window)
         """
         super().__init__(parent)
         
-        # Apply color theme
         self.COLORS = self.COLOR_THEMES.get(color_theme, self.COLOR_THEMES['white'])
-        self.notification_type = notification_type
-        self.duration_ms = duration_ms
+        self.color_theme = color_theme
+        self.notification_type = "success"
+        self.duration_ms = 3000
         self.width = width
         self.position = position
         self.click_through = click_through
-        self.fade_in = fade_in
+        self.fade_in = False
+        self.on_hidden = on_hidden
+        self.is_visible = False
         self.is_closing = False
         self._hwnd = None
-        
-        # Get accent color for this notification type
-        color_key = self.TYPE_COLORS.get(notification_type, 'neon_green')
-        self.accent_color = self.COLORS[color_key]
-        self.icon = self.TYPE_ICONS.get(notification_type, '•')
+        self._geometry = None
+        self._dismiss_job = None
+        self._fade_anim = None
+        self._countdown_anim = None
+        self._countdown_width = width
+        self._alpha = self.ALPHA
+        self._title_text = ""
+        self._time_text = ""
+        self._bitmap = None          # HUDRenderer (bitmap renderer only)
+        self._presenter = None       # LayeredWindowPresenter (bitmap renderer only)
+        self._bitmap_position = (0, 0)
+        self._pages = [""]
+        self.page_index = 0
+        self.clock = clock or AnimationClock(self, fps=30)
+        
+        # Work area cache (refreshed on display change)
+        self._work_area = None
+        self._screen_size = None
+        self._wndproc = None
+        self._old_wndproc = None
+        
+        # Stats
+        self.shows = 0
+        self.work_area_queries = 0
+        self.page_turns = 0
+        
+        self.accent_color = self.COLORS[self.TYPE_COLORS['success']]
+        self.icon = self.TYPE_ICONS['success']
         
         # ===== STEP 1: Configure Tkinter window properties =====
         self._setup_tkinter_window()
         
-        # ===== STEP 2: Create HUD UI elements =====
-        self._create_hud_ui(title, message)
-        
-        # ===== STEP 3: Position window on screen =====
-        self._position_on_screen()
-        
-        # ===== STEP 4: Apply Windows extended styles (CRITICAL) =====
+        # ===== STEP 2: Apply Windows extended styles (CRITICAL, once) =====
         self._apply_stealth_window_styles()
         
-        # ===== STEP 5: Show window and start auto-dismiss timer =====
-        self._show_and_start_timer()
+        # ===== STEP 3: Bitmap renderer, or HUD UI elements (once) =====
+        if renderer == "bitmap":
+            self._setup_bitmap_renderer()
+        if self._bitmap is None:
+            self._create_hud_ui()
+        self.renderer = "bitmap" if self._bitmap is not None else "widgets"
+        
+        # ===== STEP 4: Refresh cached work area on display changes =====
+        self._install_display_change_hook()
     
     def _setup_tkinter_window(self):
         """Configure base Tkinter window properties."""
         # Remove window decorations (title bar, borders)
         self.overrideredirect(True)
         
-        # Set initial opacity (0 if fading in, otherwise 90%)
-        initial_alpha = 0.0 if self.fade_in else 0.90
-        self.attributes('-alpha', initial_alpha)
-        
         # Set topmost (backup - Windows API will also set this)
         self.attributes('-topmost', True)
         
@@ -203,7 +266,7 @@ class HUDNotification(tk.Toplevel):
         # Withdraw initially to prevent flash
         self.withdraw()
     
-    def _create_hud_ui(self, title: str, message: str):
+    def _create_hud_ui(self):
         """
         Create HUD-style UI with high-contrast typography.
         
@@ -223,114 +286,201 @@ class HUDNotification(tk.Toplevel):
         └─────────────────────────────────────┘
         """
         # Main container
-        main_frame = tk.Frame(self, bg=self.COLORS['bg_dark'])
-        main_frame.pack(fill='both', expand=True)
+        self.main_frame = tk.Frame(self)
+        self.main_frame.pack(fill='both', expand=True)
         
         # ===== TOP ACCENT BAR (4px) =====
-        accent_bar = tk.Frame(main_frame, bg=self.accent_color, height=4)
-        accent_bar.pack(fill='x', side='top')
-        accent_bar.pack_propagate(False)
+        self.accent_bar = tk.Frame(self.main_frame, height=4)
+        self.accent_bar.pack(fill='x', side='top')
+        self.accent_bar.pack_propagate(False)
         
         # ===== CONTENT AREA =====
-        content_frame = tk.Frame(main_frame, bg=self.COLORS['bg_dark'])
-        content_frame.pack(fill='both', expand=True, padx=20, pady=15)
+        self.content_frame = tk.Frame(self.main_frame)
+        self.content_frame.pack(fill='both', expand=True, padx=20, pady=15)
         
         # ----- Header Row (Icon + Title + Timestamp) -----
-        header_frame = tk.Frame(content_frame, bg=self.COLORS['bg_dark'])
-        header_frame.pack(fill='x', pady=(0, 10))
+        self.header_frame = tk.Frame(self.content_frame)
+        self.header_frame.pack(fill='x', pady=(0, 10))
         
         # Icon + Title (left side)
-        title_text = f"{self.icon}  {title}"
-        title_label = tk.Label(
-            header_frame,
-            text=title_text,
+        self.title_label = tk.Label(
+            self.header_frame,
             font=('Consolas', 14, 'bold'),
-            fg=self.accent_color,
-            bg=self.COLORS['bg_dark'],
             anchor='w'
         )
-        title_label.pack(side='left')
+        self.title_label.pack(side='left')
         
         # Timestamp (right side)
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        time_label = tk.Label(
-            header_frame,
-            text=timestamp,
+        self.time_label = tk.Label(
+            self.header_frame,
+            font=('Consolas', 10),
+            anchor='e'
+        )
+        self.time_label.pack(side='right')
+        
+        # Page indicator "2/5" (left of timestamp, empty for single page)
+        self.page_label = tk.Label(
+            self.header_frame,
             font=('Consolas', 10),
-            fg=self.COLORS['text_dim'],
-            bg=self.COLORS['bg_dark'],
             anchor='e'
         )
-        time_label.pack(side='right')
+        self.page_label.pack(side='right', padx=(0, 10))
         
         # ----- Separator Line -----
-        separator = tk.Frame(content_frame, bg=self.COLORS['border'], height=1)
-        separator.pack(fill='x', pady=(0, 12))
+        self.separator = tk.Frame(self.content_frame, height=1)
+        self.separator.pack(fill='x', pady=(0, 12))
         
         # ----- Message Area (HIGH CONTRAST) -----
         # This is where the AI result is displayed
         # Use large, bold, high-contrast text for instant readability
-        
-        # Truncate very long messages
-        max_chars = 500
-        display_message = message[:max_chars] + "..." if len(message) > max_chars else message
-        
-        message_label = tk.Label(
-            content_frame,
-            text=display_message,
-            font=('Segoe UI', 13, 'bold'),  # Large, bold for readability
-            fg=self.COLORS['neon_yellow'],  # HIGH CONTRAST - Neon Yellow
-            bg=self.COLORS['bg_dark'],
+        self.message_font = tkfont.Font(self, font=self.MESSAGE_FONT)  # Large, bold for readability
+        self.message_label = tk.Label(
+            self.content_frame,
+            font=self.message_font,
             justify='left',
-            wraplength=self.width - 50,
+            wraplength=self.width - self.MESSAGE_PADDING,
             anchor='nw'
         )
-        message_label.pack(fill='both', expand=True, pady=(0, 10))
+        self.message_label.pack(fill='both', expand=True, pady=(0, 10))
+        
+        # Width cache for the message font (shared by every result)
+        self.text_measurer = TextMeasurer(
+            self.message_font.measure,
+            self.message_font.metrics('linespace')
+        )
         
         # ===== BOTTOM COUNTDOWN BAR (2px) =====
-        self.countdown_frame = tk.Frame(main_frame, bg=self.accent_color, height=2)
+        self.countdown_frame = tk.Frame(self.main_frame, height=2)
         self.countdown_frame.pack(fill='x', side='bottom')
         self.countdown_frame.pack_propagate(False)
         
-        # Store reference for countdown animation
-        self._countdown_start = None
+        self._apply_colors()
     
-    def _position_on_screen(self):
-        """Position the notification window on screen."""
-        # Update to calculate actual dimensions
-        self.update_idletasks()
+    def _setup_bitmap_renderer(self):
+        """Create the PIL renderer + layered window presenter (falls back to widgets on failure)."""
+        try:
+            if not self._hwnd:
+                raise RuntimeError("no window handle")
+            presenter = LayeredWindowPresenter(self._hwnd)
+            self._bitmap = HUDRenderer(width=self.width, colors=self.COLORS)
+            self._presenter = presenter
+        except Exception as e:
+            self._bitmap = None
+            self._presenter = None
+            print(f"[HUD] Bitmap renderer unavailable, using widgets: {e}")
+    
+    def _apply_colors(self):
+        """Apply theme + notification type colors to the existing widgets."""
+        bg = self.COLORS['bg_dark']
+        self.configure(bg=bg)
+        for frame in (self.main_frame, self.content_frame, self.header_frame):
+            frame.configure(bg=bg)
+        
+        self.accent_bar.configure(bg=self.accent_color)
+        self.countdown_frame.configure(bg=self.accent_color)
+        self.separator.configure(bg=self.COLORS['border'])
+        self.title_label.configure(fg=self.accent_color, bg=bg)
+        self.time_label.configure(fg=self.COLORS['text_dim'], bg=bg)
+        self.page_label.configure(fg=self.COLORS['text_dim'], bg=bg)
+        self.message_label.configure(fg=self.COLORS['neon_yellow'], bg=bg)  # HIGH CONTRAST
+    
+    # ==================== WORK AREA CACHE ====================
+    
+    def _query_work_area(self) -> tuple:
+        """Query (left, top, width, height) of the work area (excludes taskbar)."""
+        self.work_area_queries += 1
+        try:
+            rect = wintypes.RECT()
+            if not ctypes.windll.user32.SystemParametersInfoW(
+                self.SPI_GETWORKAREA, 0, ctypes.byref(rect), 0
+            ):
+                raise OSError("SystemParametersInfoW failed")
+            return (rect.left, rect.top, rect.right - rect.left, rect.bottom - rect.top)
+        except Exception:
+            # Fallback to basic screen dimensions
+            return (0, 0, self.winfo_screenwidth(), self.winfo_screenheight())
+    
+    def get_work_area(self) -> tuple:
+        """Cached work area (re-queried only after a display change)."""
+        if self._wndproc is None:
+            # No display-change notifications: detect resolution changes cheaply
+            screen_size = (self.winfo_screenwidth(), self.winfo_screenheight())
+            if screen_size != self._screen_size:
+                self._screen_size = screen_size
+                self._work_area = None
+        
+        if self._work_area is None:
+            self._work_area = self._query_work_area()
+        return self._work_area
+    
+    def invalidate_work_area(self):
+        """Force the work area to be re-queried on the next show."""
+        self._work_area = None
+    
+    def _install_display_change_hook(self):
+        """
+        Subclass the window procedure to hear WM_DISPLAYCHANGE /
+        WM_SETTINGCHANGE(SPI_SETWORKAREA). Both are broadcast to top-level
+        windows, including hidden ones.
+        """
+        if not self._hwnd:
+            return
         
-        # Get screen dimensions - use work area to account for taskbar
         try:
-            # Try to get work area (excludes taskbar)
-            import ctypes
-            from ctypes import wintypes
+            user32 = ctypes.windll.user32
+            LRESULT = ctypes.c_ssize_t
+            WNDPROC = ctypes.WINFUNCTYPE(LRESULT, wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM)
             
-            class RECT(ctypes.Structure):
-                _fields_ = [
-                    ('left', ctypes.c_long),
-                    ('top', ctypes.c_long),
-                    ('right', ctypes.c_long),
-                    ('bottom', ctypes.c_long)
-                ]
+            set_window_long = getattr(user32, 'SetWindowLongPtrW', None) or user32.SetWindowLongW
+            set_window_long.restype = ctypes.c_void_p
+            set_window_long.argtypes = [wintypes.HWND, ctypes.c_int, ctypes.c_void_p]
+            user32.CallWindowProcW.restype = LRESULT
+            user32.CallWindowProcW.argtypes = [
+                ctypes.c_void_p, wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM
+            ]
             
-            rect = RECT()
-            ctypes.windll.user32.SystemParametersInfoW(0x0030, 0, ctypes.byref(rect), 0)  # SPI_GETWORKAREA
+            def window_proc(hwnd, msg, wparam, lparam):
+                if msg == self.WM_DISPLAYCHANGE or (
+                    msg == self.WM_SETTINGCHANGE and wparam == self.SPI_SETWORKAREA
+                ):
+                    self._work_area = None  # Only a flag - re-queried on next show
+                return user32.CallWindowProcW(self._old_wndproc, hwnd, msg, wparam, lparam)
             
-            screen_width = rect.right - rect.left
-            screen_height = rect.bottom - rect.top
-            work_left = rect.left
-            work_top = rect.top
-        except:
-            # Fallback to basic screen dimensions
-            screen_width = self.winfo_screenwidth()
-            screen_height = self.winfo_screenheight()
-            work_left = 0
-            work_top = 0
-        
-        # Get window dimensions - use reqheight first, then actual height
+            # Keep a reference - the callback must outlive the window
+            self._wndproc = WNDPROC(window_proc)
+            self._set_window_long = set_window_long
+            self._old_wndproc = set_window_long(
+                self._hwnd, self.GWLP_WNDPROC, ctypes.cast(self._wndproc, ctypes.c_void_p)
+            )
+            if not self._old_wndproc:
+                raise OSError("SetWindowLongPtrW failed")
+        except Exception as e:
+            self._wndproc = None
+            self._old_wndproc = None
+            print(f"[HUD] Display change hook unavailable ({e}) - using screen size check")
+    
+    def _remove_display_change_hook(self):
+        if self._wndproc is not None and self._old_wndproc:
+            try:
+                self._set_window_long(self._hwnd, self.GWLP_WNDPROC, self._old_wndproc)
+            except Exception:
+                pass
+        self._wndproc = None
+        self._old_wndproc = None
+    
+    def _position_on_screen(self):
+        """Position the notification window on screen (no-op if unchanged)."""
+        work_left, work_top, screen_width, screen_height = self.get_work_area()
         win_width = self.width
-        win_height = max(self.winfo_reqheight(), 150)  # Minimum height fallback
+        
+        if self._bitmap is not None:
+            # Size is known from the rendered frame - no Tk layout pass
+            win_height = self._bitmap.size[1]
+        else:
+            # Update to calculate actual dimensions of the new content
+            self.update_idletasks()
+            # Get window dimensions - use reqheight first, then actual height
+            win_height = max(self.winfo_reqheight(), 150)  # Minimum height fallback
         
         # Calculate position based on setting
         if self.position == "center":
@@ -351,8 +501,16 @@ class HUDNotification(tk.Toplevel):
         x = max(0, x)
         y = max(0, y)
         
-        # Set geometry
-        self.geometry(f'{win_width}x{win_height}+{x}+{y}')
+        if self._bitmap is not None:
+            # Applied by UpdateLayeredWindow in _present()
+            self._bitmap_position = (x, y)
+            return
+        
+        # Set geometry only when it changed
+        geometry = f'{win_width}x{win_height}+{x}+{y}'
+        if geometry != self._geometry:
+            self._geometry = geometry
+            self.geometry(geometry)
     
     def _apply_stealth_window_styles(self):
         """
@@ -381,7 +539,7 @@ class HUDNotification(tk.Toplevel):
             
             # Get current extended style
             current_style = ctypes.windll.user32.GetWindowLongW(
-                self._hwnd, 
+                self._hwnd,
                 self.GWL_EXSTYLE
             )
             
@@ -399,109 +557,308 @@ class HUDNotification(tk.Toplevel):
                 new_style
             )
             
-            # Use SetWindowPos to ensure TOPMOST without activating
+            print(f"[HUD] Stealth styles applied successfully (HWND: {self._hwnd})")
+        
+        except Exception as e:
+            self._hwnd = None
+            print(f"[HUD] Warning: Could not apply stealth styles: {e}")
+    
+    def _raise_topmost(self):
+        """Re-assert TOPMOST without activating (full-screen apps may cover us)."""
+        if not self._hwnd:
+            return
+        try:
             ctypes.windll.user32.SetWindowPos(
                 self._hwnd,
                 self.HWND_TOPMOST,  # Place at top of Z-order
                 0, 0, 0, 0,         # Don't change position/size
                 self.SWP_NOMOVE | self.SWP_NOSIZE | self.SWP_NOACTIVATE | self.SWP_SHOWWINDOW
             )
-            
-            print(f"[HUD] Stealth styles applied successfully (HWND: {self._hwnd})")
-            
-        except Exception as e:
-            print(f"[HUD] Warning: Could not apply stealth styles: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            pass
+    
+    # ==================== SHOW / HIDE ====================
+    
+    def show(
+        self,
+        title: str,
+        message: str,
+        duration_ms: int = 3000,
+        notification_type: Literal["success", "error", "info", "warning"] = "success",
+        fade_in: bool = False,
+        color_theme: Optional[Literal["white", "dark"]] = None
+    ):
+        """
+        Show a notification, replacing the current one in place.
+        
+        The message is laid out into pages once here; ``next_page()`` /
+        ``prev_page()`` only swap the page text.
+        
+        Args:
+            title: Notification title (displayed in accent color)
+            message: Main message content, full length (displayed in high-contrast)
+            duration_ms: Auto-hide after this many milliseconds (default: 3000 = 3s)
+            notification_type: Visual style - "success", "error", "info", "warning"
+            fade_in: If True, fade in animation; otherwise instant appear
+            color_theme: Switch color scheme (None = keep current)
+        """
+        self._cancel_jobs()
+        self.is_closing = False
+        self.shows += 1
+        
+        if color_theme and color_theme != self.color_theme:
+            self.color_theme = color_theme
+            self.COLORS = self.COLOR_THEMES.get(color_theme, self.COLOR_THEMES['white'])
+        
+        self.notification_type = notification_type
+        self.duration_ms = duration_ms
+        self.fade_in = fade_in
+        color_key = self.TYPE_COLORS.get(notification_type, 'neon_green')
+        self.accent_color = self.COLORS[color_key]
+        self.icon = self.TYPE_ICONS.get(notification_type, '•')
+        self._title_text = f"{self.icon}  {title}"
+        self._time_text = datetime.now().strftime("%H:%M:%S")
+        
+        # Layout once per result: wrap + split into pages
+        if self._bitmap is not None:
+            self._bitmap.set_theme(self.COLORS)
+            self._pages = self._bitmap.layout(
+                message, self._page_lines(self._bitmap.line_heights['message'])
+            )
+        else:
+            self._apply_colors()
+            line_height = self.text_measurer.line_height
+            self._pages = layout_pages(
+                message,
+                self.width - self.MESSAGE_PADDING,
+                self._page_lines(line_height) * line_height,
+                self.text_measurer
+            )
+            self.title_label.configure(text=self._title_text)
+            self.time_label.configure(text=self._time_text)
+        self.page_index = 0
+        self._show_page()
+        
+        self._position_on_screen()
+        self._show_and_start_timer()
+    
+    # ==================== PAGING ====================
+    
+    def _page_lines(self, line_height: int) -> int:
+        """Message lines per page, from the cached work area."""
+        _, _, _, work_height = self.get_work_area()
+        # Leave room for header, padding and a margin around the HUD
+        fit_lines = (work_height // 2 - 120) // max(1, line_height)
+        return max(3, min(self.MAX_PAGE_LINES, fit_lines))
+    
+    @property
+    def page_count(self) -> int:
+        return len(self._pages)
+    
+    def _show_page(self):
+        """Put the current page's pre-computed text into the label (or render it)."""
+        if self._bitmap is not None:
+            self._bitmap.render(
+                self._title_text, self._pages, self.page_index, self._time_text, self.accent_color
+            )
+            return
+        
+        self.message_label.configure(text=self._pages[self.page_index])
+        if len(self._pages) > 1:
+            self.page_label.configure(text=f"{self.page_index + 1}/{len(self._pages)}")
+        else:
+            self.page_label.configure(text="")
+    
+    def _turn_page(self, step: int) -> bool:
+        if not self.is_visible or self.is_closing:
+            return False
+        index = self.page_index + step
+        if index < 0 or index >= len(self._pages):
+            return False
+        
+        self.page_index = index
+        self.page_turns += 1
+        
+        # Reading: restart the auto-dismiss timer and countdown for this page
+        self._cancel_jobs()
+        self._show_page()
+        if self._bitmap is not None:
+            self._alpha = self.ALPHA
+            self._present()  # New page + full opacity in one update
+        else:
+            self._set_alpha(self.ALPHA)
+        self._start_timer()
+        return True
+    
+    def next_page(self) -> bool:
+        """Show the next page. Returns False if on the last page / hidden."""
+        return self._turn_page(1)
+    
+    def prev_page(self) -> bool:
+        """Show the previous page. Returns False if on the first page / hidden."""
+        return self._turn_page(-1)
     
     def _show_and_start_timer(self):
         """Show the window and start the auto-dismiss timer."""
-        # Make window visible
-        self.deiconify()
-        
-        # Lift to top (Tkinter level)
+        if self.fade_in and self.clock.enabled:
+            self._alpha = 0.0
+            if self._bitmap is None:
+                self.attributes('-alpha', 0.0)
+        elif self._bitmap is not None:
+            self._alpha = self.ALPHA  # Presented below with final opacity
+        
+        if not self.is_visible:
+            # Make window visible
+            self.deiconify()
+            self.is_visible = True
+        
+        if self._bitmap is not None:
+            # One UpdateLayeredWindow: pixels, size, position and opacity
+            self._present()
+        
+        # Lift to top (Tkinter level) and re-assert TOPMOST without activating
         self.lift()
+        self._raise_topmost()
         
         if self.fade_in:
-            # Start fade-in animation
-            self._fade_in_step(0.0)
-        else:
+            # Fade in on the shared clock (instant when animation is off)
+            self._fade_anim = self.clock.animate(self.FADE_IN_MS, self._set_alpha_progress)
+        elif self._bitmap is None:
             # Set final opacity immediately (90%)
-            self.attributes('-alpha', 0.90)
+            self._set_alpha(self.ALPHA)
+        
+        self._start_timer()
+    
+    def _start_timer(self):
+        """Start the countdown bar and the auto-dismiss timer."""
+        if self._bitmap is None:
+            self.countdown_frame.configure(width=self.width)
+        self._countdown_width = self.width  # Bitmap frames are rendered with a full bar
         
-        # Start countdown animation
-        self._countdown_start = datetime.now()
-        self._animate_countdown()
+        # Countdown bar (stays full when animation is off)
+        if self.clock.enabled:
+            self._countdown_anim = self.clock.animate(self.duration_ms, self._set_countdown_progress)
         
         # Schedule auto-dismiss (exactly after duration_ms)
-        self.after(self.duration_ms, self._auto_dismiss)
+        self._dismiss_job = self.after(self.duration_ms, self._auto_dismiss)
     
-    def _fade_in_step(self, current_alpha: float):
-        """Perform one step of fade-in animation."""
-        if self.is_closing:
-            return
-        
-        try:
-            if current_alpha < 0.90:
-                new_alpha = min(current_alpha + 0.1, 0.90)
-                self.attributes('-alpha', new_alpha)
-                self.after(20, lambda: self._fade_in_step(new_alpha))
-            # else: fade-in complete
-        except tk.TclError:
-            pass  # Window destroyed
+    def _cancel_jobs(self):
+        if self._dismiss_job is not None:
+            try:
+                self.after_cancel(self._dismiss_job)
+            except tk.TclError:
+                pass
+        self._dismiss_job = None
+        
+        self.clock.cancel(self._fade_anim)
+        self.clock.cancel(self._countdown_anim)
+        self._fade_anim = None
+        self._countdown_anim = None
     
-    def _animate_countdown(self):
-        """Animate the countdown bar showing time remaining."""
-        if self.is_closing or self._countdown_start is None:
-            return
-        
+    # ==================== ANIMATION FRAMES (shared clock) ====================
+    
+    def _present(self):
+        """Push the rendered frame to the layered window (bitmap renderer)."""
+        self._presenter.present(
+            self._bitmap.frame, self._bitmap.size, self._bitmap_position,
+            alpha=int(self._alpha * 255)
+        )
+    
+    def _set_alpha(self, alpha: float):
+        """Window opacity: blend constant (bitmap) or Tk -alpha (widgets)."""
+        self._alpha = alpha
         try:
-            # Calculate elapsed time
-            elapsed = (datetime.now() - self._countdown_start).total_seconds() * 1000
-            remaining_ratio = max(0, 1.0 - (elapsed / self.duration_ms))
-            
-            if remaining_ratio > 0:
-                # Update countdown bar width
-                new_width = int(self.width * remaining_ratio)
-                self.countdown_frame.configure(width=max(1, new_width))
-                
-                # Schedule next frame (60fps)
-                self.after(16, self._animate_countdown)
+            if self._bitmap is not None:
+                self._presenter.set_alpha(int(alpha * 255))
+            else:
+                self.attributes('-alpha', alpha)
         except tk.TclError:
             pass  # Window destroyed
     
+    def _set_alpha_progress(self, progress: float):
+        """Fade-in frame."""
+        alpha = round(self.ALPHA * progress, 2)
+        self._set_alpha(alpha)
+        return alpha
+    
+    def _set_countdown_progress(self, progress: float):
+        """Countdown frame - only touches the widget / bitmap strip when the width changes."""
+        new_width = max(1, int(self.width * (1.0 - progress)))
+        if new_width != self._countdown_width:
+            self._countdown_width = new_width
+            if self._bitmap is not None:
+                rows = self._bitmap.set_countdown(progress)
+                if rows:
+                    self._presenter.update_rows(self._bitmap.frame, *rows)
+                return new_width
+            try:
+                self.countdown_frame.configure(width=new_width)
+            except tk.TclError:
+                pass  # Window destroyed
+        return new_width
+    
     def _auto_dismiss(self):
-        """Auto-dismiss callback - starts fade out then destroys window."""
+        """Auto-dismiss callback - fades out, then hides the window."""
+        self._dismiss_job = None
         if self.is_closing:
             return
-        
+        self._start_fade_out()
+    
+    def _start_fade_out(self):
+        """Fade out on the shared clock, then hide (kept for the next notification)."""
+        self._cancel_jobs()
         self.is_closing = True
-        self._fade_out_step(0.90)
+        
+        start_alpha = self._alpha
+        
+        def fade_frame(progress: float):
+            alpha = round(start_alpha * (1.0 - progress), 2)
+            self._set_alpha(alpha)
+            return alpha
+        
+        self._fade_anim = self.clock.animate(self.FADE_OUT_MS, fade_frame, on_done=self._hide_now)
     
-    def _fade_out_step(self, current_alpha: float):
-        """Perform one step of fade-out animation."""
+    def _hide_now(self):
+        if not self.is_closing and not self.is_visible:
+            return
+        self._cancel_jobs()
+        was_visible = self.is_visible
+        self.is_visible = False
+        self.is_closing = False
         try:
-            if current_alpha > 0.0:
-                new_alpha = current_alpha - 0.1
-                self.attributes('-alpha', max(0, new_alpha))
-                self.after(25, lambda: self._fade_out_step(new_alpha))
-            else:
-                # Fully faded - destroy window
-                self.destroy()
+            self.withdraw()
         except tk.TclError:
-            pass  # Window already destroyed
+            return
+        
+        if was_visible and self.on_hidden:
+            self.on_hidden()
+    
+    def hide(self, fade: bool = False):
+        """Hide the current notification (immediately, or with fade-out)."""
+        if not self.is_visible:
+            return
+        if fade:
+            if not self.is_closing:
+                self._start_fade_out()
+        else:
+            self._hide_now()
     
     def close(self):
         """Manually close the notification with fade-out."""
-        if not self.is_closing:
-            self.is_closing = True
-            self._fade_out_step(self.attributes('-alpha'))
+        self.hide(fade=True)
+    
+    def destroy(self):
+        """Destroy the overlay (application exit)."""
+        self._cancel_jobs()
+        self._remove_display_change_hook()
+        if self._presenter is not None:
+            self._presenter.close()
+            self._presenter = None
+        super().destroy()
 
 
 # ==================== STANDALONE TEST ====================
 if __name__ == "__main__":
-    import time
-    
     print("=" * 70)
     print("  HUD NOTIFICATION TEST - Anti-Detection Overlay")
     print("=" * 70)
@@ -511,6 +868,8 @@ if __name__ == "__main__":
     print("  ✓ NEVER steal focus (WS_EX_NOACTIVATE)")
     print("  ✓ Allow click-through (WS_EX_TRANSPARENT)")
     print("  ✓ Auto-dismiss after 3 seconds")
+    print("  ✓ Reuse ONE overlay window (content swapped in place)")
+    print("  ✓ Page through a long result without rebuilding the window")
     print()
     print("To test anti-detection: Open a browser and watch the window.onblur event.")
     print("The notification should appear WITHOUT triggering onblur!")
@@ -520,55 +879,73 @@ if __name__ == "__main__":
     root = tk.Tk()
     root.withdraw()
     
+    hud = HUDOverlay(parent=root, width=600, position="bottom-right", click_through=True)
+    
     # Test all notification types
     tests = [
         {
             "type": "success",
             "title": "✅ Analysis Complete!",
-            "message": "The AI has analyzed your screenshot.\n\nResult: The answer to the question is 42.\n\nThis notification uses WS_EX_NOACTIVATE to prevent focus stealing.",
-            "position": "top-center"
+            "message": "The AI has analyzed your screenshot.\n\nResult: The answer to the question is 42.\n\nThis notification uses WS_EX_NOACTIVATE to prevent focus stealing."
         },
         {
-            "type": "error", 
+            "type": "error",
             "title": "❌ API Error",
-            "message": "Failed to connect to Gemini API.\nPlease check your API key and internet connection.",
-            "position": "center"
+            "message": "Failed to connect to Gemini API.\nPlease check your API key and internet connection."
         },
         {
             "type": "info",
             "title": "ℹ️ Processing",
-            "message": "Analyzing screenshot with gemini-2.0-flash model...\nThis may take a few seconds.",
-            "position": "bottom-right"
+            "message": "Analyzing screenshot with gemini-2.0-flash model...\nThis may take a few seconds."
         },
         {
             "type": "warning",
             "title": "⚠️ Low Confidence",
-            "message": "The AI result may not be accurate.\nPlease verify the answer manually.",
-            "position": "top-center"
+            "message": "The AI result may not be accurate.\nPlease verify the answer manually."
         },
     ]
     
-    for i, test in enumerate(tests):
-        print(f"[{i+1}/{len(tests)}] Showing {test['type']} notification at {test['position']}...")
-        
-        HUDNotification(
-            parent=root,
+    long_result = "\n\n".join(
+        f"Step {n}: " + "The screenshot shows a multi-part question; this paragraph is long "
+        "enough to wrap across several lines of the HUD. " * 3
+        for n in range(1, 7)
+    )
+    
+    def page_test(turns=0):
+        if hud.next_page():
+            print(f"  Page {hud.page_index + 1}/{hud.page_count}")
+            root.after(1500, lambda: page_test(turns + 1))
+            return
+        print()
+        print(f"Done: {hud.shows} notifications, {hud.page_turns} page turns, "
+              f"{hud.work_area_queries} work area queries, "
+              f"{hud.text_measurer.misses} font measurements ({hud.text_measurer.hits} cached)")
+        print("Press Ctrl+C to exit...")
+    
+    def show_test(i=0):
+        if i >= len(tests):
+            print("[paging] Showing a long result...")
+            hud.show(
+                title="✅ Full Result",
+                message=long_result,
+                duration_ms=3000,
+                notification_type="success"
+            )
+            print(f"  Page 1/{hud.page_count}")
+            root.after(1500, page_test)
+            return
+        test = tests[i]
+        print(f"[{i+1}/{len(tests)}] Showing {test['type']} notification...")
+        hud.show(
             title=test['title'],
             message=test['message'],
             duration_ms=3000,  # Exactly 3 seconds
             notification_type=test['type'],
-            position=test['position'],
-            click_through=True,
             fade_in=True
         )
-        
-        time.sleep(1.0)  # Stagger notifications
+        root.after(1000, lambda: show_test(i + 1))  # Stagger notifications
     
-    print()
-    print("All notifications created!")
-    print("They will auto-dismiss after 3 seconds each.")
-    print()
-    print("Press Ctrl+C to exit...")
+    root.after(0, show_test)
     
     try:
         root.mainloop()
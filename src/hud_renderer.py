@@ -0,0 +1,580 @@
+"""
+HUD Renderer - Pre-Rendered Bitmap Path for the HUD Overlay
+===========================================================
+
+The widget HUD is a tree of Tk Frames/Labels made translucent with
+window-level alpha: every redraw walks the tree, and every countdown
+frame reconfigures a widget.
+
+HUDRenderer draws the whole notification (accent bar, header, separator,
+message page, countdown bar) into ONE RGBA image with PIL:
+- Rounded corners via per-pixel alpha (premultiplied BGRA output, the
+  format ``UpdateLayeredWindow`` expects)
+- Text widths cached per font (src.text_layout), rendered text lines
+  cached as alpha masks, page layout cached per (message, lines per page)
+- Countdown frames only patch the bottom strip of the frame buffer from
+  two pre-rendered strips (full / empty) - no re-render
+
+LayeredWindowPresenter pushes a frame to a WS_EX_LAYERED window in one
+``UpdateLayeredWindow`` call (Windows only, loaded lazily).
+
+The renderer itself is display independent - benchmark it with:
+
+    python -m src.hud_renderer
+"""
+
+import sys
+import ctypes
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from src.text_layout import TextMeasurer, layout_pages
+
+
+# Font candidates (Windows names first, then common Linux fonts)
+MESSAGE_FONTS = ("segoeuib.ttf", "DejaVuSans-Bold.ttf", "LiberationSans-Bold.ttf")
+TITLE_FONTS = ("consolab.ttf", "DejaVuSansMono-Bold.ttf", "LiberationMono-Bold.ttf")
+SMALL_FONTS = ("consola.ttf", "DejaVuSansMono.ttf", "LiberationMono-Regular.ttf")
+
+
+def _load_font(candidates, size: int):
+    """First available TrueType font, else Pillow's default font."""
+    from PIL import ImageFont
+    for name in candidates:
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    try:
+        return ImageFont.load_default(size)
+    except TypeError:
+        return ImageFont.load_default()  # Pillow < 10.1: fixed-size bitmap font
+
+
+def _hex_to_rgb(color: str) -> Tuple[int, int, int]:
+    color = color.lstrip('#')
+    return tuple(int(color[i:i + 2], 16) for i in (0, 2, 4))
+
+
+class HUDRenderer:
+    """
+    Renders HUD notifications into a premultiplied BGRA frame buffer.
+    
+    Usage:
+        renderer = HUDRenderer(width=600, colors=HUDOverlay.COLOR_THEMES['dark'])
+        pages = renderer.layout(message, max_lines=12)
+        renderer.render("✓  Analysis Complete", pages, 0, "12:34:56", accent="#1A3D2B")
+        presenter.present(renderer.frame, renderer.size, (x, y))
+        rows = renderer.set_countdown(0.5)   # patch the countdown strip only
+    """
+    
+    ACCENT_HEIGHT = 4
+    COUNTDOWN_HEIGHT = 2
+    PAD_X = 20
+    PAD_Y = 15
+    HEADER_GAP = 10       # Header -> separator
+    SEPARATOR_GAP = 12    # Separator -> message
+    MESSAGE_GAP = 10      # Message -> bottom padding
+    LINE_SPACING = 4
+    CORNER_RADIUS = 8
+    MIN_HEIGHT = 150
+    
+    def __init__(
+        self,
+        width: int = 600,
+        colors: Optional[dict] = None,
+        message_size: int = 17,
+        title_size: int = 19,
+        small_size: int = 13,
+        cache_lines: int = 512,
+        cache_layouts: int = 32
+    ):
+        """
+        Initialize renderer (requires Pillow).
+        
+        Args:
+            width: HUD width in pixels
+            colors: Theme dict (HUDOverlay.COLOR_THEMES entry)
+            message_size / title_size / small_size: Font sizes in pixels
+            cache_lines: Rendered text lines kept as alpha masks
+            cache_layouts: Laid-out messages kept (pages per message)
+        """
+        try:
+            from PIL import Image, ImageDraw
+        except ImportError:
+            raise RuntimeError("Bitmap HUD requires Pillow: pip install Pillow")
+        self._Image = Image
+        self._ImageDraw = ImageDraw
+        
+        self.width = width
+        self.colors = colors or {}
+        self.cache_lines = cache_lines
+        self.cache_layouts = cache_layouts
+        
+        self.fonts = {
+            'message': _load_font(MESSAGE_FONTS, message_size),
+            'title': _load_font(TITLE_FONTS, title_size),
+            'small': _load_font(SMALL_FONTS, small_size),
+        }
+        self.line_heights = {key: self._line_height(font) for key, font in self.fonts.items()}
+        self.measurers = {
+            key: TextMeasurer(lambda text, font=font: font.getlength(text), self.line_heights[key])
+            for key, font in self.fonts.items()
+        }
+        
+        self._line_cache = OrderedDict()    # (font key, text) -> "L" mask
+        self._layout_cache = OrderedDict()  # (message, max_lines) -> pages
+        
+        self.image = None          # Last rendered RGBA image
+        self.frame = bytearray()   # Premultiplied BGRA of self.image
+        self._strip_full = b""     # Countdown strip rows, bar at 100%
+        self._strip_empty = b""    # Countdown strip rows, bar at 0%
+        self._countdown_px = 0
+        self._corner_mask = None
+        self._chrome_cache = {}   # (height, accent, bg, border) -> (image, strip full, strip empty)
+        
+        # Stats
+        self.renders = 0
+        self.countdown_patches = 0
+        self.line_hits = 0
+        self.line_misses = 0
+        self.layout_hits = 0
+        self.layout_misses = 0
+    
+    @staticmethod
+    def _line_height(font) -> int:
+        try:
+            ascent, descent = font.getmetrics()
+            return ascent + descent + HUDRenderer.LINE_SPACING
+        except AttributeError:
+            return font.getbbox("Hg")[3] + HUDRenderer.LINE_SPACING
+    
+    @property
+    def size(self) -> Tuple[int, int]:
+        return self.image.size if self.image is not None else (self.width, 0)
+    
+    @property
+    def message_width(self) -> int:
+        return self.width - 2 * self.PAD_X
+    
+    def set_theme(self, colors: dict):
+        """Switch color theme (line masks, layouts and cached chrome stay valid)."""
+        self.colors = colors
+    
+    # ==================== LAYOUT (cached) ====================
+    
+    def layout(self, message: str, max_lines: int) -> List[str]:
+        """Wrap + paginate a message; cached per (message, max_lines)."""
+        key = (message, max_lines)
+        pages = self._layout_cache.get(key)
+        if pages is not None:
+            self._layout_cache.move_to_end(key)
+            self.layout_hits += 1
+            return pages
+        
+        measurer = self.measurers['message']
+        pages = layout_pages(message, self.message_width, max_lines * measurer.line_height, measurer)
+        self._layout_cache[key] = pages
+        self.layout_misses += 1
+        if len(self._layout_cache) > self.cache_layouts:
+            self._layout_cache.popitem(last=False)
+        return pages
+    
+    def height_for(self, lines: int) -> int:
+        """Frame height for a page of ``lines`` message lines."""
+        height = (
+            self.ACCENT_HEIGHT + self.PAD_Y
+            + self.line_heights['title'] + self.HEADER_GAP + 1 + self.SEPARATOR_GAP
+            + lines * self.line_heights['message']
+            + self.MESSAGE_GAP + self.PAD_Y + self.COUNTDOWN_HEIGHT
+        )
+        return max(self.MIN_HEIGHT, height)
+    
+    # ==================== RENDERING ====================
+    
+    def _line_mask(self, font_key: str, text: str):
+        """Rendered text line as an alpha mask (cached)."""
+        key = (font_key, text)
+        mask = self._line_cache.get(key)
+        if mask is not None:
+            self._line_cache.move_to_end(key)
+            self.line_hits += 1
+            return mask
+        
+        width = max(1, self.measurers[font_key].width(text) + 2)
+        mask = self._Image.new("L", (width, self.line_heights[font_key]), 0)
+        self._ImageDraw.Draw(mask).text((0, 0), text, font=self.fonts[font_key], fill=255)
+        self._line_cache[key] = mask
+        self.line_misses += 1
+        if len(self._line_cache) > self.cache_lines:
+            self._line_cache.popitem(last=False)
+        return mask
+    
+    def _draw_text(self, image, font_key: str, text: str, xy: Tuple[int, int], color: str):
+        if text:
+            image.paste(_hex_to_rgb(color), xy, self._line_mask(font_key, text))
+    
+    def _chrome(self, height: int, accent: str):
+        """
+        Background, accent bar, separator, full countdown bar and rounded
+        corners for one size/color combination (cached - only text is drawn
+        per render). Also returns the countdown strip bytes (full, empty).
+        """
+        colors = self.colors
+        key = (height, accent, colors.get('bg_dark'), colors.get('border'))
+        cached = self._chrome_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        width = self.width
+        bg = _hex_to_rgb(colors.get('bg_dark', '#0D0D0D'))
+        image = self._Image.new("RGBA", (width, height), bg + (255,))
+        draw = self._ImageDraw.Draw(image)
+        
+        # Accent bar
+        draw.rectangle((0, 0, width - 1, self.ACCENT_HEIGHT - 1), fill=_hex_to_rgb(accent))
+        
+        # Separator
+        y = self.ACCENT_HEIGHT + self.PAD_Y + self.line_heights['title'] + self.HEADER_GAP
+        draw.line((self.PAD_X, y, width - self.PAD_X, y), fill=_hex_to_rgb(colors.get('border', '#1F1F1F')))
+        
+        # Countdown strip: empty + full variants
+        strip_top = height - self.COUNTDOWN_HEIGHT
+        strip_box = (0, strip_top, width, height)
+        self._apply_corners(image)
+        strip_empty = image.crop(strip_box).tobytes("raw", "BGRa")
+        draw.rectangle((0, strip_top, width - 1, height - 1), fill=_hex_to_rgb(accent))
+        self._apply_corners(image)
+        strip_full = image.crop(strip_box).tobytes("raw", "BGRa")
+        
+        cached = (image, strip_full, strip_empty)
+        self._chrome_cache[key] = cached
+        if len(self._chrome_cache) > 8:
+            self._chrome_cache.pop(next(iter(self._chrome_cache)))
+        return cached
+    
+    def _apply_corners(self, image):
+        """Rounded corners: per-pixel alpha 0 outside the radius."""
+        radius = self.CORNER_RADIUS
+        if radius <= 0:
+            return
+        mask = self._corner_mask
+        if mask is None or mask.size != image.size:
+            mask = self._Image.new("L", image.size, 0)
+            self._ImageDraw.Draw(mask).rounded_rectangle(
+                (0, 0, image.size[0] - 1, image.size[1] - 1), radius=radius, fill=255
+            )
+            self._corner_mask = mask
+        image.putalpha(mask)
+    
+    def render(
+        self,
+        title: str,
+        pages: List[str],
+        page_index: int,
+        timestamp: str,
+        accent: str
+    ):
+        """
+        Render one page into ``self.image`` / ``self.frame``.
+        
+        All pages of a layout have the same line count, so paging never
+        changes the frame size. The countdown strip is reset to full.
+        """
+        colors = self.colors
+        width = self.width
+        height = self.height_for(max(len(p.split("\n")) for p in pages))
+        chrome, self._strip_full, self._strip_empty = self._chrome(height, accent)
+        image = chrome.copy()
+        
+        # Header: title (left), timestamp + page indicator (right)
+        y = self.ACCENT_HEIGHT + self.PAD_Y
+        self._draw_text(image, 'title', title, (self.PAD_X, y), accent)
+        small = self.measurers['small']
+        small_y = y + (self.line_heights['title'] - small.line_height) // 2
+        x = width - self.PAD_X - small.width(timestamp)
+        self._draw_text(image, 'small', timestamp, (x, small_y), colors.get('text_dim', '#666666'))
+        if len(pages) > 1:
+            indicator = f"{page_index + 1}/{len(pages)}"
+            x -= 10 + small.width(indicator)
+            self._draw_text(image, 'small', indicator, (x, small_y), colors.get('text_dim', '#666666'))
+        
+        # Message page
+        y += self.line_heights['title'] + self.HEADER_GAP + 1 + self.SEPARATOR_GAP
+        message_color = colors.get('neon_yellow', '#3D3D1A')
+        for line in pages[page_index].split("\n"):
+            self._draw_text(image, 'message', line, (self.PAD_X, y), message_color)
+            y += self.line_heights['message']
+        
+        self.image = image
+        self.frame = bytearray(image.tobytes("raw", "BGRa"))
+        self._countdown_px = width
+        self.renders += 1
+    
+    def set_countdown(self, progress: float) -> Optional[Tuple[int, int]]:
+        """
+        Shrink the countdown bar to ``1 - progress`` of the width by patching
+        the frame buffer's bottom strip.
+        
+        Returns:
+            tuple: (first row, end row) that changed, or None if unchanged
+        """
+        if self.image is None:
+            return None
+        width, height = self.image.size
+        bar_px = max(1, int(width * (1.0 - progress)))
+        if bar_px == self._countdown_px:
+            return None
+        self._countdown_px = bar_px
+        
+        row_bytes = width * 4
+        split = bar_px * 4
+        strip_top = height - self.COUNTDOWN_HEIGHT
+        for row in range(self.COUNTDOWN_HEIGHT):
+            src = row * row_bytes
+            dst = (strip_top + row) * row_bytes
+            self.frame[dst:dst + split] = self._strip_full[src:src + split]
+            self.frame[dst + split:dst + row_bytes] = self._strip_empty[src + split:src + row_bytes]
+        self.countdown_patches += 1
+        return strip_top, height
+    
+    def stats(self) -> dict:
+        return {
+            'renders': self.renders,
+            'countdown_patches': self.countdown_patches,
+            'line_hits': self.line_hits,
+            'line_misses': self.line_misses,
+            'layout_hits': self.layout_hits,
+            'layout_misses': self.layout_misses,
+            'frame_bytes': len(self.frame),
+        }
+
+
+class LayeredWindowPresenter:
+    """
+    Pushes premultiplied BGRA frames to a layered window (Windows).
+    
+    One DIB section is kept per frame size; a frame update copies the
+    bytes (or only the changed rows) into it and calls
+    ``UpdateLayeredWindow`` once. Window opacity is the blend constant, so
+    fades don't touch the pixels.
+    
+    NOTE: Don't mix with Tk's ``-alpha`` attribute (SetLayeredWindowAttributes)
+    on the same window - Windows ignores UpdateLayeredWindow after it.
+    """
+    
+    ULW_ALPHA = 0x02
+    AC_SRC_OVER = 0x00
+    AC_SRC_ALPHA = 0x01
+    
+    def __init__(self, hwnd: int):
+        if sys.platform != "win32":
+            raise RuntimeError("Layered window presenter is only available on Windows")
+        from ctypes import wintypes
+        
+        self._wintypes = wintypes
+        self._user32 = ctypes.WinDLL("user32", use_last_error=True)
+        self._gdi32 = ctypes.WinDLL("gdi32", use_last_error=True)
+        self._gdi32.CreateDIBSection.restype = wintypes.HBITMAP
+        self._gdi32.CreateCompatibleDC.restype = wintypes.HDC
+        self._gdi32.SelectObject.restype = wintypes.HGDIOBJ
+        self._user32.GetDC.restype = wintypes.HDC
+        
+        class BLENDFUNCTION(ctypes.Structure):
+            _fields_ = [("BlendOp", ctypes.c_ubyte), ("BlendFlags", ctypes.c_ubyte),
+                        ("SourceConstantAlpha", ctypes.c_ubyte), ("AlphaFormat", ctypes.c_ubyte)]
+        
+        class BITMAPINFOHEADER(ctypes.Structure):
+            _fields_ = [("biSize", wintypes.DWORD), ("biWidth", wintypes.LONG), ("biHeight", wintypes.LONG),
+                        ("biPlanes", wintypes.WORD), ("biBitCount", wintypes.WORD),
+                        ("biCompression", wintypes.DWORD), ("biSizeImage", wintypes.DWORD),
+                        ("biXPelsPerMeter", wintypes.LONG), ("biYPelsPerMeter", wintypes.LONG),
+                        ("biClrUsed", wintypes.DWORD), ("biClrImportant", wintypes.DWORD)]
+        
+        self._BLENDFUNCTION = BLENDFUNCTION
+        self._BITMAPINFOHEADER = BITMAPINFOHEADER
+        
+        self.hwnd = hwnd
+        self._screen_dc = self._user32.GetDC(None)
+        self._mem_dc = self._gdi32.CreateCompatibleDC(self._screen_dc)
+        self._bitmap = None
+        self._old_bitmap = None
+        self._bits = ctypes.c_void_p()
+        self._size = None
+        self._position = (0, 0)
+        self.alpha = 255
+        
+        # Stats
+        self.presents = 0
+        self.bytes_copied = 0
+    
+    def _ensure_bitmap(self, size: Tuple[int, int]):
+        if size == self._size:
+            return
+        self._release_bitmap()
+        
+        header = self._BITMAPINFOHEADER()
+        header.biSize = ctypes.sizeof(self._BITMAPINFOHEADER)
+        header.biWidth = size[0]
+        header.biHeight = -size[1]  # Top-down rows
+        header.biPlanes = 1
+        header.biBitCount = 32
+        header.biCompression = 0    # BI_RGB
+        
+        self._bitmap = self._gdi32.CreateDIBSection(
+            self._mem_dc, ctypes.byref(header), 0, ctypes.byref(self._bits), None, 0
+        )
+        if not self._bitmap:
+            raise RuntimeError(f"CreateDIBSection failed ({ctypes.get_last_error()})")
+        self._old_bitmap = self._gdi32.SelectObject(self._mem_dc, self._bitmap)
+        self._size = size
+    
+    def _release_bitmap(self):
+        if self._bitmap:
+            self._gdi32.SelectObject(self._mem_dc, self._old_bitmap)
+            self._gdi32.DeleteObject(self._bitmap)
+        self._bitmap = None
+        self._size = None
+    
+    def _copy(self, frame: bytearray, start: int, end: int):
+        buffer = (ctypes.c_char * (end - start)).from_buffer(frame, start)
+        ctypes.memmove(self._bits.value + start, buffer, end - start)
+        self.bytes_copied += end - start
+    
+    def _update(self, move: bool) -> bool:
+        wintypes = self._wintypes
+        blend = self._BLENDFUNCTION(self.AC_SRC_OVER, 0, self.alpha, self.AC_SRC_ALPHA)
+        position = wintypes.POINT(*self._position)
+        size = wintypes.SIZE(*self._size)
+        source = wintypes.POINT(0, 0)
+        ok = self._user32.UpdateLayeredWindow(
+            self.hwnd, self._screen_dc,
+            ctypes.byref(position) if move else None,
+            ctypes.byref(size), self._mem_dc, ctypes.byref(source),
+            0, ctypes.byref(blend), self.ULW_ALPHA
+        )
+        self.presents += 1
+        return bool(ok)
+    
+    def present(self, frame: bytearray, size: Tuple[int, int], position: Tuple[int, int],
+                alpha: Optional[int] = None) -> bool:
+        """Push a whole frame (and move/resize the window)."""
+        self._ensure_bitmap(size)
+        self._copy(frame, 0, len(frame))
+        self._position = position
+        if alpha is not None:
+            self.alpha = max(0, min(255, alpha))
+        return self._update(move=True)
+    
+    def update_rows(self, frame: bytearray, top: int, bottom: int) -> bool:
+        """Push only rows ``top:bottom`` of an already presented frame."""
+        if self._size is None:
+            return False
+        row_bytes = self._size[0] * 4
+        self._copy(frame, top * row_bytes, bottom * row_bytes)
+        return self._update(move=False)
+    
+    def set_alpha(self, alpha: int) -> bool:
+        """Change window opacity (0-255) without copying pixels."""
+        self.alpha = max(0, min(255, alpha))
+        if self._size is None:
+            return False
+        return self._update(move=False)
+    
+    def close(self):
+        self._release_bitmap()
+        if self._mem_dc:
+            self._gdi32.DeleteDC(self._mem_dc)
+            self._mem_dc = None
+        if self._screen_dc:
+            self._user32.ReleaseDC(None, self._screen_dc)
+            self._screen_dc = None
+
+
+# ==================== BENCHMARK ====================
+if __name__ == "__main__":
+    import time
+    import tracemalloc
+    
+    colors = {
+        'bg_dark': '#0D0D0D', 'border': '#1F1F1F', 'neon_yellow': '#3D3D1A',
+        'neon_green': '#1A3D2B', 'text_dim': '#2A2A2A',
+    }
+    message = "\n\n".join(
+        f"Step {n}: " + "The screenshot shows a multi-part question; each part is answered "
+        "in order with a short justification. " * 4
+        for n in range(1, 9)
+    )
+    
+    def timed(label, fn, repeat):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            fn()
+        per_call_us = (time.perf_counter() - start) / repeat * 1e6
+        print(f"  {label:<34} {per_call_us:10.1f} us")
+        return per_call_us
+    
+    print("=" * 60)
+    print("  HUD RENDERER BENCHMARK (PIL, no display needed)")
+    print("=" * 60)
+    
+    tracemalloc.start()
+    renderer = HUDRenderer(width=600, colors=colors)
+    
+    start = time.perf_counter()
+    pages = renderer.layout(message, max_lines=12)
+    renderer.render("✓  Analysis Complete", pages, 0, "12:34:56", colors['neon_green'])
+    print(f"  {'cold layout + render':<34} {(time.perf_counter() - start) * 1e6:10.1f} us")
+    
+    timed("cached layout", lambda: renderer.layout(message, 12), 200)
+    timed("re-render page (cached lines)",
+          lambda: renderer.render("✓  Analysis Complete", pages, 0, "12:34:56", colors['neon_green']), 50)
+    flip = iter(range(10 ** 9))
+    timed("page flip",
+          lambda: renderer.render("✓  Analysis Complete", pages, next(flip) % len(pages),
+                                  "12:34:56", colors['neon_green']), 50)
+    progress = iter(i / 3000 for i in range(10 ** 9))
+    timed("countdown frame (strip patch)", lambda: renderer.set_countdown(next(progress)), 2000)
+    
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    width, height = renderer.size
+    print()
+    print(f"  pages: {len(pages)}, frame: {width}x{height}, {len(renderer.frame) / 1024:.0f} KB")
+    print(f"  peak Python memory: {peak / 1024:.0f} KB")
+    print(f"  stats: {renderer.stats()}")
+    assert renderer.layout(message, 12) is pages and renderer.layout_misses == 1
+    assert len(renderer.frame) == width * height * 4
+    
+    # Cached lines/chrome must give the pixels of a cold render, and a
+    # countdown patch may only touch the strip it reports
+    cold = HUDRenderer(width=600, colors=colors)
+    cold.render("✓  Analysis Complete", cold.layout(message, 12), 1, "12:34:56", colors['neon_green'])
+    renderer.render("✓  Analysis Complete", pages, 1, "12:34:56", colors['neon_green'])
+    assert renderer.frame == cold.frame
+    before = bytes(renderer.frame)
+    rows = renderer.set_countdown(0.5)
+    assert rows == (height - renderer.COUNTDOWN_HEIGHT, height) and renderer.set_countdown(0.5) is None
+    row_bytes = width * 4
+    assert renderer.frame[:rows[0] * row_bytes] == before[:rows[0] * row_bytes]
+    assert renderer.frame[rows[0] * row_bytes:] != before[rows[0] * row_bytes:]
+    
+    # Widget tree comparison (needs a display)
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+        root.withdraw()
+    except Exception as e:
+        print(f"\n  Widget HUD comparison skipped (no display: {e.__class__.__name__})")
+    else:
+        from src.hud_notification import HUDOverlay
+        hud = HUDOverlay(root, width=600)
+        hud.withdraw()
+        print()
+        timed("widget HUD show()", lambda: (hud.show("Analysis Complete", message), hud.update_idletasks()), 20)
+        timed("widget HUD page flip", lambda: (hud.next_page() or hud.prev_page(), hud.update_idletasks()), 50)
+        timed("widget HUD countdown frame",
+              lambda: (hud._set_countdown_progress(next(progress)), hud.update_idletasks()), 500)
+        hud.destroy()
+        root.destroy()
@@ -2,6 +2,25 @@
 Windows Low-Level Keyboard Hook Manager
 Compatible with Python 3.14+
 
+Optionally also installs a low-level MOUSE hook (WH_MOUSE_LL) on the same
+hook thread and hands button events to ``mouse_callback`` (see
+src.gesture_recognizer) through the dispatcher - no polling, and the hook
+never waits for the recognizer or the UI.
+
+Hook thread:
+- Blocking ``GetMessageW`` loop - no wakeups while idle; ``stop()`` wakes it
+  with ``PostThreadMessageW(WM_QUIT)``
+- ``start()`` returns as soon as the thread signals that the hook is
+  installed (or failed) instead of sleeping a fixed 300 ms
+- Win32 calls go through ``Win32HookAPI`` (loaded lazily, injectable), so
+  the module imports - and the state machine runs - on any OS:
+  ``python -m src.keyboard_hook_manager`` drives it with a fake API
+- PrtSc/hotkey callbacks run on one ``HookDispatcher`` thread (in order,
+  no thread per keypress) and receive a ``HookEvent`` stamped in the hook
+- Chords map to actions (``actions``, default ``DEFAULT_ACTIONS``) in one
+  dict keyed by (modifiers, vk) - one lookup per bound key, and only bound
+  chords are swallowed
+
 CRITICAL: This module MUST be imported BEFORE pynput, as pynput breaks ctypes.WINFUNCTYPE
 """
 
@@ -10,7 +29,10 @@ import ctypes.wintypes as wintypes
 from ctypes import POINTER, byref, c_int, c_void_p
 import threading
 import time
-from typing import Callable
+from typing import Callable, Dict, FrozenSet, Optional, Tuple
+
+from src.gesture_recognizer import ButtonEvent
+from src.hook_dispatcher import HookDispatcher, HookEvent
 
 
 # Windows API Constants
@@ -19,17 +41,73 @@ WM_KEYDOWN = 0x0100
 WM_KEYUP = 0x0101
 WM_SYSKEYDOWN = 0x0104
 WM_SYSKEYUP = 0x0105
+WM_QUIT = 0x0012
 VK_SNAPSHOT = 0x2C  # Print Screen key
-PM_REMOVE = 0x0001
+PM_NOREMOVE = 0x0000
+
+# Low-level mouse hook: button messages -> (button, pressed)
+WH_MOUSE_LL = 14
+MOUSE_BUTTON_MESSAGES = {
+    0x0201: ("left", True),     # WM_LBUTTONDOWN
+    0x0202: ("left", False),    # WM_LBUTTONUP
+    0x0204: ("right", True),    # WM_RBUTTONDOWN
+    0x0205: ("right", False),   # WM_RBUTTONUP
+    0x0207: ("middle", True),   # WM_MBUTTONDOWN
+    0x0208: ("middle", False),  # WM_MBUTTONUP
+}
+
+# Modifier virtual keys (GetAsyncKeyState)
+MODIFIER_VKS = {
+    'ctrl': (0x11,),
+    'alt': (0x12,),
+    'shift': (0x10,),
+    'win': (0x5B, 0x5C),
+}
+
+# Named keys usable in hotkey chords ("ctrl+alt+right", "shift+printscreen")
+NAMED_VKS = {
+    'printscreen': VK_SNAPSHOT, 'prtsc': VK_SNAPSHOT,
+    'pageup': 0x21, 'pagedown': 0x22, 'end': 0x23, 'home': 0x24,
+    'left': 0x25, 'up': 0x26, 'right': 0x27, 'down': 0x28,
+    'insert': 0x2D, 'delete': 0x2E, 'escape': 0x1B, 'esc': 0x1B,
+    'space': 0x20, 'enter': 0x0D, 'tab': 0x09, 'backspace': 0x08,
+}
+NAMED_VKS.update({f'f{n}': 0x6F + n for n in range(1, 25)})
+
+# Chord -> action name passed to the callback (see CaptureEngine.run_action)
+DEFAULT_ACTIONS = {
+    'printscreen': 'capture',
+    'alt+printscreen': 'capture_window',
+    'ctrl+alt+enter': 'flush',
+    'ctrl+alt+backspace': 'cancel',
+    'ctrl+alt+r': 'resend:General Analysis',
+}
 
-# Load DLLs
-user32 = ctypes.windll.user32
-kernel32 = ctypes.windll.kernel32
 
-# Configure CallNextHookEx properly for Python 3.14
-# lParam needs to be c_void_p to handle large pointers
-user32.CallNextHookEx.argtypes = [wintypes.HHOOK, c_int, wintypes.WPARAM, c_void_p]
-user32.CallNextHookEx.restype = c_int
+def parse_chord(chord: str) -> Tuple[FrozenSet[str], int]:
+    """
+    Parse a hotkey chord like "ctrl+shift+printscreen".
+    
+    Returns:
+        tuple: (modifier names, virtual key code)
+    
+    Raises:
+        ValueError: Unknown key name or no main key
+    """
+    modifiers = set()
+    vk = None
+    for part in chord.lower().replace(' ', '').split('+'):
+        if part in MODIFIER_VKS:
+            modifiers.add(part)
+        elif part in NAMED_VKS:
+            vk = NAMED_VKS[part]
+        elif len(part) == 1 and part.isalnum():
+            vk = ord(part.upper())
+        else:
+            raise ValueError(f"Unknown key in hotkey '{chord}': {part}")
+    if vk is None:
+        raise ValueError(f"Hotkey '{chord}' has no main key")
+    return frozenset(modifiers), vk
 
 
 class KBDLLHOOKSTRUCT(ctypes.Structure):
@@ -42,20 +120,181 @@ class KBDLLHOOKSTRUCT(ctypes.Structure):
     ]
 
 
+class MSLLHOOKSTRUCT(ctypes.Structure):
+    _fields_ = [
+        ("pt", wintypes.POINT),
+        ("mouseData", wintypes.DWORD),
+        ("flags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ctypes.c_size_t)
+    ]
+
+
+class Win32HookAPI:
+    """
+    The Win32 calls the hook thread makes (user32/kernel32).
+    
+    Uses private WinDLL instances, so argtypes set here and by other
+    libraries on ``ctypes.windll`` can't clash.
+    """
+    
+    def __init__(self):
+        """
+        Raises:
+            RuntimeError: Not running on Windows
+        """
+        if not hasattr(ctypes, "WinDLL"):
+            raise RuntimeError("Low-level keyboard hooks require Windows")
+        
+        user32 = ctypes.WinDLL("user32", use_last_error=True)
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        
+        # Configure CallNextHookEx properly for Python 3.14
+        # lParam needs to be c_void_p to handle large pointers
+        user32.CallNextHookEx.argtypes = [wintypes.HHOOK, c_int, wintypes.WPARAM, c_void_p]
+        user32.CallNextHookEx.restype = c_int
+        user32.SetWindowsHookExW.restype = wintypes.HHOOK
+        user32.UnhookWindowsHookEx.argtypes = [wintypes.HHOOK]
+        user32.GetMessageW.argtypes = [POINTER(wintypes.MSG), wintypes.HWND, wintypes.UINT, wintypes.UINT]
+        user32.GetMessageW.restype = wintypes.BOOL
+        user32.PostThreadMessageW.argtypes = [wintypes.DWORD, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+        user32.PostThreadMessageW.restype = wintypes.BOOL
+        user32.GetAsyncKeyState.restype = ctypes.c_short
+        kernel32.GetCurrentThreadId.restype = wintypes.DWORD
+        
+        self._user32 = user32
+        self._kernel32 = kernel32
+        # HOOKPROC - return type is c_int for Python compatibility
+        self._hookproc_type = ctypes.WINFUNCTYPE(c_int, c_int, wintypes.WPARAM, wintypes.LPARAM)
+    
+    def make_hookproc(self, func):
+        return self._hookproc_type(func)
+    
+    def set_hook(self, hook_type: int, proc):
+        return self._user32.SetWindowsHookExW(hook_type, proc, None, 0)
+    
+    def unhook(self, hook_id) -> bool:
+        return bool(self._user32.UnhookWindowsHookEx(hook_id))
+    
+    def call_next(self, hook_id, nCode, wParam, lParam) -> int:
+        # Cast lParam to c_void_p for Python 3.14 compatibility
+        return self._user32.CallNextHookEx(hook_id, nCode, wParam, c_void_p(lParam))
+    
+    def current_thread_id(self) -> int:
+        return self._kernel32.GetCurrentThreadId()
+    
+    def ensure_message_queue(self):
+        """Create this thread's message queue, so an early WM_QUIT isn't lost."""
+        msg = wintypes.MSG()
+        self._user32.PeekMessageW(byref(msg), None, 0, 0, PM_NOREMOVE)
+    
+    def get_message(self, msg) -> int:
+        """Block until a message arrives. Returns 0 on WM_QUIT, -1 on error."""
+        return self._user32.GetMessageW(byref(msg), None, 0, 0)
+    
+    def dispatch(self, msg):
+        self._user32.TranslateMessage(byref(msg))
+        self._user32.DispatchMessageW(byref(msg))
+    
+    def post_quit(self, thread_id: int) -> bool:
+        return bool(self._user32.PostThreadMessageW(thread_id, WM_QUIT, 0, 0))
+    
+    def key_down(self, vk: int) -> bool:
+        return bool(self._user32.GetAsyncKeyState(vk) & 0x8000)
+    
+    def last_error(self) -> int:
+        return ctypes.get_last_error()
+
+
 # Global state
 _hook_manager = None
 
 
 class KeyboardHookManager:
-    """Low-level Windows keyboard hook for intercepting PrtSc."""
+    """
+    Low-level Windows keyboard hook for intercepting PrtSc.
+    
+    ``actions`` maps chords to action names handled by ``callback``; extra
+    chords with their own callback (e.g. HUD paging) can be bound with
+    ``hotkeys``. Only a matching chord is swallowed, everything else
+    (including unbound PrtSc combinations) passes through.
     
-    def __init__(self, callback: Callable[[], None]):
+    Callbacks are called with a ``HookEvent`` on the dispatcher thread.
+    """
+    
+    START_TIMEOUT_S = 2.0
+    
+    def __init__(
+        self,
+        callback: Callable[[HookEvent], None],
+        hotkeys: Optional[Dict[str, Callable[[HookEvent], None]]] = None,
+        mouse_callback: Optional[Callable[[ButtonEvent], None]] = None,
+        api=None,
+        dispatcher: Optional[HookDispatcher] = None,
+        actions: Optional[Dict[str, str]] = None
+    ):
+        """
+        Args:
+            callback: Called for bound actions (``event.action`` = action name)
+            hotkeys: Chord -> callback, e.g. {"shift+printscreen": next_page}
+                     (wins over ``actions`` for the same chord)
+            mouse_callback: Called on the dispatcher thread with a ButtonEvent for
+                            every mouse button down/up (never swallowed)
+            api: Win32 facade (default: ``Win32HookAPI``, created on start)
+            dispatcher: Shared dispatcher (e.g. also fed by a pynput fallback);
+                        default: a private one started/stopped with the hook
+            actions: Chord -> action name (default: ``DEFAULT_ACTIONS``)
+        
+        Raises:
+            ValueError: Invalid chord
+        """
         self.callback = callback
+        self.mouse_callback = mouse_callback
+        self.api = api
+        self._owns_dispatcher = dispatcher is None
+        self.dispatcher = dispatcher or HookDispatcher()
         self.hook_id = None
+        self.mouse_hook_id = None
+        self._mouse_proc = None
         self._running = False
         self._thread = None
+        self._thread_id = None
+        self._ready = threading.Event()
+        self._start_error = None
         self._hook_proc = None
-        self._prtsc_down = False
+        self._swallowed_down = set()
+        
+        # (modifiers, vk) -> (callback, action name)
+        self._bindings = {}
+        for chord, action in (DEFAULT_ACTIONS if actions is None else actions).items():
+            self._bindings[parse_chord(chord)] = (callback, action)
+        for chord, hotkey_callback in (hotkeys or {}).items():
+            self._bindings[parse_chord(chord)] = (hotkey_callback, "hotkey")
+        self._bound_vks = frozenset(vk for _, vk in self._bindings)
+    
+    def _current_modifiers(self) -> FrozenSet[str]:
+        """Modifiers held right now."""
+        return frozenset(
+            name for name, vks in MODIFIER_VKS.items()
+            if any(self.api.key_down(vk) for vk in vks)
+        )
+    
+    def _handle_binding(self, vk: int, wParam, hook_time: float) -> bool:
+        """Fire a bound chord on key down (once per press). True = swallow the key."""
+        if wParam in (WM_KEYDOWN, WM_SYSKEYDOWN):
+            binding = self._bindings.get((self._current_modifiers(), vk))
+            if binding is None:
+                return False
+            if vk not in self._swallowed_down:
+                self._swallowed_down.add(vk)
+                self.dispatcher.post(binding[0], binding[1], hook_time=hook_time)
+            return True
+        
+        if wParam in (WM_KEYUP, WM_SYSKEYUP) and vk in self._swallowed_down:
+            # Swallow the matching key up too
+            self._swallowed_down.discard(vk)
+            return True
+        return False
     
     def _hook_callback(self, nCode, wParam, lParam):
         """
@@ -67,73 +306,123 @@ class KeyboardHookManager:
                 # Cast lParam to pointer to KBDLLHOOKSTRUCT
                 kbd = ctypes.cast(lParam, POINTER(KBDLLHOOKSTRUCT)).contents
                 
-                if kbd.vkCode == VK_SNAPSHOT:
-                    # Handle key down - trigger callback once
-                    if wParam in (WM_KEYDOWN, WM_SYSKEYDOWN):
-                        if not self._prtsc_down:
-                            self._prtsc_down = True
-                            if self.callback:
-                                threading.Thread(target=self.callback, daemon=True).start()
-                    elif wParam in (WM_KEYUP, WM_SYSKEYUP):
-                        self._prtsc_down = False
-                    
-                    # SWALLOW the key - return 1, don't call next hook
-                    return 1
+                # SWALLOW bound chords - return 1, don't call next hook
+                if kbd.vkCode in self._bound_vks:
+                    if self._handle_binding(kbd.vkCode, wParam, time.perf_counter()):
+                        return 1
         except Exception as e:
             print(f"Hook error: {e}")
         
-        # Pass other keys through - cast lParam to c_void_p for Python 3.14 compatibility
-        return user32.CallNextHookEx(self.hook_id, nCode, wParam, c_void_p(lParam))
+        # Pass other keys through
+        return self.api.call_next(self.hook_id, nCode, wParam, lParam)
     
-    def _run_hook(self):
-        """Install hook and run message loop."""
+    def _mouse_hook_callback(self, nCode, wParam, lParam):
+        """Mouse hook callback - button events only, always passed on."""
+        if nCode >= 0:
+            button_state = MOUSE_BUTTON_MESSAGES.get(wParam)
+            if button_state is not None:
+                try:
+                    info = ctypes.cast(lParam, POINTER(MSLLHOOKSTRUCT)).contents
+                    # Event time (ms since boot) - more accurate than "now"
+                    button_event = ButtonEvent(button_state[0], button_state[1], info.time / 1000.0)
+                    # Never run the recognizer here: a slow callback (e.g. one
+                    # waiting on Tk) would stall the system-wide mouse hook
+                    self.dispatcher.post(
+                        lambda event, button_event=button_event: self.mouse_callback(button_event),
+                        "mouse",
+                        hook_time=time.perf_counter()
+                    )
+                except Exception as e:
+                    print(f"Mouse hook error: {e}")
+        
+        return self.api.call_next(self.mouse_hook_id, nCode, wParam, lParam)
+    
+    def _install_mouse_hook(self):
+        """Install WH_MOUSE_LL on this (hook) thread. Failure only disables gestures."""
+        self._mouse_proc = self.api.make_hookproc(self._mouse_hook_callback)
+        self.mouse_hook_id = self.api.set_hook(WH_MOUSE_LL, self._mouse_proc) or None
+        if self.mouse_hook_id:
+            print(f"✅ Mouse hook installed: {self.mouse_hook_id}")
+        else:
+            print(f"⚠️ Mouse hook failed. Error: {self.api.last_error()}")
+    
+    @property
+    def mouse_hook_active(self) -> bool:
+        return self.mouse_hook_id is not None
+    
+    def _install_hooks(self) -> bool:
+        """Install the hooks on this thread. Sets ``_start_error`` on failure."""
         global _hook_manager
-        _hook_manager = self
         
-        # Create HOOKPROC type - return type is c_int for Python compatibility
-        HOOKPROC = ctypes.WINFUNCTYPE(c_int, c_int, wintypes.WPARAM, wintypes.LPARAM)
+        self._thread_id = self.api.current_thread_id()
+        self.api.ensure_message_queue()
         
         # Create and store callback reference
-        self._hook_proc = HOOKPROC(self._hook_callback)
-        
-        kernel32.SetLastError(0)
-        
-        self.hook_id = user32.SetWindowsHookExW(
-            WH_KEYBOARD_LL,
-            self._hook_proc,
-            None,
-            0
-        )
+        self._hook_proc = self.api.make_hookproc(self._hook_callback)
+        self.hook_id = self.api.set_hook(WH_KEYBOARD_LL, self._hook_proc) or None
         
         if not self.hook_id:
-            error = kernel32.GetLastError()
-            _hook_manager = None
-            raise RuntimeError(f"Hook failed. Error: {error}. Run as Admin.")
+            self._start_error = f"Hook failed. Error: {self.api.last_error()}. Run as Admin."
+            return False
         
+        _hook_manager = self
         print(f"✅ Keyboard hook installed: {self.hook_id}")
         
-        # Message loop
-        msg = wintypes.MSG()
-        while self._running:
-            if user32.PeekMessageW(byref(msg), None, 0, 0, PM_REMOVE):
-                user32.TranslateMessage(byref(msg))
-                user32.DispatchMessageW(byref(msg))
-            else:
-                time.sleep(0.001)
-        
-        # Cleanup
+        if self.mouse_callback is not None:
+            self._install_mouse_hook()
+        return True
+    
+    def _remove_hooks(self):
+        if self.mouse_hook_id:
+            self.api.unhook(self.mouse_hook_id)
+            self.mouse_hook_id = None
+        
         if self.hook_id:
-            user32.UnhookWindowsHookEx(self.hook_id)
+            self.api.unhook(self.hook_id)
             print("✅ Keyboard hook removed")
             self.hook_id = None
+    
+    def _run_hook(self):
+        """Install hooks, signal readiness, then block in the message loop."""
+        global _hook_manager
+        
+        try:
+            installed = self._install_hooks()
+        except Exception as e:
+            self._start_error = str(e)
+            installed = False
+        finally:
+            # start() is waiting on this - success or failure
+            self._ready.set()
         
+        if installed:
+            # Hook callbacks run inside GetMessageW; it only returns for
+            # posted messages, WM_QUIT (0) or an error (-1)
+            msg = wintypes.MSG()
+            while self.api.get_message(msg) > 0:
+                self.api.dispatch(msg)
+        
+        self._remove_hooks()
         _hook_manager = None
     
     def start(self):
-        """Start the keyboard hook."""
+        """
+        Start the keyboard hook. Returns once the hook thread is ready.
+        
+        Raises:
+            RuntimeError: If the hook could not be installed
+        """
         if self._running:
             return
         
+        if self.api is None:
+            self.api = Win32HookAPI()
+        
+        if self._owns_dispatcher:
+            self.dispatcher.start()
+        
+        self._ready.clear()
+        self._start_error = None
         self._running = True
         self._thread = threading.Thread(
             target=self._run_hook,
@@ -142,18 +431,17 @@ class KeyboardHookManager:
         )
         self._thread.start()
         
-        time.sleep(0.3)
-        
-        if not self.hook_id:
-            self._running = False
+        if not self._ready.wait(self.START_TIMEOUT_S) or not self.hook_id:
+            error = self._start_error or "hook thread did not respond"
+            self.stop()
             raise RuntimeError(
-                "Keyboard hook failed to initialize.\n"
+                f"Keyboard hook failed to initialize ({error}).\n"
                 "1. Run as Administrator\n"
                 "2. Check if another app is blocking hooks"
             )
     
     def stop(self):
-        """Stop the keyboard hook."""
+        """Stop the keyboard hook (wakes the message loop with WM_QUIT)."""
         global _hook_manager
         
         if not self._running:
@@ -162,13 +450,18 @@ class KeyboardHookManager:
         self._running = False
         
         if self._thread:
+            if self._thread.is_alive() and self._thread_id is not None:
+                self.api.post_quit(self._thread_id)
             self._thread.join(timeout=2.0)
+            self._thread = None
         
-        if self.hook_id:
-            user32.UnhookWindowsHookEx(self.hook_id)
-            self.hook_id = None
-        
+        # Normally done by the hook thread already
+        self._remove_hooks()
+        self._thread_id = None
         _hook_manager = None
+        
+        if self._owns_dispatcher:
+            self.dispatcher.stop()
     
     def is_running(self) -> bool:
         return self._running and self.hook_id is not None
@@ -180,3 +473,148 @@ class KeyboardHookManager:
     def __exit__(self, *args):
         self.stop()
         return False
+
+
+# ==================== SELF-CHECK (any OS) ====================
+if __name__ == "__main__":
+    import queue
+    
+    class FakeHookAPI:
+        """Win32HookAPI stand-in - a queue plays the hook thread's message queue."""
+        
+        def __init__(self, fail: bool = False):
+            self.fail = fail
+            self.messages = queue.Queue()
+            self.hooks = {}
+            self.held = set()
+            self.wakeups = 0
+            self.passed = 0
+        
+        def make_hookproc(self, func):
+            return func
+        
+        def set_hook(self, hook_type, proc):
+            if self.fail:
+                return None
+            self.hooks[hook_type] = proc
+            return 1000 + hook_type
+        
+        def unhook(self, hook_id):
+            return self.hooks.pop(hook_id - 1000, None) is not None
+        
+        def call_next(self, hook_id, nCode, wParam, lParam):
+            self.passed += 1
+            return 0
+        
+        def current_thread_id(self):
+            return threading.get_ident()
+        
+        def ensure_message_queue(self):
+            pass
+        
+        def get_message(self, msg):
+            while True:
+                item = self.messages.get()
+                self.wakeups += 1
+                if item == WM_QUIT:
+                    return 0
+                # A hook event: Windows calls the hook proc from inside GetMessageW
+                hook_type, wParam, struct = item
+                self.hooks[hook_type](0, wParam, ctypes.addressof(struct))
+        
+        def dispatch(self, msg):
+            pass
+        
+        def post_quit(self, thread_id):
+            self.messages.put(WM_QUIT)
+            return True
+        
+        def key_down(self, vk):
+            return vk in self.held
+        
+        def last_error(self):
+            return 5  # ERROR_ACCESS_DENIED
+    
+    def key_event(api, wParam, vk=VK_SNAPSHOT):
+        api.messages.put((WH_KEYBOARD_LL, wParam, KBDLLHOOKSTRUCT(vkCode=vk)))
+    
+    def press(api, vk=VK_SNAPSHOT, modifiers=()):
+        time.sleep(0.02)  # Let the hook thread catch up before modifiers change
+        api.held = set(modifiers)
+        key_event(api, WM_KEYDOWN, vk)
+        key_event(api, WM_KEYUP, vk)
+    
+    print("=" * 60)
+    print("  KEYBOARD HOOK STATE MACHINE (fake Win32 API)")
+    print("=" * 60)
+    
+    api = FakeHookAPI()
+    actions, pages, buttons = [], [], []
+    
+    def slow_gesture_handler(button_event):
+        time.sleep(0.05)  # e.g. waiting for a busy Tk main loop
+        buttons.append((button_event, threading.current_thread().name))
+    
+    manager = KeyboardHookManager(
+        callback=actions.append,
+        hotkeys={"shift+printscreen": pages.append},
+        mouse_callback=slow_gesture_handler,
+        api=api
+    )
+    
+    start = time.perf_counter()
+    manager.start()
+    print(f"  start: {(time.perf_counter() - start) * 1000:.2f} ms (was a fixed 300 ms sleep)")
+    
+    # PrtSc with auto-repeat -> one capture; Shift+PrtSc -> the hotkey only;
+    # Alt+PrtSc and Ctrl+Alt+Backspace -> their actions; unbound chords pass
+    for wParam in (WM_KEYDOWN, WM_KEYDOWN, WM_KEYUP):
+        key_event(api, wParam)
+    press(api, modifiers=(0x10,))
+    press(api, modifiers=(0x12,))
+    press(api, vk=0x08, modifiers=(0x11, 0x12))
+    press(api, modifiers=(0x11, 0x10))
+    press(api, vk=0x41)
+    
+    # Mouse buttons: the hook only queues them, the slow handler runs later
+    time.sleep(0.05)
+    passed = api.passed
+    start = time.perf_counter()
+    for wParam in (0x0201, 0x0202, 0x0201, 0x0202):
+        api.messages.put((WH_MOUSE_LL, wParam, MSLLHOOKSTRUCT(time=1000)))
+    while api.passed < passed + 4:
+        time.sleep(0.0005)
+    mouse_hook_ms = (time.perf_counter() - start) * 1000
+    
+    time.sleep(0.5)
+    wakeups = api.wakeups
+    time.sleep(0.5)
+    idle_wakeups = api.wakeups - wakeups
+    print(f"  loop wakeups while idle for 0.5 s: {idle_wakeups} (was up to 500)")
+    
+    start = time.perf_counter()
+    manager.stop()
+    print(f"  stop: {(time.perf_counter() - start) * 1000:.2f} ms, hooks left: {len(api.hooks)}, "
+          f"thread exited: {manager._thread is None}")
+    print(f"  actions: {[event.action for event in actions]} (expected capture, capture_window, cancel)")
+    print(f"  page hotkeys: {len(pages)} (expected 1), passed through: {api.passed} (expected 4 keys + 4 buttons)")
+    print(f"  mouse: 4 button events through the hook in {mouse_hook_ms:.1f} ms (handler sleeps 50 ms each), "
+          f"{len(buttons)} handled on {sorted({name for _, name in buttons})}")
+    print(f"  {manager.dispatcher.stats()}")
+    assert idle_wakeups == 0
+    assert not api.hooks and manager._thread is None
+    assert [event.action for event in actions] == ["capture", "capture_window", "cancel"]
+    assert len(pages) == 1 and api.passed == 8
+    assert len(buttons) == 4 and {name for _, name in buttons} == {"HookDispatcher"}
+    
+    failing = KeyboardHookManager(callback=print, api=FakeHookAPI(fail=True))
+    start = time.perf_counter()
+    try:
+        failing.start()
+    except RuntimeError as e:
+        print(f"  failed hook reported after {(time.perf_counter() - start) * 1000:.2f} ms: "
+              f"{str(e).splitlines()[0]}")
+    else:
+        raise AssertionError("failed hook: no error raised")
+    print(f"  running after failure: {failing.is_running()}")
+    assert not failing.is_running()
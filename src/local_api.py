@@ -0,0 +1,348 @@
+"""
+Local API - Submit Images to the Capture Engine over HTTP
+=========================================================
+
+Lets scripts on the same machine (test runners, automation) reuse the
+running SnapCapAI engine: warm Gemini client, result cache, rate limit,
+history. Listens on 127.0.0.1 only.
+
+Endpoints:
+    GET  /health                 -> {"status": "ok", "model": ..., "pending": N}
+    GET  /templates              -> {"templates": [...], "default": ...}
+    POST /analyze                -> analysis result as JSON
+
+POST /analyze:
+    Body: raw image bytes (PNG/JPEG/...)
+    Query parameters:
+        template=NAME   Built-in prompt template (default: engine prompt)
+        prompt=TEXT     Custom prompt (overrides template)
+        flush=1         Send immediately instead of waiting for the batch timer
+        stream=1        Stream the answer as NDJSON lines:
+                        {"chunk": "..."} ... then {"done": true, ...result}
+
+Example:
+    curl --data-binary @shot.png "http://127.0.0.1:8765/analyze?template=Text%20Extraction&flush=1"
+
+Security:
+- Bound to loopback, non-loopback peers are rejected
+- Host header must be localhost/127.0.0.1 (blocks DNS-rebinding from browsers)
+- Optional shared token: ``Authorization: Bearer <token>``
+"""
+
+import io
+import json
+import threading
+from concurrent.futures import CancelledError, TimeoutError as FutureTimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import urlsplit, parse_qs
+
+from src.prompt_templates import PROMPT_TEMPLATES, DEFAULT_TEMPLATE, get_template
+
+
+DEFAULT_PORT = 8765
+MAX_IMAGE_BYTES = 20 * 1024 * 1024
+RESULT_TIMEOUT_S = 300
+ALLOWED_HOSTS = ("127.0.0.1", "localhost", "[::1]")
+
+
+class _APIRequestHandler(BaseHTTPRequestHandler):
+    """Request handler - ``self.server.api`` is the owning LocalAPIServer."""
+    
+    server_version = "SnapCapAI-LocalAPI"
+    protocol_version = "HTTP/1.1"
+    
+    def log_message(self, format, *args):
+        self.server.api._log(f"[LocalAPI] {self.address_string()} {format % args}\n")
+    
+    # ==================== HELPERS ====================
+    
+    def _send_json(self, status: int, payload: dict, close: bool = False):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        if close:
+            self.send_header("Connection", "close")
+            self.close_connection = True
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def _send_error(self, status: int, message: str):
+        # The request body may be unread - on a keep-alive socket it would be
+        # parsed as the next request, so close the connection instead
+        self._send_json(status, {'error': message}, close=True)
+    
+    def _check_access(self) -> bool:
+        """Reject non-local peers, foreign Host headers and bad tokens."""
+        api = self.server.api
+        
+        if self.client_address[0] not in ("127.0.0.1", "::1"):
+            self._send_error(403, "Local connections only")
+            return False
+        
+        host = (self.headers.get("Host") or "").rsplit(":", 1)[0]
+        if host not in ALLOWED_HOSTS:
+            self._send_error(403, "Invalid Host header")
+            return False
+        
+        if api.token and self.headers.get("Authorization") != f"Bearer {api.token}":
+            self._send_error(401, "Missing or invalid token")
+            return False
+        
+        return True
+    
+    # ==================== ROUTES ====================
+    
+    def do_GET(self):
+        if not self._check_access():
+            return
+        
+        path = urlsplit(self.path).path
+        engine = self.server.api.engine
+        
+        if path == "/health":
+            self._send_json(200, {
+                'status': 'ok',
+                'model': engine.model_name,
+                'pending': engine.pending_count(),
+                'cache': {'hits': engine.cache.hits, 'misses': engine.cache.misses},
+            })
+        elif path == "/templates":
+            self._send_json(200, {
+                'templates': sorted(PROMPT_TEMPLATES),
+                'default': DEFAULT_TEMPLATE,
+            })
+        else:
+            self._send_error(404, "Not found")
+    
+    def do_POST(self):
+        if not self._check_access():
+            return
+        
+        url = urlsplit(self.path)
+        if url.path != "/analyze":
+            self._send_error(404, "Not found")
+            return
+        
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        
+        # Prompt: explicit prompt > template > engine prompt
+        prompt = query.get('prompt') or None
+        template = query.get('template')
+        if prompt is None and template:
+            if template not in PROMPT_TEMPLATES:
+                self._send_error(400, f"Unknown template: {template}")
+                return
+            prompt = get_template(template)
+        
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            length = 0
+        if length <= 0:
+            self._send_error(411, "Image bytes required (Content-Length)")
+            return
+        if length > MAX_IMAGE_BYTES:
+            self._send_error(413, f"Image larger than {MAX_IMAGE_BYTES // (1024 * 1024)} MB")
+            return
+        
+        try:
+            from PIL import Image
+            image = Image.open(io.BytesIO(self.rfile.read(length)))
+            image.load()
+        except Exception as e:
+            self._send_error(400, f"Invalid image: {e}")
+            return
+        
+        flush = query.get('flush') in ("1", "true", "yes")
+        if query.get('stream') in ("1", "true", "yes"):
+            self._analyze_streaming(image, prompt, flush)
+        else:
+            self._analyze(image, prompt, flush)
+    
+    def _analyze(self, image, prompt: Optional[str], flush: bool):
+        future = self.server.api.engine.submit(image, prompt=prompt, source="api", flush=flush)
+        try:
+            data = future.result(timeout=RESULT_TIMEOUT_S)
+        except CancelledError:
+            self._send_error(503, "Request dropped (capture stopped)")
+            return
+        except FutureTimeoutError:
+            self._send_error(504, "Analysis timed out")
+            return
+        except Exception as e:
+            self._send_error(502, f"Analysis failed: {e}")
+            return
+        
+        self._send_json(200, data)
+    
+    def _analyze_streaming(self, image, prompt: Optional[str], flush: bool):
+        """Send partial text as NDJSON lines (chunked transfer encoding)."""
+        write_lock = threading.Lock()
+        broken = threading.Event()
+        
+        def write_line(payload: dict):
+            if broken.is_set():
+                return
+            line = (json.dumps(payload, ensure_ascii=False) + "\n").encode('utf-8')
+            with write_lock:
+                try:
+                    self.wfile.write(f"{len(line):X}\r\n".encode('ascii') + line + b"\r\n")
+                    self.wfile.flush()
+                except OSError:
+                    broken.set()  # Client went away - result still lands in history
+        
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson; charset=utf-8")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        
+        future = self.server.api.engine.submit(
+            image,
+            prompt=prompt,
+            source="api",
+            flush=flush,
+            on_chunk=lambda text: write_line({'chunk': text})
+        )
+        try:
+            data = future.result(timeout=RESULT_TIMEOUT_S)
+            write_line(dict(data, done=True))
+        except CancelledError:
+            write_line({'done': True, 'error': "Request dropped (capture stopped)"})
+        except FutureTimeoutError:
+            write_line({'done': True, 'error': "Analysis timed out"})
+        except Exception as e:
+            write_line({'done': True, 'error': f"Analysis failed: {e}"})
+        
+        if not broken.is_set():
+            try:
+                self.wfile.write(b"0\r\n\r\n")
+                self.wfile.flush()
+            except OSError:
+                pass
+
+
+class LocalAPIServer:
+    """
+    Localhost HTTP front-end for a CaptureEngine.
+    
+    Usage:
+        api = LocalAPIServer(engine, port=8765)
+        api.start()
+        ...
+        api.stop()
+    """
+    
+    def __init__(
+        self,
+        engine,
+        port: int = DEFAULT_PORT,
+        token: Optional[str] = None,
+        on_log=None
+    ):
+        """
+        Initialize local API server.
+        
+        Args:
+            engine: CaptureEngine that processes the submitted images
+            port: TCP port on 127.0.0.1 (0 = pick a free port)
+            token: Optional shared secret required as Bearer token
+            on_log: Called with request log lines
+        """
+        self.engine = engine
+        self.port = port
+        self.token = token or None
+        self.on_log = on_log
+        self._httpd = None
+        self._thread = None
+    
+    def _log(self, message: str):
+        if self.on_log:
+            self.on_log(message)
+    
+    @property
+    def is_running(self) -> bool:
+        return self._httpd is not None
+    
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+    
+    def start(self):
+        """
+        Bind and serve on a background thread.
+        
+        Raises:
+            RuntimeError: If the port can't be bound
+        """
+        if self._httpd is not None:
+            return
+        
+        try:
+            httpd = ThreadingHTTPServer(("127.0.0.1", self.port), _APIRequestHandler)
+        except OSError as e:
+            raise RuntimeError(f"Local API: cannot listen on 127.0.0.1:{self.port} ({e})")
+        
+        httpd.daemon_threads = True
+        httpd.api = self
+        self._httpd = httpd
+        self.port = httpd.server_address[1]
+        
+        self._thread = threading.Thread(
+            target=httpd.serve_forever,
+            kwargs={'poll_interval': 0.5},
+            daemon=True,
+            name="LocalAPIServer"
+        )
+        self._thread.start()
+    
+    def stop(self):
+        """Stop serving and release the port."""
+        httpd, self._httpd = self._httpd, None
+        if httpd is None:
+            return
+        
+        httpd.shutdown()
+        httpd.server_close()
+        if self._thread:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+
+
+# ==================== SELF-CHECK ====================
+if __name__ == "__main__":
+    import http.client
+    
+    class FakeCache:
+        hits = misses = 0
+    
+    class FakeEngine:
+        model_name = "fake"
+        cache = FakeCache()
+        
+        def pending_count(self):
+            return 0
+    
+    api = LocalAPIServer(FakeEngine(), port=0)
+    api.start()
+    try:
+        # An error reply must not leave the unread body on a keep-alive socket
+        conn = http.client.HTTPConnection("127.0.0.1", api.port, timeout=5)
+        body = b"\x89PNG\r\n\x1a\n" + b"\0" * 4096
+        conn.request("POST", "/analyze?template=Nope", body=body, headers={"Host": "localhost"})
+        error = conn.getresponse()
+        error.read()
+        conn.request("GET", "/health", headers={"Host": "localhost"})
+        health = conn.getresponse()
+        payload = json.loads(health.read())
+        conn.close()
+        
+        print("=" * 60)
+        print("  LOCAL API SELF-CHECK")
+        print("=" * 60)
+        print(f"  POST unknown template: {error.status}, Connection: {error.getheader('Connection')}")
+        print(f"  GET /health on the same client: {health.status} {payload}")
+        assert error.status == 400 and health.status == 200 and payload['status'] == "ok"
+    finally:
+        api.stop()
@@ -0,0 +1,113 @@
+"""
+Buffered Log Sink for CTkTextbox / tk.Text
+===========================================
+
+Text widgets must only be touched from the Tk main thread, and every
+``insert`` + ``see("end")`` forces a relayout. Worker threads that log
+line-by-line (batch processing, transcription, conversion) therefore make
+the UI slow and are not thread-safe.
+
+TextboxLogSink:
+- ``write()`` is safe from any thread: it only appends to a buffer
+- The first write after a flush asks the UI thread to wake (once)
+- ``flush()`` (UI thread) inserts everything buffered in ONE insert,
+  at most once per frame
+- The widget is capped at ``max_lines``, trimming the oldest lines
+"""
+
+import time
+import threading
+from typing import Callable, Optional
+
+
+class TextboxLogSink:
+    """
+    Thread-safe, frame-coalesced log writer for a text widget.
+    
+    Usage:
+        sink = TextboxLogSink(textbox, wake=lambda s: bridge.post("log_flush", s))
+        sink.write("Captured #1\\n")   # any thread
+        sink.flush()                   # UI thread (called via the wake)
+    """
+    
+    FRAME_MS = 16  # Minimum interval between two flushes (~60 fps)
+    
+    def __init__(
+        self,
+        textbox,
+        wake: Callable[["TextboxLogSink"], None],
+        max_lines: int = 2000,
+        schedule: Optional[Callable[[int, Callable[[], None]], object]] = None
+    ):
+        """
+        Initialize log sink.
+        
+        Args:
+            textbox: CTkTextbox / tk.Text to write into
+            wake: Called with this sink (from any thread) when the buffer needs flushing
+            max_lines: Maximum lines kept in the widget (oldest trimmed)
+            schedule: ``after(ms, func)`` used to defer a flush to the next frame
+                      (default: ``textbox.after``)
+        """
+        self.textbox = textbox
+        self.max_lines = max_lines
+        self._wake = wake
+        self._schedule = schedule or textbox.after
+        self._lock = threading.Lock()
+        self._buffer = []
+        self._flush_pending = False
+        self._last_flush = 0.0
+        
+        # Stats
+        self.messages_written = 0
+        self.flushes = 0
+    
+    def write(self, message: str):
+        """Buffer a message (safe from any thread)."""
+        with self._lock:
+            self._buffer.append(message)
+            self.messages_written += 1
+            if self._flush_pending:
+                return
+            self._flush_pending = True
+        
+        self._wake(self)
+    
+    def flush(self):
+        """Write buffered messages to the widget (UI thread only)."""
+        # Coalesce to one insert per frame
+        elapsed_ms = (time.perf_counter() - self._last_flush) * 1000
+        if elapsed_ms < self.FRAME_MS:
+            self._schedule(int(self.FRAME_MS - elapsed_ms) + 1, self.flush)
+            return
+        
+        with self._lock:
+            text = "".join(self._buffer)
+            self._buffer.clear()
+            self._flush_pending = False
+        
+        if not text:
+            return
+        
+        self._last_flush = time.perf_counter()
+        self.flushes += 1
+        
+        try:
+            self.textbox.insert("end", text)
+            self._trim()
+            self.textbox.see("end")
+        except Exception as e:
+            print(f"[LogSink] Flush error: {e}")
+    
+    def _trim(self):
+        """Delete oldest lines above max_lines."""
+        line_count = int(self.textbox.index("end-1c").split(".")[0])
+        excess = line_count - self.max_lines
+        if excess > 0:
+            self.textbox.delete("1.0", f"{excess + 1}.0")
+    
+    def clear(self):
+        """Drop buffered messages and clear the widget (UI thread only)."""
+        with self._lock:
+            self._buffer.clear()
+        self.textbox.delete("1.0", "end")
@@ -0,0 +1,315 @@
+"""
+Notification Scheduler - Priority, Coalescing and Replay for the HUD
+====================================================================
+
+NotificationScheduler (Tk thread only):
+- Priorities: result > error > info. A lower-priority notification never
+  replaces a visible higher-priority one; it waits until the HUD hides
+- Coalescing: at most ONE pending notification per kind. A newer result
+  replaces the pending one (the older goes straight to history), errors
+  are merged into one notification with a count, info is replaced
+- Stale drop: pending notifications older than ``max_age_s[kind]`` are
+  dropped (results are still kept in history)
+- Minimum on-screen time: a shown notification stays at least
+  ``min_display_ms`` before anything replaces it
+- Held results: results can wait for the user (double-click) via
+  ``hold=True`` + ``release()``
+- Bounded history deque; ``replay()`` steps back through it
+"""
+
+import time
+import itertools
+from collections import deque
+from datetime import datetime
+from typing import Callable, Dict, Optional
+
+
+# Kind priorities (higher wins)
+PRIORITIES = {'result': 3, 'error': 2, 'info': 1}
+
+# HUD notification_type -> kind
+TYPE_KINDS = {'success': 'result', 'error': 'error', 'warning': 'info', 'info': 'info'}
+
+DEFAULT_MAX_AGE_S = {'result': 600.0, 'error': 30.0, 'info': 5.0}
+
+
+class Notification:
+    """A pending or shown HUD notification."""
+    
+    __slots__ = ("id", "kind", "title", "message", "notification_type",
+                 "created", "count", "held", "replay")
+    
+    def __init__(self, notif_id: int, kind: str, title: str, message: str,
+                 notification_type: str, created: float, held: bool = False, replay: bool = False):
+        self.id = notif_id
+        self.kind = kind
+        self.title = title
+        self.message = message
+        self.notification_type = notification_type
+        self.created = created
+        self.count = 1
+        self.held = held
+        self.replay = replay
+    
+    @property
+    def priority(self) -> int:
+        return PRIORITIES.get(self.kind, 0)
+    
+    def to_dict(self) -> dict:
+        return {
+            'title': self.title,
+            'message': self.message,
+            'notification_type': self.notification_type,
+        }
+
+
+class NotificationScheduler:
+    """
+    Decides what the HUD shows, and when.
+    
+    Usage:
+        scheduler = NotificationScheduler(root, show=hud_show)
+        hud = HUDOverlay(..., on_hidden=scheduler.on_hidden)
+        scheduler.submit("Analysis Complete", text, "success", hold=True)
+        scheduler.release()   # user asked for the result
+        scheduler.replay()    # re-show the last notification
+    """
+    
+    def __init__(
+        self,
+        root,
+        show: Callable[[dict], None],
+        min_display_ms: int = 1500,
+        max_age_s: Optional[Dict[str, float]] = None,
+        history_size: int = 10,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize scheduler.
+        
+        Args:
+            root: Tk widget whose ``after()`` schedules deferred dispatch
+            show: Puts a notification dict (title/message/notification_type)
+                  on the HUD, replacing what is there
+            min_display_ms: Minimum on-screen time before being replaced
+            max_age_s: Per-kind age after which a pending notification is dropped
+            history_size: Notifications kept for replay
+            clock: Monotonic time source (seconds)
+        """
+        self._root = root
+        self._show = show
+        self.min_display_ms = min_display_ms
+        self.max_age_s = dict(DEFAULT_MAX_AGE_S, **(max_age_s or {}))
+        self._clock = clock
+        
+        self._ids = itertools.count(1)
+        self._pending: Dict[str, Notification] = {}
+        self._current: Optional[Notification] = None
+        self._shown_at = 0.0
+        self._dispatch_job = None
+        self._replay_index = None
+        
+        self.history = deque(maxlen=history_size)
+        
+        # Stats
+        self.shown = 0
+        self.coalesced = 0
+        self.dropped = 0
+    
+    @property
+    def current(self) -> Optional[Notification]:
+        return self._current
+    
+    def pending_count(self, kind: Optional[str] = None) -> int:
+        if kind is None:
+            return len(self._pending)
+        return 1 if kind in self._pending else 0
+    
+    # ==================== SUBMIT ====================
+    
+    def submit(
+        self,
+        title: str,
+        message: str,
+        notification_type: str = "info",
+        kind: Optional[str] = None,
+        hold: bool = False
+    ) -> Notification:
+        """
+        Queue a notification (Tk thread).
+        
+        Args:
+            title: HUD title
+            message: HUD message
+            notification_type: HUD style ("success", "error", "info", "warning")
+            kind: Scheduling kind (default: derived from notification_type)
+            hold: Keep pending until ``release()`` (results shown on demand)
+        
+        Returns:
+            Notification: The pending (possibly coalesced) notification
+        """
+        kind = kind or TYPE_KINDS.get(notification_type, 'info')
+        now = self._clock()
+        incoming = Notification(next(self._ids), kind, title, message, notification_type, now, held=hold)
+        
+        existing = self._pending.get(kind)
+        if existing is not None:
+            incoming = self._coalesce(existing, incoming)
+        self._pending[kind] = incoming
+        
+        self._dispatch()
+        return incoming
+    
+    def _coalesce(self, older: Notification, newer: Notification) -> Notification:
+        """Merge a new notification into the pending one of the same kind."""
+        self.coalesced += 1
+        
+        if newer.kind == 'error':
+            # One error notification listing every distinct message
+            messages = older.message.split("\n")
+            if newer.message not in messages:
+                messages.append(newer.message)
+            newer.message = "\n".join(messages)
+            newer.count = older.count + 1
+            newer.title = f"{newer.title} (x{newer.count})"
+            newer.created = older.created  # Age of the oldest error
+            return newer
+        
+        if newer.kind == 'result':
+            # Newest result wins; the older one stays reachable via replay
+            self._record(older)
+            newer.held = newer.held and older.held
+        return newer
+    
+    # ==================== DISPATCH ====================
+    
+    def _drop_stale(self, now: float):
+        for kind, notification in list(self._pending.items()):
+            max_age = self.max_age_s.get(kind)
+            if max_age is not None and now - notification.created > max_age:
+                del self._pending[kind]
+                self.dropped += 1
+                if kind == 'result':
+                    self._record(notification)
+    
+    def _next_candidate(self) -> Optional[Notification]:
+        ready = [n for n in self._pending.values() if not n.held]
+        if not ready:
+            return None
+        return max(ready, key=lambda n: (n.priority, -n.created))
+    
+    def _dispatch(self):
+        """Show the best pending notification if the HUD can take it."""
+        self._cancel_dispatch()
+        now = self._clock()
+        self._drop_stale(now)
+        
+        candidate = self._next_candidate()
+        if candidate is None:
+            return
+        
+        if self._current is not None:
+            if candidate.priority < self._current.priority:
+                return  # Wait for on_hidden()
+            remaining_ms = self.min_display_ms - (now - self._shown_at) * 1000
+            if remaining_ms > 0:
+                self._dispatch_job = self._root.after(int(remaining_ms) + 1, self._dispatch)
+                return
+        
+        del self._pending[candidate.kind]
+        self._display(candidate, now)
+    
+    def _display(self, notification: Notification, now: float):
+        self._current = notification
+        self._shown_at = now
+        if not notification.replay:
+            self._replay_index = None
+            self._record(notification)
+        self.shown += 1
+        self._show(notification.to_dict())
+    
+    def _cancel_dispatch(self):
+        if self._dispatch_job is not None:
+            try:
+                self._root.after_cancel(self._dispatch_job)
+            except Exception:
+                pass
+            self._dispatch_job = None
+    
+    def on_hidden(self):
+        """HUD hid the current notification (auto-dismiss or user) - show the next one."""
+        self._current = None
+        self._dispatch()
+    
+    # ==================== HELD RESULTS / REPLAY ====================
+    
+    def release(self, kind: str = 'result') -> bool:
+        """
+        Let a held notification show now (the minimum on-screen time of the
+        current one still applies).
+        
+        Returns:
+            bool: True if something was pending
+        """
+        notification = self._pending.get(kind)
+        if notification is None:
+            return False
+        notification.held = False
+        # The user asked for it - don't let the stale check drop it now
+        notification.created = self._clock()
+        self._dispatch()
+        return True
+    
+    def clear(self, kind: Optional[str] = None):
+        """Drop pending notifications (all, or one kind)."""
+        if kind is None:
+            self._pending.clear()
+        else:
+            self._pending.pop(kind, None)
+        self._cancel_dispatch()
+    
+    def _record(self, notification: Notification):
+        entry = notification.to_dict()
+        entry['timestamp'] = datetime.now().isoformat()
+        self.history.append(entry)
+    
+    def replay(self) -> bool:
+        """
+        Re-show a notification from history, stepping one further back on
+        each call while replaying. Shown immediately (user request).
+        
+        Returns:
+            bool: False if history is empty
+        """
+        if not self.history:
+            return False
+        
+        if self._replay_index is None:
+            # Skip the notification that is on screen right now
+            index = len(self.history) - 1
+            if self._current is not None and not self._current.replay and index > 0:
+                index -= 1
+        else:
+            index = self._replay_index - 1
+            if index < 0:
+                index = len(self.history) - 1
+        self._replay_index = index
+        
+        entry = self.history[index]
+        notification = Notification(
+            next(self._ids), TYPE_KINDS.get(entry['notification_type'], 'info'),
+            entry['title'], entry['message'], entry['notification_type'],
+            self._clock(), replay=True
+        )
+        self._cancel_dispatch()
+        self._display(notification, self._clock())
+        return True
+    
+    def stats(self) -> dict:
+        return {
+            'shown': self.shown,
+            'coalesced': self.coalesced,
+            'dropped': self.dropped,
+            'pending': len(self._pending),
+            'history': len(self.history),
+        }
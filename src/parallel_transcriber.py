@@ -0,0 +1,208 @@
+"""
+Parallel Transcriber - Long Audio Recognized Chunk by Chunk, Concurrently
+=========================================================================
+
+ParallelTranscriber:
+1. Decodes the file once to 16 kHz mono 16-bit WAV in the temp folder,
+   feeding an ``EnergyVAD`` on the way (constant memory)
+2. Cuts it into chunks of at most ``max_chunk_s`` in the middle of pauses
+   (``vad.chunk_bounds``) - no word is split
+3. Recognizes the chunks with ``engine.recognize_stream`` on up to
+   ``concurrency`` worker threads, each streaming its chunk from the WAV
+4. Shifts every segment by its chunk's start and reassembles them in
+   order; ``on_segment`` streams finished chunks in order as well
+
+Azure counts every chunk as a concurrent request - keep ``concurrency``
+within the subscription's limit (F0: 1, S0: 100 by default).
+"""
+
+import os
+import threading
+import time
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
+
+from src.audio_decoder import TARGET_RATE, decode_to_wav
+from src.stt_engine import Segment, Transcript
+from src.vad import EnergyVAD, chunk_bounds
+
+
+class ParallelTranscriber:
+    """
+    Splits long audio at pauses and recognizes the chunks concurrently.
+    
+    Usage:
+        transcriber = ParallelTranscriber(engine, concurrency=4)
+        transcript = transcriber.transcribe("lecture.mp3", on_segment=print)
+    """
+    
+    def __init__(
+        self,
+        engine,
+        concurrency: int = 4,
+        max_chunk_s: float = 60.0,
+        min_silence_s: float = 0.4,
+        temp_folder: Optional[str] = None,
+        block_s: float = 1.0
+    ):
+        """
+        Args:
+            engine: STTEngine with ``recognize_stream``
+            concurrency: Chunks recognized at the same time
+            max_chunk_s: Longest chunk (cut at the last pause before it)
+            min_silence_s: Shortest pause that may be cut at
+            temp_folder: Where the decoded WAV goes (default: system temp)
+            block_s: Decode / push block length
+        """
+        self.engine = engine
+        self.concurrency = max(int(concurrency), 1)
+        self.max_chunk_s = max_chunk_s
+        self.min_silence_s = min_silence_s
+        self.temp_folder = temp_folder
+        self.block_s = block_s
+        
+        # Stats of the last run
+        self.chunks: List[Tuple[float, float]] = []
+        self.timings = {}
+    
+    # ==================== RECOGNIZE ====================
+    
+    def _recognize_chunk(self, wav_path: str, start_s: float, end_s: float, language: str) -> Transcript:
+        """Stream one chunk from the WAV into its own session; offsets shifted to the file."""
+        session = self.engine.recognize_stream(TARGET_RATE, language)
+        block = int(self.block_s * TARGET_RATE)
+        with wave.open(wav_path, "rb") as wav:
+            wav.setpos(int(start_s * TARGET_RATE))
+            remaining = int(end_s * TARGET_RATE) - int(start_s * TARGET_RATE)
+            while remaining > 0:
+                pcm = wav.readframes(min(block, remaining))
+                if not pcm:
+                    break
+                session.write(pcm)
+                remaining -= len(pcm) // 2
+        session.end()
+        transcript = session.wait()
+        segments = [Segment(segment.text, segment.offset_s + start_s, segment.duration_s)
+                    for segment in transcript.segments]
+        return Transcript(segments, transcript.error)
+    
+    def transcribe(
+        self,
+        path: str,
+        language: str = "vi-VN",
+        on_segment: Optional[Callable[[Segment], None]] = None,
+        on_progress: Optional[Callable[[int, int], None]] = None
+    ) -> Transcript:
+        """
+        Transcribe ``path`` (blocking).
+        
+        Args:
+            path: Any file ``audio_decoder`` can read
+            language: Recognition language
+            on_segment: Called with each Segment, in audio order (worker threads)
+            on_progress: Called with (chunks_done, chunks_total)
+        
+        Returns:
+            Transcript of the whole file; ``error`` names the first failed
+            chunk (the other chunks' segments are kept)
+        
+        Raises:
+            RuntimeError: Missing dependency, unreadable file or unavailable engine
+        """
+        if not os.path.exists(path):
+            raise RuntimeError(f"File not found: {path}")
+        started = time.perf_counter()
+        vad = EnergyVAD(TARGET_RATE, min_silence_s=self.min_silence_s)
+        wav_path, temporary = decode_to_wav(path, self.temp_folder, vad.feed, self.block_s)
+        try:
+            prepared = time.perf_counter()
+            self.chunks = chunk_bounds(vad.silences(), vad.duration_s, self.max_chunk_s)
+            results = [None] * len(self.chunks)
+            lock = threading.Lock()
+            state = {'next': 0, 'done': 0}
+            
+            def run(index: int):
+                start_s, end_s = self.chunks[index]
+                try:
+                    result = self._recognize_chunk(wav_path, start_s, end_s, language)
+                except Exception as e:
+                    result = Transcript([], str(e))
+                with lock:
+                    results[index] = result
+                    state['done'] += 1
+                    # Release finished chunks in order
+                    while state['next'] < len(results) and results[state['next']] is not None:
+                        if on_segment:
+                            for segment in results[state['next']].segments:
+                                on_segment(segment)
+                        state['next'] += 1
+                    if on_progress:
+                        on_progress(state['done'], len(results))
+            
+            with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="ChunkRecognizer") as pool:
+                list(pool.map(run, range(len(self.chunks))))
+        finally:
+            if temporary:
+                os.remove(wav_path)
+        
+        segments = [segment for result in results for segment in result.segments]
+        error = next((f"Chunk {index + 1} ({self.chunks[index][0]:.0f}s): {result.error}"
+                      for index, result in enumerate(results) if result.error), None)
+        self.timings = {
+            'prepare_s': round(prepared - started, 3),
+            'recognize_s': round(time.perf_counter() - prepared, 3),
+        }
+        return Transcript(segments, error)
+
+
+# ==================== BENCHMARK ====================
+if __name__ == "__main__":
+    import sys
+    import tempfile
+    
+    from src.audio_recorder import _import_numpy
+    from src.stt_engine import LocalStubEngine
+    
+    np = _import_numpy()
+    minutes = float(sys.argv[1]) if len(sys.argv) > 1 else 20.0
+    rng = np.random.default_rng(7)
+    
+    with tempfile.TemporaryDirectory() as folder:
+        # "Lecture": 2-12 s of noisy tone (speech), 0.3-1.5 s of quiet noise (pauses)
+        path = os.path.join(folder, "lecture.wav")
+        total = 0
+        with wave.open(path, "wb") as out:
+            out.setnchannels(1)
+            out.setsampwidth(2)
+            out.setframerate(TARGET_RATE)
+            while total < minutes * 60 * TARGET_RATE:
+                speech = int(rng.uniform(2, 12) * TARGET_RATE)
+                pause = int(rng.uniform(0.3, 1.5) * TARGET_RATE)
+                t = np.arange(speech) / TARGET_RATE
+                voiced = 0.3 * np.sin(2 * np.pi * 180 * t) + 0.05 * rng.standard_normal(speech)
+                quiet = 0.002 * rng.standard_normal(pause)
+                samples = np.concatenate((voiced, quiet))
+                out.writeframes((samples * 32767).astype("<i2").tobytes())
+                total += len(samples)
+        
+        print("=" * 60)
+        print(f"  PARALLEL TRANSCRIPTION ({minutes:g} min file, stub recognizer 20 ms/segment)")
+        print("=" * 60)
+        baseline = None
+        for workers in (1, 2, 4, 8):
+            engine = LocalStubEngine(segment_s=5.0, delay_s=0.02)
+            transcriber = ParallelTranscriber(engine, concurrency=workers, max_chunk_s=60.0)
+            streamed = []
+            start = time.perf_counter()
+            transcript = transcriber.transcribe(path, on_segment=streamed.append)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            offsets = [segment.offset_s for segment in streamed]
+            print(f"  workers={workers}: {elapsed:6.2f}s wall, speedup {baseline / elapsed:4.1f}x, "
+                  f"{len(transcriber.chunks)} chunks, {len(transcript.segments)} segments, "
+                  f"streamed in order: {offsets == sorted(offsets)}, "
+                  f"covered {transcript.duration_s:.0f}s, error: {transcript.error}")
+        lengths = [end - start for start, end in transcriber.chunks]
+        print(f"  chunk length: min {min(lengths):.1f}s, max {max(lengths):.1f}s "
+              f"(cut in pauses, max_chunk_s=60)")
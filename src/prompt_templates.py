@@ -0,0 +1,82 @@
+"""
+Prompt Templates
+Built-in prompt templates shared by the GUI, headless engine and local API.
+"""
+
+DEFAULT_TEMPLATE = "Answer Questions"
+
+PROMPT_TEMPLATES = {
+    "Answer Questions": """You are an AI assistant specialized in answering questions from screenshots.
+
+TASK: Analyze the screenshot and answer any questions shown.
+
+RULES:
+1. Multiple choice: Answer with letter (A/B/C/D) + content (NO explanation)
+2. Short answer: Direct, concise answer
+3. Multiple questions: Number each answer
+4. Multiple images: Analyze in order
+
+OUTPUT FORMAT:
+- NO repeating the question
+- Maximum brevity
+- Use bullet points when appropriate""",
+
+    "Code Analysis": """You are a code analysis expert.
+
+Analyze the code in the screenshot and provide:
+1. Language detection
+2. Purpose/functionality
+3. Issues/bugs found
+4. Optimization suggestions
+5. Security concerns if any
+
+Be concise and technical.""",
+
+    "Translate to Vietnamese": """Translate all text in the image to Vietnamese.
+
+Rules:
+- Maintain original formatting
+- Technical terms: keep English in brackets
+- Natural, fluent translation
+- No explanations needed""",
+
+    "Math Solver": """You are a math problem solver.
+
+Solve any math problems shown in the image:
+1. Show step-by-step solution
+2. Box the final answer
+3. Explain key formulas used
+4. For graphs: describe the solution visually""",
+
+    "Text Extraction": """Extract all text from the image (OCR).
+
+Output:
+- Preserve original structure
+- Maintain formatting (headers, lists, etc.)
+- Include any visible numbers/dates
+- Note any unclear/unreadable parts""",
+
+    "General Analysis": """Analyze this screenshot intelligently.
+
+Auto-detect content type and provide appropriate response:
+- Questions → Answer them
+- Code → Analyze and suggest improvements  
+- Text → Summarize or extract
+- Charts → Explain data insights
+- UI → Provide UX feedback
+
+Be concise and actionable."""
+}
+
+
+def get_template(name: str) -> str:
+    """
+    Get a template prompt by name.
+    
+    Args:
+        name: Template name (e.g. "Answer Questions", "Math Solver")
+    
+    Returns:
+        str: Prompt text ("" if the template doesn't exist)
+    """
+    return PROMPT_TEMPLATES.get(name, "")
@@ -268,6 +268,29 @@ class ResourceTracker:
 
 # Utility functions
 
+def get_user_data_dir(app_name: str = "SnapCapAI") -> str:
+    """
+    Get the per-user data directory (created if missing).
+    
+    - Windows: %APPDATA%\\SnapCapAI
+    - Other: $XDG_DATA_HOME/SnapCapAI or ~/.local/share/SnapCapAI
+    
+    Unlike the script/EXE directory, this location is writable and
+    survives PyInstaller one-file extraction folders being deleted.
+    
+    Returns:
+        str: Absolute path to the data directory
+    """
+    if os.name == 'nt':
+        base = os.environ.get('APPDATA') or os.path.expanduser('~')
+    else:
+        base = os.environ.get('XDG_DATA_HOME') or os.path.join(os.path.expanduser('~'), '.local', 'share')
+    
+    path = os.path.join(base, app_name)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
 def safe_remove(path: str, ignore_errors: bool = True) -> bool:
     """
     Safely remove a file or directory.
@@ -0,0 +1,358 @@
+"""
+Silence Trimmer - Don't Send (and Pay For) Silence
+==================================================
+
+``trim_silence``:
+1. Decodes to 16 kHz mono WAV while an ``EnergyVAD`` (level + zero-crossing
+   rate, vectorized per block) scores every 30 ms frame
+2. Keeps the speech (padded by ``pad_s``) and shortens every pause to
+   ``keep_silence_s`` - leading/trailing silence to half of it
+3. Writes only the kept parts to a new WAV, block by block
+4. Returns a ``TimestampMap`` so segment offsets recognized in the trimmed
+   audio can be put back on the original timeline, and the seconds saved
+
+Files where trimming would save less than ``min_saving_s`` are used as-is.
+Trimming reads the whole file before recognition starts, so it is only used
+where a file is needed anyway (parallel recognition reads chunks of it).
+
+``SilenceGate`` does the same for streamed audio (a recording pushed to the
+recognizer while it records, or a file via ``recognize_decoded``): it sits
+in front of the push stream, decides per 30 ms frame with a noise floor
+over the last minute, and drops silence beyond ``pad_s + keep_silence_s / 2``
+after speech (keeping up to that much before the next speech).
+
+Requires: pip install numpy soundfile
+"""
+
+import os
+import tempfile
+import wave
+from collections import deque
+from typing import Callable, NamedTuple, Optional
+
+from src.audio_decoder import TARGET_RATE, decode_to_wav
+from src.audio_recorder import _import_numpy
+from src.vad import EnergyVAD, TimestampMap, keep_intervals
+
+
+MIN_KEPT_S = 1.0  # Less kept than this: the VAD likely misjudged the audio, use it untrimmed
+
+
+class TrimResult(NamedTuple):
+    """A (possibly) shortened copy of an audio file."""
+    path: str                   # WAV to recognize
+    timestamps: TimestampMap    # Trimmed time -> original time
+    original_s: float
+    temporary: bool             # Delete ``path`` when done
+    
+    @property
+    def trimmed_s(self) -> float:
+        return self.timestamps.duration_s
+    
+    @property
+    def saved_s(self) -> float:
+        return self.original_s - self.trimmed_s
+    
+    def report(self) -> str:
+        return _report(self.original_s, self.trimmed_s)
+
+
+def _report(original_s: float, trimmed_s: float) -> str:
+    """e.g. "42.3s of silence removed (300.0s -> 257.7s, 14%)"."""
+    saved_s = max(original_s - trimmed_s, 0.0)
+    percent = saved_s / original_s * 100 if original_s else 0.0
+    return f"{saved_s:.1f}s of silence removed ({original_s:.1f}s -> {trimmed_s:.1f}s, {percent:.0f}%)"
+
+
+def _copy_intervals(source_path: str, target_path: str, intervals, block_s: float = 1.0):
+    """Copy the (start_s, end_s) ranges of a 16 kHz mono WAV into a new one."""
+    block = int(block_s * TARGET_RATE)
+    with wave.open(source_path, "rb") as source, wave.open(target_path, "wb") as target:
+        target.setnchannels(1)
+        target.setsampwidth(2)
+        target.setframerate(TARGET_RATE)
+        for start_s, end_s in intervals:
+            source.setpos(int(start_s * TARGET_RATE))
+            remaining = int(end_s * TARGET_RATE) - int(start_s * TARGET_RATE)
+            while remaining > 0:
+                pcm = source.readframes(min(block, remaining))
+                if not pcm:
+                    break
+                target.writeframes(pcm)
+                remaining -= len(pcm) // 2
+
+
+def trim_silence(
+    path: str,
+    folder: Optional[str] = None,
+    keep_silence_s: float = 0.3,
+    pad_s: float = 0.15,
+    min_saving_s: float = 1.0,
+    vad: Optional[EnergyVAD] = None
+) -> TrimResult:
+    """
+    Make a copy of ``path`` without its silence.
+    
+    Args:
+        path: Any file ``audio_decoder`` can read
+        folder: Where the trimmed WAV goes (default: system temp)
+        keep_silence_s: Pauses are shortened to this (never removed - the
+                        recognizer uses them to end sentences)
+        pad_s: Audio kept around detected speech so word edges aren't clipped
+        min_saving_s: Trim only if it saves at least this much
+        vad: Detector to use (default: ``EnergyVAD()`` at 16 kHz)
+    
+    Returns:
+        TrimResult (``path`` may be the input itself when nothing was trimmed)
+    
+    Raises:
+        RuntimeError: Missing dependency or unreadable file
+    """
+    vad = vad or EnergyVAD(TARGET_RATE)
+    wav_path, decoded = decode_to_wav(path, folder, vad.feed)
+    duration_s = vad.duration_s
+    
+    intervals = keep_intervals(vad.speech_regions(pad_s), duration_s, keep_silence_s)
+    timestamps = TimestampMap(intervals)
+    if duration_s - timestamps.duration_s < min_saving_s:
+        return TrimResult(wav_path, TimestampMap.identity(duration_s), duration_s, decoded)
+    
+    handle, trimmed = tempfile.mkstemp(suffix=".wav", prefix="trimmed_", dir=folder)
+    os.close(handle)
+    try:
+        _copy_intervals(wav_path, trimmed, intervals)
+    except Exception:
+        os.remove(trimmed)
+        raise
+    finally:
+        if decoded:
+            os.remove(wav_path)
+    return TrimResult(trimmed, timestamps, duration_s, True)
+
+
+class SilenceGate:
+    """
+    Streaming silence trimmer between a recorder and a recognizer stream.
+    
+    Usage:
+        gate = SilenceGate(lambda block: session.write(float_to_pcm16(block)))
+        recorder = StreamingRecorder(path, sinks=[gate.write])
+        ...
+        gate.flush()
+        segment = gate.timestamps.map_segment(segment)
+    """
+    
+    def __init__(
+        self,
+        sink: Callable,
+        sample_rate: int = TARGET_RATE,
+        keep_silence_s: float = 0.3,
+        pad_s: float = 0.15,
+        floor_window_s: float = 60.0,
+        warmup_s: float = 1.0,
+        vad: Optional[EnergyVAD] = None
+    ):
+        """
+        Args:
+            sink: Called with float32 mono blocks of the audio that is kept
+            sample_rate: Samples per second
+            keep_silence_s: Pauses are shortened to about this
+            pad_s: Audio kept around speech so word edges aren't clipped
+            floor_window_s: Noise floor from this much recent audio
+            warmup_s: Passed through unfiltered while the floor settles
+            vad: Detector to use (default: ``EnergyVAD()`` at ``sample_rate``)
+        """
+        np = _import_numpy()
+        self.sink = sink
+        self.vad = vad or EnergyVAD(sample_rate)
+        self.sample_rate = sample_rate
+        frame_s = self.vad.frame_s
+        self._hang = int(round((pad_s + keep_silence_s / 2) / frame_s))  # Silence kept after speech
+        self._held = deque(maxlen=self._hang)                             # ... and before it
+        self._window = max(int(floor_window_s / frame_s), 1)
+        self._warmup = int(warmup_s / frame_s)
+        self._silent_run = self._hang  # Start as if after a long pause
+        self._pending = np.zeros(0, dtype="float32")
+        self._frames = 0               # Frames classified so far
+        self.timestamps = TimestampMap()
+    
+    @property
+    def original_s(self) -> float:
+        return self.vad.duration_s
+    
+    @property
+    def saved_s(self) -> float:
+        return self.original_s - self.timestamps.duration_s
+    
+    def report(self) -> str:
+        return _report(self.original_s, self.timestamps.duration_s)
+    
+    def write(self, block):
+        """Recorder sink: a float32 (frames, channels) or (frames,) block."""
+        np = _import_numpy()
+        mono = block[:, 0] if block.ndim == 2 else block
+        self.vad.feed(mono)
+        self._pending = np.concatenate((self._pending, mono))
+        
+        frame_len = self.vad.frame_len
+        new_frames = len(self.vad.levels()) - self._frames
+        if new_frames <= 0:
+            return
+        speech = self.vad.speech_mask(self._frames, self._window)
+        speech[:max(self._warmup - self._frames, 0)] = True
+        
+        kept = []
+        for index in range(new_frames):
+            frame = self._pending[index * frame_len:(index + 1) * frame_len]
+            start_s = (self._frames + index) * self.vad.frame_s
+            if speech[index]:
+                # Speech: the silence held just before it goes out first
+                kept.extend(self._held)
+                self._held.clear()
+                kept.append((start_s, frame))
+                self._silent_run = 0
+            elif self._silent_run < self._hang:
+                kept.append((start_s, frame))
+                self._silent_run += 1
+            else:
+                self._held.append((start_s, frame))  # Oldest held frames fall out = dropped
+        self._pending = self._pending[new_frames * frame_len:]
+        self._frames += new_frames
+        self._emit(kept)
+    
+    def flush(self):
+        """End of audio: the tail shorter than a frame goes out if it follows speech."""
+        if len(self._pending) and self._silent_run < self._hang:
+            self._emit([(self._frames * self.vad.frame_s, self._pending)])
+        self._pending = self._pending[:0]
+    
+    def _emit(self, kept):
+        if not kept:
+            return
+        np = _import_numpy()
+        for start_s, frame in kept:
+            self.timestamps.extend(start_s, start_s + len(frame) / self.sample_rate)
+        self.sink(np.concatenate([frame for _, frame in kept]))
+
+
+# ==================== BENCHMARK ====================
+if __name__ == "__main__":
+    import time
+    
+    from src.stt_engine import Segment
+    
+    np = _import_numpy()
+    rng = np.random.default_rng(3)
+    
+    def noise(seconds, level):
+        return level * rng.standard_normal(int(seconds * TARGET_RATE))
+    
+    def voiced(seconds):
+        t = np.arange(int(seconds * TARGET_RATE)) / TARGET_RATE
+        return 0.3 * np.sin(2 * np.pi * 160 * t) * (0.6 + 0.4 * np.sin(2 * np.pi * 3 * t))
+    
+    # A recording: 12 s before the speaker starts, "words" with short gaps,
+    # long mid-recording pauses, a quiet fricative ("s") and 20 s before Stop
+    room = 0.003
+    parts, speech_onsets, fricative_onsets = [], [], []
+    
+    def add(samples, onsets=None):
+        if onsets is not None:
+            onsets.append(sum(len(part) for part in parts) / TARGET_RATE)
+        parts.append(samples + room * rng.standard_normal(len(samples)))
+    
+    add(noise(12, 0))
+    for minute in range(5):
+        for _ in range(8):
+            add(voiced(rng.uniform(1.5, 4)), speech_onsets)
+            add(noise(rng.uniform(0.2, 0.6), 0))
+        add(noise(0.08, 0.007), fricative_onsets)  # "s": quiet, noisy
+        add(noise(rng.uniform(4, 15), 0))
+    add(noise(20, 0))
+    audio = np.concatenate(parts)
+    
+    def kept(result, onsets):
+        return sum(any(start <= onset < end for start, end in result.timestamps.intervals) for onset in onsets)
+    
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "recording.wav")
+        with wave.open(path, "wb") as out:
+            out.setnchannels(1)
+            out.setsampwidth(2)
+            out.setframerate(TARGET_RATE)
+            out.writeframes((np.clip(audio, -1, 1) * 32767).astype("<i2").tobytes())
+        
+        start = time.perf_counter()
+        result = trim_silence(path, folder)
+        elapsed = time.perf_counter() - start
+        
+        print("=" * 60)
+        print("  SILENCE TRIMMING (energy + zero-crossing VAD)")
+        print("=" * 60)
+        print(f"  {os.path.basename(path)}: {result.report()}")
+        print(f"  processed in {elapsed * 1000:.0f} ms ({result.original_s / elapsed:.0f}x real time)")
+        
+        # Every speech onset must survive and map back to where it was
+        trimmed_onsets = []
+        for onset in speech_onsets:
+            for (start_s, end_s), begin in zip(result.timestamps.intervals, result.timestamps._starts):
+                if start_s <= onset < end_s:
+                    trimmed_onsets.append(begin + onset - start_s)
+                    break
+        errors = [abs(result.timestamps.to_original(t) - onset) for t, onset in zip(trimmed_onsets, speech_onsets)]
+        print(f"  speech onsets kept: {len(trimmed_onsets)}/{len(speech_onsets)}, "
+              f"max mapping error {max(errors) * 1000:.2f} ms")
+        segment = result.timestamps.map_segment(Segment("hello", trimmed_onsets[-1], 0.05))
+        print(f"  last onset: trimmed {trimmed_onsets[-1]:.2f}s -> original {segment.offset_s:.2f}s "
+              f"(actual {speech_onsets[-1]:.2f}s)")
+        
+        print(f"  isolated fricatives kept: {kept(result, fricative_onsets)}/{len(fricative_onsets)}")
+        
+        energy_only = EnergyVAD(TARGET_RATE, zcr_threshold=2.0)  # Never matches
+        energy_result = trim_silence(path, folder, vad=energy_only)
+        print(f"  energy only: {kept(energy_result, fricative_onsets)}/{len(fricative_onsets)} "
+              f"isolated fricatives kept, {energy_result.report()}")
+        os.remove(result.path)
+        os.remove(energy_result.path)
+    
+    # Live: the same recording pushed block by block through the gate
+    sent = []
+    gate = SilenceGate(sent.append)
+    start = time.perf_counter()
+    for offset in range(0, len(audio), 4096):
+        gate.write(audio[offset:offset + 4096].astype("float32").reshape(-1, 1))
+    gate.flush()
+    elapsed = time.perf_counter() - start
+    onset_errors = []
+    for onset in speech_onsets:
+        for (start_s, end_s), begin in zip(gate.timestamps.intervals, gate.timestamps._starts):
+            if start_s <= onset < end_s:
+                onset_errors.append(abs(gate.timestamps.to_original(begin + onset - start_s) - onset))
+                break
+    print(f"  live gate: {gate.report()}, {sum(len(block) for block in sent) / TARGET_RATE:.1f}s sent, "
+          f"{elapsed * 1000:.0f} ms for {gate.original_s:.0f}s of audio")
+    print(f"  live gate: speech onsets kept {len(onset_errors)}/{len(speech_onsets)}, "
+          f"max mapping error {max(onset_errors) * 1000:.2f} ms, "
+          f"fricatives kept {kept(gate, fricative_onsets)}/{len(fricative_onsets)}")
+    assert len(onset_errors) == len(speech_onsets) and max(onset_errors) < 1e-3
+    
+    # No real pauses: loud continuous speech-like audio (compressed speech,
+    # speech over music) must be kept whole, not taken for one long silence
+    t = np.arange(60 * TARGET_RATE) / TARGET_RATE
+    loud = 0.3 * np.sin(2 * np.pi * 160 * t) * (0.8 + 0.2 * np.sin(2 * np.pi * 3 * t)) + noise(60, 0.01)
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "continuous.wav")
+        with wave.open(path, "wb") as out:
+            out.setnchannels(1)
+            out.setsampwidth(2)
+            out.setframerate(TARGET_RATE)
+            out.writeframes((np.clip(loud, -1, 1) * 32767).astype("<i2").tobytes())
+        result = trim_silence(path, folder)
+        if result.temporary:
+            os.remove(result.path)
+    gate = SilenceGate(lambda block: None)
+    for offset in range(0, len(loud), 4096):
+        gate.write(loud[offset:offset + 4096].astype("float32"))
+    gate.flush()
+    print(f"  continuous speech (no pauses): file {result.report()}, live gate {gate.report()}")
+    assert result.trimmed_s > 59 and gate.timestamps.duration_s > 59
@@ -0,0 +1,228 @@
+"""
+Startup Profiler - In-Process Cold Start Timing
+================================================
+
+Enabled with ``--profile-startup`` (or ``--profile-startup=report.json``).
+
+Collects, in-process (no ``-X importtime`` needed, works in the frozen EXE):
+- Import time per module (self + cumulative, like ``-X importtime``)
+- Time spent in each UI builder method (``_create_*``)
+- Marks: imports done, window constructed, first idle
+
+The result is written as a JSON report so startup regressions can be
+compared between releases.
+
+IMPORTANT: The profiler must be created BEFORE the heavy imports it should
+measure (customtkinter, PIL, ...).
+"""
+
+import os
+import sys
+import json
+import time
+import builtins
+import functools
+import platform
+from contextlib import contextmanager
+from typing import Optional
+
+
+PROFILE_FLAG = "--profile-startup"
+
+
+class StartupProfiler:
+    """
+    Collects import, builder and milestone timings during startup.
+    
+    Usage:
+        profiler = StartupProfiler.from_argv(sys.argv)   # None if flag absent
+        if profiler:
+            profiler.install_import_hook()
+        ...
+        profiler.instrument_methods(app, "_create_")
+        app.after_idle(lambda: profiler.finish())
+    """
+    
+    def __init__(self, report_path: Optional[str] = None):
+        """
+        Initialize profiler. Time zero is the moment of construction.
+        
+        Args:
+            report_path: Where to write the JSON report (default: per-user data dir)
+        """
+        self.report_path = report_path
+        self._t0 = time.perf_counter()
+        self._marks = {}
+        self._imports = {}   # module -> [self_s, cumulative_s]
+        self._builders = {}  # name -> [self_s, cumulative_s, calls]
+        self._stack = []     # child time accumulators for nested timing
+        self._original_import = None
+        self._finished = False
+    
+    @classmethod
+    def from_argv(cls, argv: list) -> Optional["StartupProfiler"]:
+        """
+        Create a profiler if ``--profile-startup`` is present in argv.
+        
+        Accepts ``--profile-startup`` and ``--profile-startup=PATH``.
+        """
+        for arg in argv[1:]:
+            if arg == PROFILE_FLAG:
+                return cls()
+            if arg.startswith(PROFILE_FLAG + "="):
+                return cls(arg.split("=", 1)[1] or None)
+        return None
+    
+    # ==================== TIMING PRIMITIVES ====================
+    
+    def _elapsed_ms(self) -> float:
+        return (time.perf_counter() - self._t0) * 1000.0
+    
+    @contextmanager
+    def _timed(self, table: dict, key: str):
+        """Time a (possibly nested) block, separating self and cumulative time."""
+        self._stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            cumulative = time.perf_counter() - start
+            children = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += cumulative
+            
+            entry = table.get(key)
+            if entry is None:
+                entry = table[key] = [0.0, 0.0, 0]
+            entry[0] += cumulative - children
+            entry[1] += cumulative
+            entry[2] += 1
+    
+    def mark(self, name: str):
+        """Record a milestone (ms since profiler start)."""
+        self._marks[name] = round(self._elapsed_ms(), 3)
+    
+    @contextmanager
+    def section(self, name: str):
+        """Time an arbitrary block as a builder entry."""
+        with self._timed(self._builders, name):
+            yield
+    
+    # ==================== IMPORT HOOK ====================
+    
+    def install_import_hook(self):
+        """Wrap ``builtins.__import__`` to time first-time module imports."""
+        if self._original_import is not None:
+            return
+        
+        original_import = builtins.__import__
+        self._original_import = original_import
+        profiler = self
+        
+        def timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+            if level == 0:
+                module_name = name
+            else:
+                package = (globals or {}).get('__package__') or ""
+                parts = package.rsplit(".", level - 1) if level > 1 else [package]
+                module_name = f"{parts[0]}.{name}" if name else parts[0]
+            
+            # Already imported: no measurable work, skip bookkeeping
+            if module_name in sys.modules:
+                return original_import(name, globals, locals, fromlist, level)
+            
+            with profiler._timed(profiler._imports, module_name):
+                return original_import(name, globals, locals, fromlist, level)
+        
+        builtins.__import__ = timed_import
+    
+    def remove_import_hook(self):
+        """Restore the original ``builtins.__import__``."""
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+    
+    # ==================== BUILDER INSTRUMENTATION ====================
+    
+    def instrument_methods(self, obj, prefix: str = "_create_"):
+        """
+        Wrap every bound method of ``obj`` starting with ``prefix`` so that
+        each call is timed. Works for nested builders (self time excludes
+        child builders) and for builders called later (lazy tabs).
+        """
+        for name in dir(type(obj)):
+            if not name.startswith(prefix):
+                continue
+            method = getattr(obj, name, None)
+            if not callable(method):
+                continue
+            setattr(obj, name, self._wrap(name, method))
+    
+    def _wrap(self, name: str, method):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            with self._timed(self._builders, name):
+                return method(*args, **kwargs)
+        return wrapper
+    
+    # ==================== REPORT ====================
+    
+    def report(self) -> dict:
+        """Build the JSON-serializable report."""
+        def rows(table: dict, key_name: str) -> list:
+            items = [
+                {
+                    key_name: key,
+                    'self_ms': round(values[0] * 1000.0, 3),
+                    'cumulative_ms': round(values[1] * 1000.0, 3),
+                    'calls': values[2],
+                }
+                for key, values in table.items()
+            ]
+            items.sort(key=lambda row: row['cumulative_ms'], reverse=True)
+            return items
+        
+        try:
+            from src import __version__ as app_version
+        except Exception:
+            app_version = "unknown"
+        
+        return {
+            'app_version': app_version,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'frozen': bool(getattr(sys, 'frozen', False)),
+            'created_at': time.strftime("%Y-%m-%dT%H:%M:%S"),
+            'marks_ms': dict(self._marks),
+            'imports': rows(self._imports, 'module'),
+            'builders': rows(self._builders, 'name'),
+        }
+    
+    def finish(self, mark_name: str = "first_idle") -> Optional[str]:
+        """
+        Record the final mark, stop the import hook and write the report.
+        
+        Returns:
+            str: Path of the written report (None if writing failed)
+        """
+        if self._finished:
+            return None
+        self._finished = True
+        
+        self.mark(mark_name)
+        self.remove_import_hook()
+        
+        path = self.report_path
+        if not path:
+            from src.resource_manager import get_user_data_dir
+            path = os.path.join(get_user_data_dir(), "startup_profile.json")
+        
+        try:
+            from src.resource_manager import SafeFileWriter
+            with SafeFileWriter(path) as f:
+                json.dump(self.report(), f, indent=2)
+            print(f"[Profile] Startup report written: {path} ({self._marks[mark_name]:.0f} ms to {mark_name})")
+            return path
+        except Exception as e:
+            print(f"[Profile] Could not write startup report: {e}")
+            return None
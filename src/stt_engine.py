@@ -0,0 +1,414 @@
+"""
+Speech-to-Text Engines - Continuous Recognition Behind One Interface
+===================================================================
+
+An engine runs a continuous ``RecognitionSession`` over the whole audio:
+- ``on_partial(text)``: hypothesis of the utterance being spoken (changes)
+- ``on_segment(segment)``: a finished utterance with its offset/duration
+- ``session.wait()`` returns the ``Transcript`` (all segments, in order)
+
+Files use ``recognize_file``. Live audio uses ``recognize_stream``: the
+caller ``write()``s 16-bit mono PCM while recording (Azure
+``PushAudioInputStream``) and calls ``end()`` on stop, so recognition
+overlaps recording and the transcript is ready right after it.
+
+Engines:
+- ``AzureSTTEngine`` - Azure Speech ``start_continuous_recognition`` with
+  recognizing / recognized / canceled / session_stopped events
+- ``LocalStubEngine`` - offline stand-in: "recognizes" fixed-length
+  windows of the audio, with partials and a configurable per-segment
+  delay. Used to test segmenting/streaming without a network
+
+Callbacks run on engine threads - marshal to the UI thread yourself.
+"""
+
+import os
+import threading
+import time
+import wave
+from typing import Callable, List, NamedTuple, Optional
+
+
+TICKS_PER_SECOND = 10_000_000  # Azure offsets/durations are 100 ns ticks
+
+
+class Segment(NamedTuple):
+    """One recognized utterance."""
+    text: str
+    offset_s: float      # Start, seconds from the beginning of the audio
+    duration_s: float
+
+
+def format_timestamp(seconds: float) -> str:
+    """83.4 -> "01:23", 3723 -> "1:02:03"."""
+    seconds = int(seconds)
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{secs:02d}"
+    return f"{minutes:02d}:{secs:02d}"
+
+
+class Transcript:
+    """Segments of a finished (or failed) recognition."""
+    
+    def __init__(self, segments: List[Segment], error: Optional[str] = None):
+        self.segments = sorted(segments, key=lambda segment: segment.offset_s)
+        self.error = error
+    
+    @property
+    def text(self) -> str:
+        return " ".join(segment.text for segment in self.segments if segment.text)
+    
+    @property
+    def duration_s(self) -> float:
+        if not self.segments:
+            return 0.0
+        last = self.segments[-1]
+        return last.offset_s + last.duration_s
+    
+    def with_timestamps(self) -> str:
+        """One "[mm:ss] text" line per segment."""
+        return "\n".join(
+            f"[{format_timestamp(segment.offset_s)}] {segment.text}"
+            for segment in self.segments if segment.text
+        )
+
+
+class RecognitionSession:
+    """
+    A running recognition. Engines call ``_partial``/``_segment``/``_finish``;
+    callers read ``segments`` or block in ``wait()``.
+    """
+    
+    def __init__(
+        self,
+        on_partial: Optional[Callable[[str], None]] = None,
+        on_segment: Optional[Callable[[Segment], None]] = None
+    ):
+        self.on_partial = on_partial
+        self.on_segment = on_segment
+        self.segments: List[Segment] = []
+        self.error = None
+        self._done = threading.Event()
+        self._lock = threading.Lock()
+        self._on_stop = None  # Engine cleanup, run once by wait()/stop()
+        self._keepalive = None  # Engine objects that must outlive the call
+    
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+    
+    def _partial(self, text: str):
+        if self.on_partial and text:
+            self.on_partial(text)
+    
+    def _segment(self, segment: Segment):
+        with self._lock:
+            self.segments.append(segment)
+        if self.on_segment:
+            self.on_segment(segment)
+    
+    def _finish(self, error: Optional[str] = None):
+        if error and self.error is None:
+            self.error = error
+        self._done.set()
+    
+    def _run_stop(self):
+        with self._lock:
+            on_stop, self._on_stop = self._on_stop, None
+        if on_stop is not None:
+            on_stop()
+    
+    def stop(self):
+        """Stop early (e.g. user cancelled). Segments so far are kept."""
+        self._run_stop()
+        self._finish()
+    
+    def wait(self, timeout: Optional[float] = None) -> Transcript:
+        """Block until the audio is fully recognized (or failed / timed out)."""
+        if not self._done.wait(timeout):
+            self.error = self.error or "Recognition timed out"
+        self._run_stop()
+        with self._lock:
+            return Transcript(list(self.segments), self.error)
+
+
+class StreamSession(RecognitionSession):
+    """A recognition fed with 16-bit mono PCM while it runs."""
+    
+    def __init__(self, on_partial=None, on_segment=None):
+        super().__init__(on_partial, on_segment)
+        self._write = None    # Set by the engine
+        self._end = None
+        self._ended = False
+        self.bytes_written = 0
+    
+    def write(self, pcm: bytes):
+        """Push audio (any thread, in order)."""
+        if not self._ended and pcm:
+            self.bytes_written += len(pcm)
+            self._write(pcm)
+    
+    def end(self):
+        """No more audio - the engine finishes the last utterance, then ``done``."""
+        if not self._ended:
+            self._ended = True
+            self._end()
+
+
+class STTEngine:
+    """Interface: continuous recognition of an audio file."""
+    
+    name = "base"
+    
+    def recognize_file(
+        self,
+        path: str,
+        language: str = "vi-VN",
+        on_partial: Optional[Callable[[str], None]] = None,
+        on_segment: Optional[Callable[[Segment], None]] = None
+    ) -> RecognitionSession:
+        """
+        Start recognizing ``path``; returns immediately.
+        
+        Raises:
+            RuntimeError: Engine unavailable (missing SDK / credentials)
+        """
+        raise NotImplementedError
+    
+    def recognize_stream(
+        self,
+        sample_rate: int = 16000,
+        language: str = "vi-VN",
+        on_partial: Optional[Callable[[str], None]] = None,
+        on_segment: Optional[Callable[[Segment], None]] = None
+    ) -> StreamSession:
+        """
+        Start recognizing pushed 16-bit mono PCM; returns immediately.
+        
+        Raises:
+            RuntimeError: Engine unavailable (missing SDK / credentials)
+        """
+        raise NotImplementedError
+    
+    def transcribe_file(self, path: str, language: str = "vi-VN", **callbacks) -> Transcript:
+        """Blocking convenience wrapper around ``recognize_file``."""
+        return self.recognize_file(path, language, **callbacks).wait()
+
+
+# ==================== AZURE ====================
+
+class AzureSTTEngine(STTEngine):
+    """Azure Speech continuous recognition."""
+    
+    name = "azure"
+    
+    def __init__(self, key: str, region: str):
+        self.key = key
+        self.region = region
+    
+    def _speech_config(self, language: str):
+        try:
+            import azure.cognitiveservices.speech as speechsdk
+        except ImportError:
+            raise RuntimeError("Azure transcription requires azure-cognitiveservices-speech: "
+                               "pip install azure-cognitiveservices-speech")
+        if not self.key or not self.region:
+            raise RuntimeError("Azure API key and region are required")
+        speech_config = speechsdk.SpeechConfig(subscription=self.key, region=self.region)
+        speech_config.speech_recognition_language = language
+        return speechsdk, speech_config
+    
+    def _start(self, audio_config, speechsdk, speech_config, session: RecognitionSession) -> RecognitionSession:
+        """Wire recognizer events to ``session`` and start continuous recognition."""
+        recognizer = speechsdk.SpeechRecognizer(speech_config=speech_config, audio_config=audio_config)
+        
+        def on_recognizing(evt):
+            session._partial(evt.result.text)
+        
+        def on_recognized(evt):
+            result = evt.result
+            if result.reason == speechsdk.ResultReason.RecognizedSpeech and result.text:
+                session._segment(Segment(
+                    result.text,
+                    result.offset / TICKS_PER_SECOND,
+                    result.duration / TICKS_PER_SECOND
+                ))
+        
+        def on_canceled(evt):
+            details = evt.cancellation_details
+            if details.reason == speechsdk.CancellationReason.Error:
+                session._finish(f"{details.reason}: {details.error_details}")
+            else:
+                session._finish()  # EndOfStream
+        
+        recognizer.recognizing.connect(on_recognizing)
+        recognizer.recognized.connect(on_recognized)
+        recognizer.canceled.connect(on_canceled)
+        recognizer.session_stopped.connect(lambda evt: session._finish())
+        
+        session._on_stop = lambda: recognizer.stop_continuous_recognition_async().get()
+        session._keepalive = (recognizer, audio_config)
+        recognizer.start_continuous_recognition_async().get()
+        return session
+    
+    def recognize_file(self, path, language="vi-VN", on_partial=None, on_segment=None):
+        speechsdk, speech_config = self._speech_config(language)
+        if not os.path.exists(path):
+            raise RuntimeError(f"File not found: {path}")
+        audio_config = speechsdk.audio.AudioConfig(filename=path)
+        return self._start(audio_config, speechsdk, speech_config, RecognitionSession(on_partial, on_segment))
+    
+    def recognize_stream(self, sample_rate=16000, language="vi-VN", on_partial=None, on_segment=None):
+        speechsdk, speech_config = self._speech_config(language)
+        stream_format = speechsdk.audio.AudioStreamFormat(
+            samples_per_second=sample_rate, bits_per_sample=16, channels=1
+        )
+        push_stream = speechsdk.audio.PushAudioInputStream(stream_format=stream_format)
+        audio_config = speechsdk.audio.AudioConfig(stream=push_stream)
+        
+        session = StreamSession(on_partial, on_segment)
+        session._write = push_stream.write
+        session._end = push_stream.close  # End of stream -> session_stopped
+        return self._start(audio_config, speechsdk, speech_config, session)
+
+
+# ==================== LOCAL STUB ====================
+
+def audio_duration_s(path: str) -> float:
+    """Duration of an audio file (WAV via stdlib, other formats via soundfile)."""
+    try:
+        with wave.open(path, "rb") as wav:
+            return wav.getnframes() / float(wav.getframerate())
+    except (wave.Error, EOFError):
+        pass
+    try:
+        import soundfile as sf
+    except ImportError:
+        raise RuntimeError(f"Can't read {os.path.basename(path)} without soundfile: pip install soundfile")
+    info = sf.info(path)
+    return info.frames / float(info.samplerate)
+
+
+class LocalStubEngine(STTEngine):
+    """
+    Offline stand-in for a recognizer.
+    
+    Splits the audio into ``segment_s`` windows and emits one segment per
+    window ("speech from 00:20 to 00:30"), two partials before each, and
+    sleeps ``delay_s`` per segment to imitate recognition time.
+    """
+    
+    name = "stub"
+    
+    def __init__(self, segment_s: float = 10.0, delay_s: float = 0.0):
+        self.segment_s = segment_s
+        self.delay_s = delay_s
+    
+    def _segments_for(self, duration_s: float, start_s: float = 0.0):
+        offset = 0.0
+        while offset < duration_s:
+            length = min(self.segment_s, duration_s - offset)
+            begin = start_s + offset
+            yield Segment(
+                f"speech from {format_timestamp(begin)} to {format_timestamp(begin + length)}",
+                begin,
+                length
+            )
+            offset += length
+    
+    def _run(self, duration_s: float, session: RecognitionSession, stop: threading.Event):
+        try:
+            for segment in self._segments_for(duration_s):
+                words = segment.text.split()
+                for count in (1, len(words) // 2 or 1):
+                    if stop.is_set():
+                        return
+                    session._partial(" ".join(words[:count]))
+                if self.delay_s:
+                    stop.wait(self.delay_s)
+                if stop.is_set():
+                    return
+                session._segment(segment)
+        except Exception as e:
+            session._finish(str(e))
+        finally:
+            session._finish()
+    
+    def recognize_file(self, path, language="vi-VN", on_partial=None, on_segment=None):
+        duration_s = audio_duration_s(path)
+        session = RecognitionSession(on_partial, on_segment)
+        stop = threading.Event()
+        session._on_stop = stop.set
+        threading.Thread(target=self._run, args=(duration_s, session, stop),
+                         daemon=True, name="StubRecognizer").start()
+        return session
+    
+    def recognize_stream(self, sample_rate=16000, language="vi-VN", on_partial=None, on_segment=None):
+        """Emits a segment each time ``segment_s`` of audio has been pushed (``delay_s`` each, in ``write``)."""
+        session = StreamSession(on_partial, on_segment)
+        bytes_per_segment = int(self.segment_s * sample_rate) * 2
+        state = {'emitted_s': 0.0, 'pending': 0}
+        
+        def emit(byte_count: int):
+            duration_s = byte_count / 2 / sample_rate
+            for segment in self._segments_for(duration_s, start_s=state['emitted_s']):
+                session._partial(segment.text.split()[0])
+                if self.delay_s:
+                    time.sleep(self.delay_s)
+                session._segment(segment)
+            state['emitted_s'] += duration_s
+        
+        def write(pcm: bytes):
+            state['pending'] += len(pcm)
+            if state['pending'] >= bytes_per_segment:
+                full = state['pending'] - state['pending'] % bytes_per_segment
+                state['pending'] -= full
+                emit(full)
+        
+        def end():
+            if state['pending']:
+                emit(state['pending'])
+                state['pending'] = 0
+            session._finish()
+        
+        session._write = write
+        session._end = end
+        return session
+
+
+# ==================== SELF-CHECK ====================
+if __name__ == "__main__":
+    import tempfile
+    
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "silence.wav")
+        with wave.open(path, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(16000)
+            wav.writeframes(b"\0\0" * 16000 * 95)  # 95 s
+        
+        partials, streamed = [], []
+        engine = LocalStubEngine(segment_s=10.0, delay_s=0.01)
+        start = time.perf_counter()
+        session = engine.recognize_file(path, on_partial=partials.append, on_segment=streamed.append)
+        first_segment_s = None
+        while not session.done:
+            if streamed and first_segment_s is None:
+                first_segment_s = time.perf_counter() - start
+            time.sleep(0.001)
+        transcript = session.wait()
+        
+        print("=" * 60)
+        print("  CONTINUOUS RECOGNITION (local stub engine, 95 s file)")
+        print("=" * 60)
+        print(f"  segments: {len(transcript.segments)} (recognize_once would have returned 1)")
+        print(f"  first segment streamed after {first_segment_s * 1000:.0f} ms, "
+              f"all after {(time.perf_counter() - start) * 1000:.0f} ms")
+        print(f"  partials: {len(partials)}, covered: {transcript.duration_s:.1f}s, error: {transcript.error}")
+        print("  " + transcript.with_timestamps().replace("\n", "\n  "))
+        assert transcript.error is None and len(transcript.segments) == 10
+        assert [segment.offset_s for segment in transcript.segments] == [10.0 * i for i in range(10)]
+        assert streamed == transcript.segments and abs(transcript.duration_s - 95.0) < 1e-6
@@ -0,0 +1,156 @@
+"""
+Text Layout - Cached Measurement, Word Wrap and Paging for the HUD
+==================================================================
+
+Measuring text is the expensive part of laying out a HUD message (a font
+round-trip per call). Results repeat heavily - the same words, the same
+font, the same width - so widths are cached per font and the finished
+layout (lines + pages) is computed ONCE per result, never per redraw.
+
+Backend independent: ``TextMeasurer`` takes any ``measure(text) -> px``
+function (``tkinter.font.Font.measure``, ``PIL.ImageFont.getlength``, or
+a fake in benchmarks).
+"""
+
+from collections import OrderedDict
+from typing import Callable, List
+
+
+class TextMeasurer:
+    """
+    Cached text width measurement for ONE font.
+    
+    Usage:
+        font = tkinter.font.Font(family="Segoe UI", size=13, weight="bold")
+        measurer = TextMeasurer(font.measure, font.metrics("linespace"))
+        measurer.width("hello")   # measured once, then served from cache
+    """
+    
+    def __init__(self, measure: Callable[[str], float], line_height: int, max_entries: int = 8192):
+        """
+        Args:
+            measure: Returns the rendered width of a string in pixels
+            line_height: Line spacing of the font in pixels
+            max_entries: Cached widths kept (least recently used evicted)
+        """
+        self._measure = measure
+        self.line_height = line_height
+        self.max_entries = max_entries
+        self._cache = OrderedDict()
+        
+        # Stats
+        self.hits = 0
+        self.misses = 0
+        
+        self.space_width = self.width(" ")
+    
+    def width(self, text: str) -> int:
+        """Width of ``text`` in pixels (cached)."""
+        cached = self._cache.get(text)
+        if cached is not None:
+            self._cache.move_to_end(text)
+            self.hits += 1
+            return cached
+        
+        value = int(round(self._measure(text)))
+        self._cache[text] = value
+        self.misses += 1
+        if len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        return value
+
+
+def _split_long_word(word: str, max_width: int, measurer: TextMeasurer) -> List[str]:
+    """Break a word wider than the line into pieces that fit."""
+    pieces = []
+    current = ""
+    for char in word:
+        if current and measurer.width(current + char) > max_width:
+            pieces.append(current)
+            current = char
+        else:
+            current += char
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def wrap_text(text: str, max_width: int, measurer: TextMeasurer) -> List[str]:
+    """
+    Greedy word wrap to ``max_width`` pixels.
+    
+    Paragraph breaks (newlines) are kept; word widths come from the cache,
+    so re-wrapping similar results costs almost no font calls.
+    """
+    lines = []
+    space = measurer.space_width
+    
+    for paragraph in text.split("\n"):
+        words = paragraph.split()
+        if not words:
+            lines.append("")
+            continue
+        
+        line_words = []
+        line_width = 0
+        for word in words:
+            word_width = measurer.width(word)
+            
+            if word_width > max_width:
+                # Flush current line, then hard-break the long word
+                if line_words:
+                    lines.append(" ".join(line_words))
+                pieces = _split_long_word(word, max_width, measurer)
+                lines.extend(pieces[:-1])
+                line_words = [pieces[-1]]
+                line_width = measurer.width(pieces[-1])
+                continue
+            
+            needed = word_width if not line_words else line_width + space + word_width
+            if needed <= max_width:
+                line_words.append(word)
+                line_width = needed
+            else:
+                lines.append(" ".join(line_words))
+                line_words = [word]
+                line_width = word_width
+        
+        if line_words:
+            lines.append(" ".join(line_words))
+    
+    # Drop trailing blank lines
+    while len(lines) > 1 and not lines[-1]:
+        lines.pop()
+    return lines
+
+
+def paginate(lines: List[str], lines_per_page: int, pad_last: bool = True) -> List[str]:
+    """
+    Group wrapped lines into page strings.
+    
+    Args:
+        lines: Wrapped lines
+        lines_per_page: Lines per page (>= 1)
+        pad_last: Pad the last page with blank lines so every page has the
+                  same height (no window resize while paging)
+    
+    Returns:
+        list: One string per page (at least one page)
+    """
+    lines_per_page = max(1, lines_per_page)
+    if not lines:
+        return [""]
+    
+    pages = []
+    for start in range(0, len(lines), lines_per_page):
+        page_lines = lines[start:start + lines_per_page]
+        if pad_last and len(lines) > lines_per_page and len(page_lines) < lines_per_page:
+            page_lines = page_lines + [""] * (lines_per_page - len(page_lines))
+        pages.append("\n".join(page_lines))
+    return pages
+
+
+def layout_pages(text: str, max_width: int, max_height: int, measurer: TextMeasurer) -> List[str]:
+    """Wrap ``text`` and split it into pages that fit ``max_width`` x ``max_height``."""
+    lines_per_page = max(1, max_height // max(1, measurer.line_height))
+    return paginate(wrap_text(text, max_width, measurer), lines_per_page)
@@ -0,0 +1,168 @@
+"""
+UI Event Bridge - Worker Thread → Tk Main Thread Dispatch
+==========================================================
+
+Replaces permanent ``after()`` polling loops with a single wake-up mechanism.
+
+Worker threads (keyboard hook, Gemini calls, audio) call ``post()``. The event
+is queued and the Tk main loop is woken once via a virtual event
+(``event_generate(..., when="tail")``). While nothing is posted, the bridge
+costs zero wakeups.
+
+Several posts that arrive before the main thread wakes are drained in one
+batch, so bursts produce a single wakeup.
+
+Measurable:
+- wakeups: how many times the main thread was woken
+- events: how many events were dispatched
+- latency: post() → handler start, per event kind
+"""
+
+import time
+import queue
+import threading
+import tkinter as tk
+from collections import deque
+from typing import Any, Callable, Dict
+
+
+class UIEventBridge:
+    """
+    Thread-safe event dispatch into the Tk main loop.
+    
+    Usage:
+        bridge = UIEventBridge(root)
+        bridge.register("capture", lambda payload: do_capture())
+        
+        # From any thread:
+        bridge.post("capture")
+    """
+    
+    VIRTUAL_EVENT = "<<SnapCapDispatch>>"
+    
+    def __init__(self, root: tk.Misc, latency_samples: int = 256):
+        """
+        Initialize event bridge.
+        
+        Args:
+            root: Tk root window (handlers run on its thread)
+            latency_samples: Number of recent latency samples kept per event kind
+        """
+        self._root = root
+        self._queue = queue.SimpleQueue()
+        self._handlers: Dict[str, Callable[[Any], None]] = {}
+        self._wake_lock = threading.Lock()
+        self._wake_pending = False
+        self._closed = False
+        
+        # Stats
+        self._latency_samples = latency_samples
+        self._latencies: Dict[str, deque] = {}
+        self.wakeups = 0
+        self.events_dispatched = 0
+        
+        root.bind(self.VIRTUAL_EVENT, self._on_wake, add="+")
+        
+        # Drain anything posted before mainloop() started
+        root.after_idle(self._drain)
+    
+    def register(self, kind: str, handler: Callable[[Any], None]):
+        """
+        Register the main-thread handler for an event kind.
+        
+        Args:
+            kind: Event name (e.g. "capture", "notification")
+            handler: Called on the Tk thread with the posted payload
+        """
+        self._handlers[kind] = handler
+    
+    def post(self, kind: str, payload: Any = None):
+        """
+        Post an event from any thread.
+        
+        Args:
+            kind: Registered event name
+            payload: Passed to the handler unchanged
+        """
+        if self._closed:
+            return
+        
+        self._queue.put((kind, payload, time.perf_counter()))
+        
+        with self._wake_lock:
+            if self._wake_pending:
+                return  # Main thread already has a wakeup queued
+            self._wake_pending = True
+        
+        try:
+            self._root.event_generate(self.VIRTUAL_EVENT, when="tail")
+        except (RuntimeError, tk.TclError):
+            # Main loop not running (yet / anymore) - picked up by the next wake
+            with self._wake_lock:
+                self._wake_pending = False
+    
+    def _on_wake(self, event=None):
+        """Virtual event handler - runs on the Tk thread."""
+        self.wakeups += 1
+        self._drain()
+    
+    def _drain(self):
+        """Dispatch all queued events."""
+        # Clear the flag BEFORE draining so a post() racing with us re-wakes
+        with self._wake_lock:
+            self._wake_pending = False
+        
+        while True:
+            try:
+                kind, payload, posted_at = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            
+            handler = self._handlers.get(kind)
+            if handler is None:
+                print(f"[EventBridge] No handler for event: {kind}")
+                continue
+            
+            self._record_latency(kind, time.perf_counter() - posted_at)
+            self.events_dispatched += 1
+            
+            try:
+                handler(payload)
+            except Exception as e:
+                print(f"[EventBridge] Handler error ({kind}): {e}")
+    
+    def _record_latency(self, kind: str, seconds: float):
+        """Store a post → handler latency sample."""
+        samples = self._latencies.get(kind)
+        if samples is None:
+            samples = self._latencies[kind] = deque(maxlen=self._latency_samples)
+        samples.append(seconds * 1000.0)
+    
+    def stats(self) -> dict:
+        """
+        Get dispatch statistics.
+        
+        Returns:
+            dict: wakeups, events, and per-kind latency (avg/max/p95 in ms)
+        """
+        latency = {}
+        for kind, samples in self._latencies.items():
+            if not samples:
+                continue
+            ordered = sorted(samples)
+            latency[kind] = {
+                'count': len(ordered),
+                'avg_ms': round(sum(ordered) / len(ordered), 3),
+                'p95_ms': round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3),
+                'max_ms': round(ordered[-1], 3),
+            }
+        
+        return {
+            'wakeups': self.wakeups,
+            'events': self.events_dispatched,
+            'latency': latency,
+        }
+    
+    def close(self):
+        """Stop accepting events."""
+        self._closed = True
@@ -0,0 +1,280 @@
+"""
+Voice Activity Detection - Where to Cut Long Audio
+==================================================
+
+Long recordings are split into chunks that can be recognized in parallel
+(see ``parallel_transcriber``). Cutting at a fixed length would split words,
+so cuts go in the middle of pauses.
+
+EnergyVAD:
+- ``feed()`` blocks of float32 mono samples (streaming - only a level and a
+  zero-crossing rate per frame are kept, ~33 pairs per second)
+- Frames more than ``margin_db`` above the noise floor (a low percentile of
+  the frame levels) are speech; so are quieter frames with a high
+  zero-crossing rate (unvoiced consonants: s, f, th)
+- The floor is capped at ``max_floor_db``: audio without real pauses
+  (continuous speech, speech over music) is all speech, not all silence
+- ``silences()`` returns the pauses of at least ``min_silence_s``,
+  ``speech_regions()`` the speech (padded so word edges aren't clipped)
+
+``chunk_bounds()`` turns the pauses into (start_s, end_s) chunks of at most
+``max_chunk_s``, cutting at the last pause that fits.
+
+``keep_intervals()`` + ``TimestampMap`` drop/shorten silence before
+recognition (see ``silence_trimmer``) and map offsets in the shortened
+audio back to the original.
+
+Requires: pip install numpy
+"""
+
+import threading
+from bisect import bisect_left, bisect_right
+from typing import List, Optional, Tuple
+
+from src.audio_recorder import _import_numpy
+from src.stt_engine import Segment
+
+
+def _runs(mask):
+    """(starts, ends) frame indices of the True runs of a boolean array."""
+    np = _import_numpy()
+    edges = np.diff(np.concatenate(([0], mask.astype("int8"), [0])))
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+
+class EnergyVAD:
+    """Frame-energy / zero-crossing voice activity detector."""
+    
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        frame_s: float = 0.03,
+        margin_db: float = 10.0,
+        floor_percentile: float = 5.0,
+        min_speech_db: float = -50.0,
+        max_floor_db: float = -45.0,
+        min_silence_s: float = 0.4,
+        zcr_threshold: float = 0.3,
+        zcr_margin_db: float = 6.0
+    ):
+        """
+        Args:
+            sample_rate: Samples per second of the fed audio
+            frame_s: Analysis frame length
+            margin_db: How far above the noise floor a frame counts as speech
+            floor_percentile: Percentile of frame levels taken as the noise floor
+            min_speech_db: Frames below this level (dBFS) are never speech
+            max_floor_db: Noise floor cap (dBFS) - a louder "floor" is speech or
+                          music, not room noise
+            min_silence_s: Shorter pauses are not reported by ``silences()``
+            zcr_threshold: Zero crossings per sample above which a quiet frame
+                           may still be speech (voiced speech: ~0.05, "s": ~0.4)
+            zcr_margin_db: How far below the speech threshold such a frame may be
+        """
+        np = _import_numpy()
+        self.sample_rate = sample_rate
+        self.frame_len = max(int(frame_s * sample_rate), 1)
+        self.frame_s = self.frame_len / sample_rate
+        self.margin_db = margin_db
+        self.floor_percentile = floor_percentile
+        self.min_speech_db = min_speech_db
+        self.max_floor_db = max_floor_db
+        self.min_silence_s = min_silence_s
+        self.zcr_threshold = zcr_threshold
+        self.zcr_margin_db = zcr_margin_db
+        
+        self._levels = []   # dBFS per frame, one array per fed block
+        self._zcr = []      # Zero crossings per sample, per frame
+        self._rest = np.zeros(0, dtype="float32")  # Samples short of a full frame
+        self.samples = 0
+    
+    @property
+    def duration_s(self) -> float:
+        return self.samples / self.sample_rate
+    
+    def feed(self, samples):
+        """Add float32 mono samples in [-1, 1] (any block size)."""
+        np = _import_numpy()
+        self.samples += len(samples)
+        if len(self._rest):
+            samples = np.concatenate((self._rest, samples))
+        frames = len(samples) // self.frame_len
+        self._rest = samples[frames * self.frame_len:].copy()
+        if frames:
+            framed = samples[:frames * self.frame_len].reshape(frames, self.frame_len)
+            power = np.einsum("ij,ij->i", framed, framed, dtype="float64") / self.frame_len
+            self._levels.append(10.0 * np.log10(power + 1e-12))
+            crossings = np.count_nonzero(np.diff(framed >= 0, axis=1), axis=1)
+            self._zcr.append((crossings / self.frame_len).astype("float32"))
+    
+    @staticmethod
+    def _joined(parts: list):
+        np = _import_numpy()
+        if not parts:
+            return np.zeros(0)
+        if len(parts) > 1:
+            parts[:] = [np.concatenate(parts)]
+        return parts[0]
+    
+    def levels(self):
+        """dBFS of every complete frame fed so far."""
+        return self._joined(self._levels)
+    
+    def zero_crossing_rates(self):
+        """Zero crossings per sample of every complete frame fed so far."""
+        return self._joined(self._zcr)
+    
+    def threshold_db(self, window: Optional[int] = None) -> float:
+        """Speech threshold from all frame levels, or only the last ``window`` frames."""
+        np = _import_numpy()
+        levels = self.levels()
+        if window is not None:
+            levels = levels[-window:]
+        if not len(levels):
+            return self.min_speech_db
+        floor = min(float(np.percentile(levels, self.floor_percentile)), self.max_floor_db)
+        return max(floor + self.margin_db, self.min_speech_db)
+    
+    def speech_mask(self, start: int = 0, window: Optional[int] = None):
+        """
+        Boolean per frame from frame ``start`` on: True = speech.
+        
+        ``window`` limits the noise floor to the most recent frames (live
+        audio: the floor adapts and each call stays cheap).
+        """
+        levels = self.levels()[start:]
+        threshold = self.threshold_db(window)
+        speech = levels > threshold
+        # Unvoiced consonants are quiet but noisy - a high zero-crossing rate
+        speech |= (levels > threshold - self.zcr_margin_db) & (self.zero_crossing_rates()[start:] > self.zcr_threshold)
+        return speech
+    
+    def silences(self) -> List[Tuple[float, float]]:
+        """(start_s, end_s) of every pause of at least ``min_silence_s``."""
+        starts, ends = _runs(~self.speech_mask())
+        keep = (ends - starts) * self.frame_s >= self.min_silence_s
+        return [(float(start * self.frame_s), float(end * self.frame_s))
+                for start, end in zip(starts[keep], ends[keep])]
+    
+    def speech_regions(self, pad_s: float = 0.15) -> List[Tuple[float, float]]:
+        """(start_s, end_s) of the speech, each side widened by ``pad_s`` (merged, clipped)."""
+        np = _import_numpy()
+        speech = self.speech_mask()
+        pad = int(round(pad_s / self.frame_s))
+        if pad and len(speech):
+            # Dilate: a frame is kept if any speech frame is within ``pad``
+            speech = np.convolve(speech.astype("int8"), np.ones(2 * pad + 1, dtype="int8"), mode="same") > 0
+        starts, ends = _runs(speech)
+        return [(float(start * self.frame_s), min(float(end * self.frame_s), self.duration_s))
+                for start, end in zip(starts, ends)]
+
+
+def chunk_bounds(
+    silences: List[Tuple[float, float]],
+    duration_s: float,
+    max_chunk_s: float = 60.0,
+    min_chunk_s: Optional[float] = None
+) -> List[Tuple[float, float]]:
+    """
+    Split ``[0, duration_s]`` into chunks of at most ``max_chunk_s``.
+    
+    Each cut is the middle of the last pause that keeps the chunk within
+    ``max_chunk_s`` and longer than ``min_chunk_s`` (default: half of
+    ``max_chunk_s``); without such a pause the chunk is cut hard.
+    """
+    if min_chunk_s is None:
+        min_chunk_s = max_chunk_s / 2
+    cuts = [(start + end) / 2 for start, end in silences]
+    
+    chunks = []
+    start = 0.0
+    index = 0
+    while duration_s - start > max_chunk_s:
+        limit = start + max_chunk_s
+        cut = None
+        while index < len(cuts) and cuts[index] <= limit:
+            if cuts[index] - start >= min_chunk_s:
+                cut = cuts[index]
+            index += 1
+        if cut is None:
+            cut = limit  # No usable pause - cut mid-speech
+        chunks.append((start, cut))
+        start = cut
+    if duration_s > start:
+        chunks.append((start, duration_s))
+    return chunks
+
+
+def keep_intervals(
+    regions: List[Tuple[float, float]],
+    duration_s: float,
+    keep_silence_s: float = 0.3
+) -> List[Tuple[float, float]]:
+    """
+    The parts of ``[0, duration_s]`` to keep: the speech ``regions`` plus
+    ``keep_silence_s / 2`` on each side, so every pause longer than
+    ``keep_silence_s`` shrinks to it (and leading/trailing silence to half).
+    """
+    half = keep_silence_s / 2
+    kept = []
+    for start, end in regions:
+        start, end = max(start - half, 0.0), min(end + half, duration_s)
+        if kept and start <= kept[-1][1]:
+            kept[-1] = (kept[-1][0], max(kept[-1][1], end))
+        else:
+            kept.append((start, end))
+    return kept
+
+
+class TimestampMap:
+    """
+    Maps time in audio made of ``intervals`` of an original (e.g. with the
+    silence cut out) back to the original's time.
+    
+    Live audio grows the map with ``extend`` while segments are mapped on
+    another thread.
+    """
+    
+    def __init__(self, intervals: List[Tuple[float, float]] = ()):
+        """
+        Args:
+            intervals: Kept (start_s, end_s) of the original, sorted, not overlapping
+        """
+        self.intervals = []
+        self._starts = []   # Where each interval starts in the shortened audio
+        self._lock = threading.Lock()
+        self.duration_s = 0.0
+        for start, end in intervals:
+            self.extend(start, end)
+    
+    def extend(self, start_s: float, end_s: float):
+        """Append a kept range (after the last one); touching ranges are merged."""
+        with self._lock:
+            if self.intervals and abs(self.intervals[-1][1] - start_s) < 1e-9:
+                self.intervals[-1] = (self.intervals[-1][0], end_s)
+            else:
+                self.intervals.append((start_s, end_s))
+                self._starts.append(self.duration_s)
+            self.duration_s += end_s - start_s
+    
+    @classmethod
+    def identity(cls, duration_s: float) -> "TimestampMap":
+        return cls([(0.0, duration_s)])
+    
+    def to_original(self, seconds: float, end: bool = False) -> float:
+        """
+        Shortened-audio time -> original time. A time on a cut belongs to
+        the next interval, or to the previous one when ``end`` is True.
+        """
+        with self._lock:
+            if not self.intervals:
+                return seconds
+            bisect = bisect_left if end else bisect_right
+            index = min(max(bisect(self._starts, seconds) - 1, 0), len(self.intervals) - 1)
+            return self.intervals[index][0] + (seconds - self._starts[index])
+    
+    def map_segment(self, segment: Segment) -> Segment:
+        """Shift a segment recognized in the shortened audio onto the original."""
+        start = self.to_original(segment.offset_s)
+        end = self.to_original(segment.offset_s + segment.duration_s, end=True)
+        return Segment(segment.text, start, max(end - start, 0.0))